@@ -0,0 +1,135 @@
+#-------------------------------------------------------------------------------------------------#
+# [ 스크립트 개요 ]
+# RAG 임베딩 백엔드(torch / onnx / onnx-int8)의 처리량, 지연 시간, 메모리, 벡터 일치도를 비교하는 벤치마크입니다.
+#   - torch    : HuggingFaceEmbeddings (sentence-transformers + PyTorch)
+#   - onnx     : OnnxSentenceEmbeddings (FP32 model.onnx)
+#   - onnx-int8: OnnxSentenceEmbeddings (동적 int8 양자화 model.int8.onnx)
+# 각 백엔드는 별도 프로세스(spawn)에서 실행하여 모델 로드 후 RSS가 서로 섞이지 않도록 합니다.
+# parity: 같은 문장 집합에 대해 torch 벡터와의 코사인 유사도(min / mean)를 계산합니다.
+#         (기존 Chroma DB를 재구축하지 않고 백엔드를 바꾸려면 min 코사인이 충분히 높아야 합니다.)
+
+# [ 사용법 ] (local_system 디렉토리에서 실행, ONNX 백엔드는 먼저 export 필요)
+#   python -m vector_db.export_onnx_embedder --quantize
+#   python -m benchmarks.embedder_benchmark [--backends torch onnx onnx-int8] [--queries 200] [--output result.json]
+#-------------------------------------------------------------------------------------------------#
+
+import argparse
+import json
+import multiprocessing
+import os
+import resource
+import statistics
+import time
+
+import numpy as np
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_CORPUS = os.path.join(os.path.dirname(BENCHMARK_DIR), "gen_rand_events", "filtered_data.json")
+
+
+def load_texts(path: str) -> list:
+    """filtered_data.json의 text를 문장 단위로 나눠 벤치마크용 문장 목록을 만듭니다."""
+    import re
+
+    with open(path, "r", encoding="utf-8") as f:
+        items = json.load(f)
+    sentences = []
+    for item in items:
+        sentences.extend(s.strip() for s in re.split(r"(?<=[.?!])\s+", item.get("text", "")) if s.strip())
+    return sentences
+
+
+def _peak_rss_kb() -> int:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def _run_backend(backend: str, texts: list, queries: int, batch_size: int, queue):
+    from vector_db.embedders import create_embeddings
+
+    baseline_rss = _peak_rss_kb()
+    started = time.perf_counter()
+    if backend == "onnx-int8":
+        embeddings = create_embeddings(backend="onnx", quantized=True)
+    else:
+        embeddings = create_embeddings(backend=backend, quantized=False)
+    load_s = time.perf_counter() - started
+    load_rss = _peak_rss_kb()
+
+    embeddings.embed_query(texts[0]) # warm-up
+
+    latencies = []
+    for i in range(queries):
+        started = time.perf_counter()
+        embeddings.embed_query(texts[i % len(texts)])
+        latencies.append((time.perf_counter() - started) * 1000)
+    latencies.sort()
+
+    started = time.perf_counter()
+    vectors = []
+    for i in range(0, len(texts), batch_size):
+        vectors.extend(embeddings.embed_documents(texts[i:i + batch_size]))
+    batch_s = time.perf_counter() - started
+
+    queue.put({
+        "backend": backend,
+        "load_s": load_s,
+        "queries": queries,
+        "query_p50_ms": latencies[len(latencies) // 2],
+        "query_p95_ms": latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))],
+        "queries_per_s": 1000.0 / statistics.mean(latencies),
+        "documents": len(texts),
+        "documents_per_s": len(texts) / batch_s,
+        "model_rss_mb": (load_rss - baseline_rss) / 1024,
+        "peak_rss_mb": _peak_rss_kb() / 1024,
+        "vectors": vectors,
+    })
+
+
+def cosine_parity(reference: list, candidate: list) -> dict:
+    a = np.asarray(reference, dtype=np.float32)
+    b = np.asarray(candidate, dtype=np.float32)
+    a /= np.linalg.norm(a, axis=1, keepdims=True)
+    b /= np.linalg.norm(b, axis=1, keepdims=True)
+    cos = (a * b).sum(axis=1)
+    return {"min_cosine": float(cos.min()), "mean_cosine": float(cos.mean())}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark embedding backends (torch vs ONNX vs ONNX int8).")
+    parser.add_argument("--backends", nargs="+", default=["torch", "onnx", "onnx-int8"])
+    parser.add_argument("--corpus", default=DEFAULT_CORPUS, help="filtered_data.json 형식의 입력 파일")
+    parser.add_argument("--queries", type=int, default=200, help="단건 embed_query 반복 횟수")
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--min-cosine", type=float, default=0.99, help="parity 통과 기준 (torch 대비 최소 코사인)")
+    parser.add_argument("--output", help="결과를 저장할 JSON 파일 경로")
+    args = parser.parse_args()
+
+    texts = load_texts(args.corpus)
+    ctx = multiprocessing.get_context("spawn")
+    results = []
+    for backend in args.backends:
+        queue = ctx.Queue()
+        process = ctx.Process(target=_run_backend, args=(backend, texts, args.queries, args.batch_size, queue))
+        process.start()
+        results.append(queue.get())
+        process.join()
+
+    reference = next((r["vectors"] for r in results if r["backend"] == "torch"), None)
+    for r in results:
+        vectors = r.pop("vectors")
+        if reference is not None and r["backend"] != "torch":
+            r.update(cosine_parity(reference, vectors))
+            r["parity_ok"] = r["min_cosine"] >= args.min_cosine
+        parity = f", cos min {r['min_cosine']:.4f} / mean {r['mean_cosine']:.4f}" if "min_cosine" in r else ""
+        print(
+            f"{r['backend']:>9}: load {r['load_s']:.1f} s, query p50 {r['query_p50_ms']:.1f} ms "
+            f"({r['queries_per_s']:.0f} q/s), batch {r['documents_per_s']:.0f} docs/s, "
+            f"model RSS +{r['model_rss_mb']:.0f} MB (peak {r['peak_rss_mb']:.0f} MB){parity}"
+        )
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+#-------------------------------------------------------------------------------------------------#
+# [ 스크립트 개요 ]
+# 업로드 이미지 전처리 함수의 지연 시간과 최대 메모리(peak RSS)를 비교하는 벤치마크입니다.
+#   - legacy: 기존 encode_image 방식 (전체 해상도 디코딩 → LANCZOS thumbnail → JPEG 재인코딩)
+#   - draft : 현재 compress_image (JPEG draft 모드 디코딩 + reduce 기반 thumbnail)
+# 각 방식은 별도 프로세스(spawn)에서 실행하여 peak RSS가 서로 섞이지 않도록 합니다.
+
+# [ 사용법 ] (local_system 디렉토리에서 실행)
+#   python -m benchmarks.image_preprocess_benchmark [--image photo.jpg] [--repeat 20] [--output result.json]
+#   --image를 생략하면 6000x4000 합성 사진(JPEG, 약 20MB급)을 생성하여 사용합니다.
+#-------------------------------------------------------------------------------------------------#
+
+import argparse
+import json
+import multiprocessing
+import os
+import resource
+import statistics
+import tempfile
+import time
+from io import BytesIO
+
+from PIL import Image
+
+
+def legacy_compress_image(file):
+    """기존 encode_image의 전처리 부분 (Base64 인코딩 제외)."""
+    img = Image.open(BytesIO(file))
+    img = img.convert("RGB")
+    img.thumbnail((800, 800), Image.LANCZOS)
+    buffer = BytesIO()
+    img.save(buffer, format="JPEG", quality=70)
+    return buffer.getvalue()
+
+
+def make_synthetic_photo(path: str, size=(6000, 4000)):
+    """노이즈와 그라디언트를 섞은 고해상도 JPEG를 생성합니다 (압축률이 낮은 실제 사진과 비슷한 크기)."""
+    noise = Image.effect_noise(size, 64).convert("RGB")
+    gradient = Image.linear_gradient("L").resize(size).convert("RGB")
+    Image.blend(noise, gradient, 0.5).save(path, format="JPEG", quality=95)
+
+
+def _peak_rss_kb() -> int:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def _run_variant(variant: str, image_path: str, repeat: int, queue):
+    if variant == "legacy":
+        func = legacy_compress_image
+    else:
+        from src.utils.util import compress_image
+        func = compress_image
+
+    with open(image_path, "rb") as f:
+        data = f.read()
+    baseline_rss = _peak_rss_kb()
+
+    latencies = []
+    output_size = 0
+    for _ in range(repeat):
+        started = time.perf_counter()
+        output_size = len(func(data))
+        latencies.append((time.perf_counter() - started) * 1000)
+
+    latencies.sort()
+    queue.put({
+        "variant": variant,
+        "repeat": repeat,
+        "input_bytes": len(data),
+        "output_bytes": output_size,
+        "mean_ms": statistics.mean(latencies),
+        "p50_ms": latencies[len(latencies) // 2],
+        "p95_ms": latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))],
+        "peak_rss_mb": _peak_rss_kb() / 1024,
+        "peak_rss_delta_mb": (_peak_rss_kb() - baseline_rss) / 1024,
+    })
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark upload image preprocessing (legacy vs draft-mode).")
+    parser.add_argument("--image", help="입력 이미지 경로 (생략 시 합성 이미지 생성)")
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--output", help="결과를 저장할 JSON 파일 경로")
+    args = parser.parse_args()
+
+    image_path = args.image
+    tmp_dir = None
+    if not image_path:
+        tmp_dir = tempfile.TemporaryDirectory()
+        image_path = os.path.join(tmp_dir.name, "synthetic.jpg")
+        make_synthetic_photo(image_path)
+
+    ctx = multiprocessing.get_context("spawn")
+    results = []
+    for variant in ("legacy", "draft"):
+        queue = ctx.Queue()
+        process = ctx.Process(target=_run_variant, args=(variant, image_path, args.repeat, queue))
+        process.start()
+        results.append(queue.get())
+        process.join()
+
+    for r in results:
+        print(
+            f"{r['variant']:>6}: mean {r['mean_ms']:.1f} ms, p50 {r['p50_ms']:.1f} ms, p95 {r['p95_ms']:.1f} ms, "
+            f"peak RSS {r['peak_rss_mb']:.1f} MB (+{r['peak_rss_delta_mb']:.1f} MB), "
+            f"{r['input_bytes'] / 1e6:.1f} MB -> {r['output_bytes'] / 1e3:.1f} KB"
+        )
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+    if tmp_dir:
+        tmp_dir.cleanup()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,4 @@
 from .db import async_engine, AsyncSessionLocal, Base, get_db
 from .chatbot import ChatBot
 from .core import FacmanApplication
-from .utils import encode_image, make_pdf, send_email
\ No newline at end of file
+from .utils import encode_image, make_pdf, send_email, image_store
\ No newline at end of file
@@ -6,22 +6,36 @@
 
 # [ 주요 기능 (API 엔드포인트) ]
 # 1. POST /create_event: 새로운 이벤트를 생성합니다. (event_service.create_event_service 호출)
+# 1-1. POST /create_events: 여러 이벤트를 JSON 배열 또는 NDJSON으로 받아 배치 INSERT로 생성합니다. (event_service.create_events_bulk_service 호출)
 # 2. GET /event/{event_id}: 특정 ID의 이벤트 상세 정보를 조회합니다. (event_service.get_event_service 호출)
 # 3. GET /events: 이벤트 목록을 페이지네이션하여 조회합니다. (event_service.get_events_service 호출)
 # 4. POST /solve_event: 이벤트 해결 정보(이미지, 설명)를 받아 처리하고 AI 분석 결과를 반환합니다. (event_service.solve_event_service 호출)
+# 4-1. POST /solve_event/stream: /solve_event와 동일하지만 AI 분석 결과를 SSE(Server-Sent Events)로 스트리밍합니다. (event_service.solve_event_stream_service 호출)
 # 5. POST /event_complete/{event_id}: 이벤트 해결 상태를 완료/미완료로 변경합니다. (event_service.mark_event_complete_service 호출)
 # 6. GET /download_report/{event_id}: 이벤트 보고서를 생성하여 지정된 이메일로 전송합니다. (event_service.generate_and_send_report_service 호출)
+# 7. POST /report_jobs/{event_id}: 보고서 생성/이메일 전송 작업을 백그라운드 큐에 등록하고 작업 ID를 즉시 반환합니다. (report_job_service.submit_report_job_service 호출)
+# 8. GET /report_jobs/{job_id}: 보고서 생성 작업의 진행 상태 및 실패 사유를 조회합니다. (report_job_service.get_report_job_service 호출)
+# 9. GET /rag_cache/stats: RAG 검색 결과 캐시의 hit/miss 통계를 조회합니다. (event_service.get_rag_cache_stats_service 호출)
+# 10. GET /event_write_buffer/stats: 이벤트 write-behind 버퍼의 대기 건수와 플러시 지연 히스토그램을 조회합니다. (event_service.get_event_write_buffer_stats_service 호출)
+# 11. GET /ready: ChatBot(임베딩 모델, 벡터 DB) warm-up 완료 여부와 구성요소별 로드 시간을 조회합니다. 준비 전에는 503을 반환합니다. (event_service.get_readiness_service 호출)
+# 12. POST /vector_store/reload: 새로 게시된 벡터 DB 스냅샷을 서버 재시작 없이 다시 엽니다. (event_service.reload_vector_store_service 호출)
+# 13. GET /rag_context/stats: RAG 컨텍스트 토큰 예산 적용 전/후 토큰 수와 평균 프롬프트 토큰 수를 조회합니다. (event_service.get_rag_context_stats_service 호출)
+# 14. GET /rag_prefetch/stats: 이벤트 생성 시 RAG 검색 사전 계산의 처리 건수와 해결 요청 시 hit rate를 조회합니다. (event_service.get_rag_prefetch_stats_service 호출)
+# 15. GET /answer_cache/stats: 유사 이벤트 답변 재사용 캐시의 hit rate, 크기, 교체 횟수를 조회합니다. (event_service.get_answer_cache_stats_service 호출)
+# 16. GET /event/{event_id}/similar: 이벤트 type/value 임베딩 기준으로 먼저 발생한 유사 이벤트와 해결 상태를 조회합니다. (event_service.get_similar_events_service 호출)
+# 17. GET /event_index/stats: 유사 이벤트 검색용 이벤트 임베딩 인덱스의 크기, 백필 진행 상태, 검색 지연을 조회합니다. (event_service.get_event_index_stats_service 호출)
 #-----------------------------------------------------------------------------------------#
 
 
-from fastapi import APIRouter, UploadFile, Depends, HTTPException, Form, File, Body
+from fastapi import APIRouter, UploadFile, Depends, HTTPException, Form, File, Body, Request, Query
+from fastapi.responses import StreamingResponse, JSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Optional, List
 
 from ..db import schemas as db_schemas
 from ..db import models as db_models
 from ..db.database import get_db
-from ..services import event_service
+from ..services import event_service, report_job_service
 
 router = APIRouter(
     prefix="/ai/local",
@@ -48,6 +62,39 @@ async def create_event_router(
     return event
 
 
+@router.post(
+    "/create_events",
+    response_model=db_schemas.BulkEventCreateResponse,
+    summary="Create multiple events in batches (JSON array or NDJSON)",
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {
+                    "schema": {"type": "array", "items": db_schemas.EventCreate.model_json_schema()}
+                },
+                "application/x-ndjson": {"schema": {"type": "string"}},
+            },
+        }
+    },
+)
+async def create_events_router(request: Request, db: AsyncSession = Depends(get_db)):
+    """
+    여러 이벤트를 한 번에 생성합니다.
+    본문은 EventCreate 객체의 JSON 배열, 또는 Content-Type: application/x-ndjson 인 경우 한 줄에 하나의 객체입니다.
+    유효하지 않은 항목은 errors에 위치(index)와 함께 보고되며 나머지 항목은 정상적으로 생성됩니다.
+    본문이 EVENT_BULK_MAX_BYTES를 넘거나 항목이 EVENT_BULK_MAX_ITEMS개를 넘으면 413을 반환합니다.
+    """
+    content_length = request.headers.get("content-length")
+    # 본문 전체를 먼저 읽지 않고 스트림으로 넘겨 EVENT_BULK_MAX_BYTES / EVENT_BULK_MAX_ITEMS 초과 시 읽기 중단
+    return await event_service.create_events_bulk_service(
+        db=db,
+        body=request.stream(),
+        content_type=request.headers.get("content-type", ""),
+        content_length=int(content_length) if content_length and content_length.isdigit() else None,
+    )
+
+
 @router.get(
     "/event/{event_id}",
     response_model=db_schemas.EventResponse,
@@ -59,24 +106,48 @@ async def get_event_router(event_id: int, db: AsyncSession = Depends(get_db)):
     return event
 
 
+@router.get(
+    "/event/{event_id}/similar",
+    response_model=db_schemas.SimilarEventsResponse,
+    summary="Get similar past events"
+)
+async def get_similar_events_router(
+    event_id: int,
+    k: int = Query(5, ge=1, le=50),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    지정된 이벤트보다 먼저 발생한 이벤트 중 유형/내용이 가장 유사한 이벤트를 해결 상태와 함께 유사도 순으로 조회합니다.
+    EVENT_INDEX_ENABLED가 아니면 503을 반환합니다.
+
+    - **k**: 반환할 최대 이벤트 수 (1~50)
+    """
+    return await event_service.get_similar_events_service(db=db, event_id=event_id, k=k)
+
+
 @router.get(
     "/events",
     response_model=db_schemas.EventsResponse,
     summary="Get a list of events"
 )
 async def get_events_router(
-    skip: Optional[int] = 0,
-    limit: Optional[int] = 30,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(30, ge=1, le=500),
+    include_status: bool = False,
+    cursor: Optional[str] = None,
     db: AsyncSession = Depends(get_db),
 ):
     """
     이벤트 목록을 조회합니다 (페이지네이션 지원).
 
-    - **skip**: 건너뛸 항목 수
-    - **limit**: 가져올 최대 항목 수
+    - **skip**: 건너뛸 항목 수 (cursor가 주어지면 무시)
+    - **limit**: 가져올 최대 항목 수 (1~500)
+    - **include_status**: true이면 각 이벤트의 해결 방안 존재 여부와 완료 상태를 함께 반환
+    - **cursor**: 이전 응답의 next_cursor 값. 깊은 페이지에서도 일정한 속도로 조회됩니다 (keyset 페이지네이션)
     """
-    events = await event_service.get_events_service(db=db, skip=skip, limit=limit)
-    return {"events": events}
+    return await event_service.get_events_service(
+        db=db, skip=skip, limit=limit, include_status=include_status, cursor=cursor
+    )
 
 
 @router.post(
@@ -88,16 +159,50 @@ async def solve_event_router(
     event_id: int = Form(...),
     image: UploadFile = File(...),
     explain: str = Form(...),
+    full_context: bool = Form(False),
+    refresh: bool = Form(False),
     db: AsyncSession = Depends(get_db)
 ):
     """
     이벤트 해결 정보(이미지, 설명)를 제출하고 AI 분석 결과를 받습니다.
     (multipart/form-data 형식으로 요청)
+    참고문서는 기본적으로 적재 시 만든 요약으로 전달되며, full_context=true이면 원문을 사용합니다.
+    답변 캐시가 켜져 있으면 같은 유형의 유사한 이전 이벤트 답변을 즉시 반환하며(cached=true), refresh=true이면 새로 생성합니다.
+    """
+    result = await event_service.solve_event_service(
+        db=db, event_id=event_id, image=image, explain=explain, full_context=full_context, refresh=refresh
+    )
+    return {"event_id": event_id, **result}
+
+
+@router.post(
+    "/solve_event/stream",
+    summary="Submit solution info and stream AI analysis (SSE)"
+)
+async def solve_event_stream_router(
+    event_id: int = Form(...),
+    image: UploadFile = File(...),
+    explain: str = Form(...),
+    full_context: bool = Form(False),
+    refresh: bool = Form(False),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    이벤트 해결 정보(이미지, 설명)를 제출하고 AI 분석 결과를 SSE(text/event-stream)로 스트리밍합니다.
+    (multipart/form-data 형식으로 요청)
+
+    - 기본 메시지: `data: {"delta": "..."}` (생성된 텍스트 조각)
+    - `event: done`: `data: {"event_id": ..., "answer": "...", "cached": false}` (전체 답변, 저장 완료 후 전송. 캐시된 답변이면 cached=true와 cached_from_event_id, similarity 포함)
+    - `event: error`: `data: {"detail": "..."}` (분석 실패, 답변은 저장되지 않음)
     """
-    answer = await event_service.solve_event_service(
-        db=db, event_id=event_id, image=image, explain=explain
+    stream = await event_service.solve_event_stream_service(
+        db=db, event_id=event_id, image=image, explain=explain, full_context=full_context, refresh=refresh
+    )
+    return StreamingResponse(
+        stream,
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
     )
-    return {"event_id": event_id, "answer": answer}
 
 
 @router.post(
@@ -141,3 +246,117 @@ async def get_event_report_router(
         db=db, event_id=event_id, email=email
     )
     return {"answer": report_content}
+
+
+@router.post(
+    "/report_jobs/{event_id}",
+    response_model=db_schemas.ReportJobResponse,
+    status_code=202,
+    summary="Queue report generation and e-mail delivery for an event"
+)
+async def submit_report_job_router(
+    event_id: int,
+    email: str,
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    특정 이벤트의 보고서 생성 → PDF 변환 → 이메일 전송 작업을 백그라운드 큐에 등록합니다.
+    작업 ID가 즉시 반환되며, 진행 상태는 GET /report_jobs/{job_id}로 확인합니다.
+
+    - **event_id**: 보고서를 생성할 이벤트 ID
+    - **email**: 보고서를 받을 이메일 주소
+    """
+    job = await report_job_service.submit_report_job_service(
+        db=db, event_id=event_id, email=email
+    )
+    return job
+
+
+@router.get(
+    "/report_jobs/{job_id}",
+    response_model=db_schemas.ReportJobResponse,
+    summary="Get the status of a report job"
+)
+async def get_report_job_router(job_id: str, db: AsyncSession = Depends(get_db)):
+    """보고서 생성 작업의 상태(queued, generating, rendering, sending, completed, failed)를 조회합니다."""
+    job = await report_job_service.get_report_job_service(db=db, job_id=job_id)
+    return job
+
+
+@router.get(
+    "/rag_cache/stats",
+    summary="Get RAG retrieval cache statistics"
+)
+async def get_rag_cache_stats_router():
+    """RAG 검색 결과 캐시의 hit/miss 횟수, hit rate, 현재 크기, 무효화 횟수를 조회합니다."""
+    return await event_service.get_rag_cache_stats_service()
+
+
+@router.get(
+    "/event_write_buffer/stats",
+    summary="Get event write-behind buffer statistics"
+)
+async def get_event_write_buffer_stats_router():
+    """이벤트 생성 그룹 커밋 버퍼의 활성화 여부, 대기 건수, 플러시 횟수 및 플러시 지연 히스토그램을 조회합니다."""
+    return await event_service.get_event_write_buffer_stats_service()
+
+
+@router.get(
+    "/ready",
+    summary="Readiness probe (ChatBot warm-up status)"
+)
+async def readiness_router():
+    """
+    임베딩 모델, 벡터 DB, LLM 클라이언트의 로드 상태와 소요 시간을 반환합니다.
+    warm-up이 끝나기 전(또는 실패 시)에는 503을 반환하므로 로드 밸런서의 readiness 체크에 사용할 수 있습니다.
+    """
+    status = event_service.get_readiness_service()
+    return JSONResponse(status_code=200 if status["ready"] else 503, content=status)
+
+
+@router.post(
+    "/vector_store/reload",
+    summary="Reopen the vector store from the published snapshot"
+)
+async def reload_vector_store_router(force: bool = False):
+    """
+    VECTOR_DB_SNAPSHOT_DIR/CURRENT가 가리키는 스냅샷으로 벡터 DB를 다시 엽니다.
+    새 DB를 연 뒤 교체하므로 진행 중인 요청은 영향을 받지 않으며, 실패하면 이전 DB를 유지하고 500을 반환합니다.
+    """
+    return await event_service.reload_vector_store_service(force=force)
+
+
+@router.get(
+    "/rag_context/stats",
+    summary="Get RAG context token budget statistics"
+)
+async def get_rag_context_stats_router():
+    """RAG 컨텍스트의 예산 적용 전/후 누적·평균 토큰 수, 중복/예산 초과로 제외된 구절 수, 평균 프롬프트 텍스트 토큰 수를 조회합니다."""
+    return await event_service.get_rag_context_stats_service()
+
+
+@router.get(
+    "/rag_prefetch/stats",
+    summary="Get RAG prefetch statistics"
+)
+async def get_rag_prefetch_stats_router():
+    """이벤트 생성 시 미리 실행한 RAG 검색의 완료/실패/대기/버림 건수, 평균 소요 시간, 해결 요청 시 hit rate를 조회합니다."""
+    return await event_service.get_rag_prefetch_stats_service()
+
+
+@router.get(
+    "/answer_cache/stats",
+    summary="Get semantic answer cache statistics"
+)
+async def get_answer_cache_stats_router():
+    """유사 이벤트 답변 캐시의 hit/miss 횟수, hit rate, refresh 요청 수, LRU 교체 횟수, 현재 크기와 유사도 기준을 조회합니다."""
+    return await event_service.get_answer_cache_stats_service()
+
+
+@router.get(
+    "/event_index/stats",
+    summary="Get event embedding index statistics"
+)
+async def get_event_index_stats_router():
+    """유사 이벤트 검색용 이벤트 임베딩 인덱스의 크기, 백필 완료 여부, 대기/버림/실패 건수, 검색 지연 히스토그램을 조회합니다."""
+    return await event_service.get_event_index_stats_service()
@@ -1,2 +1,7 @@
-from .chatbot import ChatBot
+from .chatbot import ChatBot, SOLVE_EVENT_ERROR_MESSAGE
 from .prompts import get_solve_event_prompt, get_report_prompt
+from .warmup import ChatBotWarmup, chatbot_warmup
+from .vector_store_watcher import VectorStoreWatcher, vector_store_watcher
+from .rag_prefetcher import RagPrefetcher, rag_prefetcher
+from .answer_cache import CachedAnswer, SemanticAnswerCache, answer_cache
+from .event_index import EventEmbeddingIndex
@@ -0,0 +1,138 @@
+#-------------------------------------------------------------------------------------#
+# [ 파일 개요 ]
+# 같은 유형의 설비 알람이 거의 같은 내용으로 반복될 때, 이전에 생성한 AI 해결 방안을 다시 사용하기 위한
+# 의미 기반 답변 캐시(SemanticAnswerCache)를 정의합니다. gpt-4o 호출 없이 즉시 답변을 제공합니다.
+
+# [ 주요 로직 흐름 ]
+# 1. 키: make_text(event.type, event.value, 설명)을 RAG와 같은 임베딩 모델로 임베딩한 정규화 벡터.
+# 2. 저장소: 고정 크기(maxsize) numpy 행렬 + 이벤트 ID별 슬롯. 가득 차면 가장 오래 사용되지 않은 항목을 교체(LRU).
+# 3. lookup(): 같은 event.type 항목 중 코사인 유사도가 가장 높은 항목이 threshold 이상이면 반환 (hit 시 LRU 갱신).
+# 4. put(): LLM이 새로 생성한 답변만 저장. supersede=True(사용자가 새로고침 요청)이면 기존 유사 항목을 먼저 제거하여
+#    새 답변이 이전 답변을 대체하도록 함.
+# 5. 서버 시작 시 최근 해결된 이벤트(SolutionModel)로 채우고(event_service.load_answer_cache_service), stats()로 hit rate 등을 제공.
+#-------------------------------------------------------------------------------------#
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from ..core.config import ANSWER_CACHE_MAXSIZE, ANSWER_CACHE_THRESHOLD
+
+
+@dataclass
+class CachedAnswer:
+    event_id: int
+    answer: str
+    similarity: float
+
+
+class SemanticAnswerCache:
+    def __init__(self, maxsize: int = ANSWER_CACHE_MAXSIZE, threshold: float = ANSWER_CACHE_THRESHOLD):
+        self.maxsize = max(1, maxsize)
+        self.threshold = threshold
+        self._lock = threading.Lock()
+        self._vectors: Optional[np.ndarray] = None # (maxsize, dim), 첫 저장 시 할당
+        self._types = np.empty(self.maxsize, dtype=object)
+        self._used = np.zeros(self.maxsize, dtype=bool)
+        self._answers: List[Optional[str]] = [None] * self.maxsize
+        self._event_ids: List[Optional[int]] = [None] * self.maxsize
+        self._slots: "OrderedDict[int, int]" = OrderedDict() # event_id → slot (LRU 순서)
+        self.hits = 0
+        self.misses = 0
+        self.refreshes = 0
+        self.evictions = 0
+
+    @staticmethod
+    def make_text(event_type: str, value: str, explain: str) -> str:
+        return f"[{event_type}] {value}\n{explain}"
+
+    @staticmethod
+    def _normalize(vector: Sequence[float]) -> np.ndarray:
+        vector = np.asarray(vector, dtype=np.float32)
+        norm = float(np.linalg.norm(vector))
+        return vector / norm if norm > 0 else vector
+
+    def lookup(self, event_type: str, vector: Sequence[float], exclude_event_id: Optional[int] = None) -> Optional[CachedAnswer]:
+        query = self._normalize(vector)
+        with self._lock:
+            best = None
+            if self._vectors is not None and self._slots:
+                candidates = np.flatnonzero(self._used & (self._types == event_type))
+                if exclude_event_id in self._slots:
+                    candidates = candidates[candidates != self._slots[exclude_event_id]]
+                if len(candidates):
+                    scores = self._vectors[candidates] @ query
+                    top = int(np.argmax(scores))
+                    if scores[top] >= self.threshold:
+                        best = int(candidates[top]), float(scores[top])
+            if best is None:
+                self.misses += 1
+                return None
+            slot, similarity = best
+            event_id = self._event_ids[slot]
+            self._slots.move_to_end(event_id)
+            self.hits += 1
+            return CachedAnswer(event_id=event_id, answer=self._answers[slot], similarity=similarity)
+
+    def put(self, event_id: int, event_type: str, vector: Sequence[float], answer: str, supersede: bool = False):
+        """답변을 저장합니다. supersede이면 threshold 이상으로 유사한 같은 유형의 기존 항목을 제거합니다."""
+        vector = self._normalize(vector)
+        with self._lock:
+            if self._vectors is None:
+                self._vectors = np.zeros((self.maxsize, len(vector)), dtype=np.float32)
+            if supersede:
+                self.refreshes += 1
+                similar = np.flatnonzero(self._used & (self._types == event_type))
+                for slot in similar[self._vectors[similar] @ vector >= self.threshold]:
+                    self._release(int(slot))
+
+            slot = self._slots.pop(event_id, None)
+            if slot is None:
+                free = np.flatnonzero(~self._used)
+                if len(free):
+                    slot = int(free[0])
+                else:
+                    _, slot = self._slots.popitem(last=False)
+                    self.evictions += 1
+            self._slots[event_id] = slot
+            self._vectors[slot] = vector
+            self._types[slot] = event_type
+            self._answers[slot] = answer
+            self._event_ids[slot] = event_id
+            self._used[slot] = True
+
+    def _release(self, slot: int):
+        self._slots.pop(self._event_ids[slot], None)
+        self._used[slot] = False
+        self._answers[slot] = None
+        self._event_ids[slot] = None
+        self._types[slot] = None
+
+    def remove(self, event_id: int):
+        with self._lock:
+            slot = self._slots.get(event_id)
+            if slot is not None:
+                self._release(slot)
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": (self.hits / total) if total else 0.0,
+                "refreshes": self.refreshes,
+                "evictions": self.evictions,
+                "size": len(self._slots),
+                "maxsize": self.maxsize,
+                "threshold": self.threshold,
+            }
+
+
+answer_cache = SemanticAnswerCache()
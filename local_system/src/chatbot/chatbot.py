@@ -14,119 +14,343 @@
 #      - 벡터 저장소 로드 성공/실패 로깅.
 #      - 초기화 완료 상태 저장.
 #    - 이후 인스턴스 요청 시 기존 인스턴스 반환.
+#    - 각 구성요소(llm, embeddings, vector_store, warmup_query)의 로드 상태와 소요 시간은 component_status에 기록.
+#    - warm_up(): 더미 쿼리로 임베딩 모델 가중치와 벡터 DB 인덱스를 메모리에 올림 (서버 시작 시 warmup.py에서 호출).
 # 2. 벡터 저장소 로드 (_load_vector_store):
-#    - 지정된 경로에서 HuggingFace 임베딩을 사용하여 Chroma 벡터 DB 로드.
-#    - 성공 시 Chroma 객체 반환, 실패 시 로깅 후 None 반환.
-# 3. RAG 검색 (_perform_rag_search):
-#    - (기존과 동일)
-# 4. 이벤트 해결 방안 생성 (solve_event):
-#    - (기존과 동일)
-# 5. 보고서 내용 생성 (make_report_content):
-#    - (기존과 동일)
+#    - 지정된 경로에서 HuggingFace 임베딩을 사용하여 벡터 DB 로드 (VECTOR_STORE_BACKEND: Chroma 또는 memory-mapped FlatIndex).
+#    - 성공 시 검색 객체 반환, 실패 시 로깅 후 None 반환.
+#    - 경로는 VECTOR_DB_SNAPSHOT_DIR/CURRENT가 가리키는 스냅샷 (없으면 VECTOR_DB).
+#    - reload_vector_store(): 새 스냅샷을 연 뒤 참조를 교체 (임베딩 모델 재사용, 검색 캐시 무효화).
+#      관리자 엔드포인트 또는 vector_store_watcher.py가 호출.
+# 3. RAG 검색 (_perform_rag_search / _aperform_rag_search):
+#    - (기존과 동일) 비동기 버전은 이벤트 루프를 막지 않도록 asimilarity_search를 사용.
+#    - 벡터 검색 결과와 BM25(문자 bigram + 설비 코드 토큰) 결과를 reciprocal rank fusion으로 결합 (HYBRID_SEARCH_ENABLED).
+#    - 검색 결과는 RetrievalCache(LRU + TTL)에 캐싱되어 동일 쿼리의 임베딩/검색을 생략.
+#    - EMBEDDING_SERVER_SOCKET이 설정되면 모델을 직접 로드하지 않고 공유 사이드카(embedding_server.py)에 검색을 위임.
+#    - aprefetch_documents(): 이벤트 생성 직후 rag_prefetcher.py가 미리 검색해 둘 때 사용. 해결 요청 시 결과를
+#      rag_documents로 넘기면 임베딩/검색을 생략하고 바로 컨텍스트를 구성.
+#    - 벡터 DB는 원본 문서를 청크로 나눠 저장하므로, 같은 원본의 인접 청크는 컨텍스트 생성 시 하나의 구절로 병합.
+#    - 컨텍스트는 RagContextBuilder(context_builder.py)가 토큰 예산(RAG_CONTEXT_TOKEN_BUDGET) 안에서 순위순으로 구성 (중복 구절 제거, 초과분 절단/제외).
+#    - 적재 시 저장된 문서 요약이 있으면 기본으로 요약을 넣고(RAG_CONTEXT_USE_SUMMARY), full_context=True인 요청은 원문을 넣음.
+# 4. 이벤트 해결 방안 생성 (solve_event / asolve_event):
+#    - (기존과 동일) 비동기 버전은 chain.ainvoke를 사용하며, LLM 동시 호출 수는 세마포어로 제한.
+#    - astream_solve_event는 LLM 토큰을 생성되는 즉시 순차적으로 반환 (SSE 스트리밍용).
+#    - LLM 호출 전 프롬프트의 텍스트 토큰 수를 요청별로 로깅 (이미지 제외, 누적 통계는 context_builder.stats()).
+# 5. 보고서 내용 생성 (make_report_content / amake_report_content):
+#    - (기존과 동일) 비동기 버전은 asolve_event와 동일한 방식으로 동작.
+#    - 단, 비동기 버전은 LLM 호출 실패 시 오류 문구를 반환하지 않고 예외를 그대로 전달
+#      (호출자가 실패로 처리하여 오류 문구가 PDF/이메일로 전송되거나 보고서 작업에 저장되지 않도록).
 #-------------------------------------------------------------------------------------#
 
+import asyncio
 import logging
-from typing import List, TYPE_CHECKING
+import threading
+import time
+from typing import Any, AsyncIterator, Dict, List, Optional, TYPE_CHECKING
 
 from langchain_openai import ChatOpenAI # LLM은 OpenAI 모델 그대로 사용
-from langchain_huggingface import HuggingFaceEmbeddings # 새 방식
-from langchain_chroma import Chroma # 새 방식
 from langchain_core.output_parsers import StrOutputParser
 from langchain_core.documents import Document # langchain.schema 대신 langchain_core.documents 사용 권장
 
-from ..core.config import VECTOR_DB
+from ..core.config import VECTOR_DB, LLM_MAX_CONCURRENCY, RAG_CACHE_MAXSIZE, RAG_CACHE_TTL_SECONDS
+from ..core.config import EMBEDDING_MODEL_NAME, EMBEDDING_SERVER_SOCKET
+from ..core.config import EMBEDDING_BACKEND, EMBEDDING_ONNX_DIR, EMBEDDING_ONNX_QUANTIZED
+from ..core.config import VECTOR_DB_SNAPSHOT_DIR, VECTOR_STORE_BACKEND
+from ..core.config import HYBRID_SEARCH_ENABLED, HYBRID_RRF_K, HYBRID_CANDIDATE_MULTIPLIER
+from ..core.config import RAG_CONTEXT_TOKEN_BUDGET, RAG_CONTEXT_DEDUP_THRESHOLD, RAG_CONTEXT_MIN_PASSAGE_TOKENS, RAG_CONTEXT_USE_SUMMARY
 from .prompts import get_solve_event_prompt, get_report_prompt
+from .retrieval_cache import RetrievalCache
+from .context_builder import RagContextBuilder, count_prompt_tokens
+from .embedding_client import EmbeddingServiceClient
+from vector_db.embedders import create_embeddings
+from vector_db.snapshots import SnapshotStore
+from vector_db.vector_stores import close_vector_store, count_documents, open_vector_store
+from vector_db.bm25_index import BM25Index, reciprocal_rank_fusion
 
 if TYPE_CHECKING:
     from ..db.models import EventModel
 
 # 로거 설정
 logger = logging.getLogger(__name__)
+
+# LLM 호출 실패 시 반환하는 답변 (호출자는 이 값을 캐시하거나 재사용하지 않아야 함)
+SOLVE_EVENT_ERROR_MESSAGE = "AI 분석 중 오류가 발생했습니다. 잠시 후 다시 시도해주세요."
 # logging.basicConfig(level=logging.INFO) # 애플리케이션 최상단에서 한 번만 설정하는 것을 권장 (예: main.py)
 
 class ChatBot:
     _instance = None
+    # asyncio.to_thread 등 여러 스레드에서 동시에 생성될 수 있으므로 초기화는 락으로 보호
+    _lock = threading.Lock()
 
     def __new__(cls):
-        if cls._instance is None:
-            logger.info("Creating new ChatBot instance")
-            cls._instance = super(ChatBot, cls).__new__(cls)
-            cls._instance._initialized = False
+        with cls._lock:
+            if cls._instance is None:
+                logger.info("Creating new ChatBot instance")
+                cls._instance = super(ChatBot, cls).__new__(cls)
+                cls._instance._initialized = False
         return cls._instance
 
     def __init__(self):
         if self._initialized:
             return
+        with self._lock:
+            if not self._initialized:
+                self._initialize()
+
+    def _initialize(self):
         logger.info("Initializing ChatBot components...")
+        # 구성요소별 로드 상태 및 소요 시간 (readiness 확인용)
+        self.component_status: Dict[str, Dict[str, Any]] = {}
 
         # LLM은 그대로 gpt-4o 사용
+        started = time.perf_counter()
         self.llm = ChatOpenAI(model="gpt-4o", temperature=0.2, max_tokens=2048)
+        self._record_component("llm", "ready", started)
+        # 비동기 경로에서 동시에 진행되는 LLM 호출 수 제한 (업스트림 보호)
+        self._llm_semaphore = asyncio.Semaphore(LLM_MAX_CONCURRENCY)
         
         # Vector Store 로드 (HuggingFaceEmbeddings 사용하도록 수정)
-        self.embedding_model_name = "snunlp/KR-SBERT-V40K-klueNLI-augSTS"
-        self.vector_store = self._load_vector_store(VECTOR_DB, self.embedding_model_name)
+        self.embedding_model_name = EMBEDDING_MODEL_NAME
+        self.embedding_function = None
+        self.vector_store = None
+        # 게시된 스냅샷(CURRENT)이 있으면 사용, 없으면 기존 고정 디렉토리(VECTOR_DB)
+        self.snapshot_store = SnapshotStore(VECTOR_DB_SNAPSHOT_DIR)
+        self.vector_store_path = self.snapshot_store.resolve(VECTOR_DB)
+        self._reload_lock = threading.Lock()
+        if EMBEDDING_SERVER_SOCKET:
+            # 공유 사이드카 사용: 워커마다 SBERT 모델/Chroma를 올리지 않음
+            started = time.perf_counter()
+            self.retriever = EmbeddingServiceClient(EMBEDDING_SERVER_SOCKET)
+            self._record_component("embedding_server", "ready", started)
+            logger.info(f"Using shared embedding server at {EMBEDDING_SERVER_SOCKET} for RAG search")
+        else:
+            self.vector_store = self._load_vector_store(self.vector_store_path, self.embedding_model_name)
+            # similarity_search / asimilarity_search 를 제공하는 검색 대상 (Chroma 또는 사이드카 클라이언트)
+            self.retriever = self.vector_store
+        # 설비 코드/화학물질명 같은 정확한 표현 검색용 BM25 인덱스 (하이브리드 검색)
+        self.bm25_index = self._load_bm25_index(self.vector_store_path)
+        # 동일 쿼리의 임베딩 + 유사도 검색 결과 캐시 (벡터 DB 재구축 시 자동 무효화)
+        self.retrieval_cache = RetrievalCache(
+            maxsize=RAG_CACHE_MAXSIZE, ttl=RAG_CACHE_TTL_SECONDS, persist_directory=self.vector_store_path,
+            backend=VECTOR_STORE_BACKEND,
+        )
+        # 검색 결과를 토큰 예산 안의 컨텍스트 문자열로 변환
+        self.context_builder = RagContextBuilder(
+            token_budget=RAG_CONTEXT_TOKEN_BUDGET,
+            dedup_threshold=RAG_CONTEXT_DEDUP_THRESHOLD,
+            min_passage_tokens=RAG_CONTEXT_MIN_PASSAGE_TOKENS,
+        )
         
         if self.vector_store:
-             logger.info(f"Vector store loaded successfully from {VECTOR_DB} using {self.embedding_model_name}")
-        else:
-             logger.error(f"Failed to load vector store from {VECTOR_DB}. RAG search will not be available.")
+             logger.info(f"Vector store loaded successfully from {self.vector_store_path} using {self.embedding_model_name}")
+        elif not self.retriever:
+             logger.error(f"Failed to load vector store from {self.vector_store_path}. RAG search will not be available.")
 
         self._initialized = True
 
-    def _load_vector_store(self, persist_directory: str, model_name: str) -> Chroma | None:
+    def _record_component(self, name: str, state: str, started: float, error: Optional[str] = None):
+        self.component_status[name] = {
+            "state": state,
+            "load_seconds": round(time.perf_counter() - started, 3),
+            "error": error,
+        }
+
+    def warm_up(self) -> None:
+        """
+        더미 쿼리 한 번으로 임베딩 모델 가중치와 Chroma 인덱스를 메모리에 올립니다.
+        검색 결과 캐시를 거치지 않으며, 실패해도 예외를 전파하지 않고 상태만 기록합니다.
+        """
+        started = time.perf_counter()
+        if not self.retriever:
+            self._record_component("warmup_query", "skipped", started, error="vector store not available")
+            return
+        try:
+            self.retriever.similarity_search("설비 이상 발생 시 안전 조치", k=1)
+            self._record_component("warmup_query", "ready", started)
+            logger.info(f"ChatBot warm-up query completed in {self.component_status['warmup_query']['load_seconds']}s")
+        except Exception as e:
+            logger.exception(f"ChatBot warm-up query failed: {e}")
+            self._record_component("warmup_query", "failed", started, error=str(e))
+
+    def embed_texts(self, texts: List[str]) -> List[List[float]]:
+        """RAG와 같은 임베딩 모델로 텍스트를 임베딩합니다. (사이드카 모드에서는 사이드카에 위임)"""
+        embedder = self.embedding_function
+        if embedder is None and isinstance(self.retriever, EmbeddingServiceClient):
+            embedder = self.retriever
+        if embedder is None:
+            raise RuntimeError("Embedding model is not available")
+        return embedder.embed_documents(texts)
+
+    def _load_vector_store(self, persist_directory: str, model_name: str) -> Any:
         """
-        지정된 디렉토리에서 Chroma Vector Store를 로드합니다. (HuggingFaceEmbeddings 사용)
+        지정된 디렉토리에서 Vector Store를 로드합니다. (EMBEDDING_BACKEND에 따라 torch 또는 ONNX 임베딩,
+        VECTOR_STORE_BACKEND에 따라 Chroma 또는 FlatIndex 사용)
         Args:
             persist_directory: Vector Store가 저장된 디렉토리 경로.
             model_name: 사용할 HuggingFace 모델 이름.
         Returns:
-            Chroma 인스턴스 또는 로드 실패 시 None.
+            Chroma / FlatIndex 인스턴스 또는 로드 실패 시 None.
         """
+        component = "embeddings"
+        started = time.perf_counter()
         try:
-            logger.info(f"Loading HuggingFace embeddings model: {model_name}")
-            # HuggingFaceEmbeddings 초기화
-            embedding_function = HuggingFaceEmbeddings(
-                model_name=model_name,
-                model_kwargs={'device': 'cpu'}, # CPU 사용 명시, GPU 사용 시 'cuda'
-                encode_kwargs={'normalize_embeddings': True} # 임베딩 정규화
-            )
-            logger.info(f"HuggingFace embeddings model '{model_name}' loaded successfully.")
-            
-            logger.info(f"Attempting to load Chroma DB from: {persist_directory}")
-            db = Chroma(
-                persist_directory=persist_directory, 
-                embedding_function=embedding_function
-            )
-            logger.info(f"Chroma DB loaded successfully from {persist_directory}.")
+            # 스냅샷 교체(reload_vector_store) 시에는 이미 로드한 임베딩 모델을 재사용
+            if self.embedding_function is None:
+                logger.info(f"Loading embeddings model: {model_name} (backend: {EMBEDDING_BACKEND})")
+                self.embedding_function = create_embeddings(
+                    model_name=model_name,
+                    backend=EMBEDDING_BACKEND,
+                    onnx_dir=EMBEDDING_ONNX_DIR or None,
+                    quantized=EMBEDDING_ONNX_QUANTIZED,
+                )
+                logger.info(f"Embeddings model '{model_name}' loaded successfully.")
+                self._record_component(component, "ready", started)
+
+            component = "vector_store"
+            started = time.perf_counter()
+            logger.info(f"Attempting to load vector store ({VECTOR_STORE_BACKEND}) from: {persist_directory}")
+            db = open_vector_store(persist_directory, self.embedding_function, backend=VECTOR_STORE_BACKEND)
+            logger.info(f"Vector store ({VECTOR_STORE_BACKEND}) loaded successfully from {persist_directory}.")
+            self._record_component(component, "ready", started)
             return db
         except Exception as e:
+            self._record_component(component, "failed", started, error=str(e))
             # persist_directory가 존재하지 않거나, 내부 파일 손상, 권한 문제 등 다양한 원인 가능
             logger.exception(f"Error loading vector store from {persist_directory} with model {model_name}: {e}")
             logger.error(f"Ensure the directory '{persist_directory}' exists and contains valid ChromaDB files for the specified embedding model.")
             logger.error("If this is the first run or after changing the embedding model, you might need to (re)build the vector DB using 'factory_problem_data_collection.py'.")
             return None
 
-    def _perform_rag_search(self, query: str, k: int = 5) -> str:
+    def _load_bm25_index(self, persist_directory: str) -> Optional[BM25Index]:
+        """벡터 DB 디렉토리의 BM25 인덱스를 메모리에 로드합니다. (파일이 없거나 비활성화 시 None → 벡터 검색만 사용)"""
+        if not HYBRID_SEARCH_ENABLED:
+            return None
+        started = time.perf_counter()
+        try:
+            index = BM25Index.load_from_directory(persist_directory)
+        except Exception as e:
+            logger.exception(f"Error loading BM25 index from {persist_directory}: {e}")
+            self._record_component("bm25_index", "failed", started, error=str(e))
+            return None
+        if index is None:
+            logger.info(f"No BM25 index in {persist_directory}. Hybrid search disabled (vector search only).")
+            return None
+        self._record_component("bm25_index", "ready", started)
+        logger.info(f"BM25 index loaded ({len(index)} documents)")
+        return index
+
+    def reload_vector_store(self, force: bool = False) -> Dict[str, Any]:
+        """
+        현재 게시된 스냅샷(CURRENT)으로 벡터 DB를 다시 엽니다. 새 DB를 완전히 연 뒤 참조를 교체하므로
+        진행 중인 요청은 이전 DB로 끝나고, 이후 요청부터 새 DB를 사용합니다. 실패하면 이전 DB를 그대로 유지합니다.
+        Args:
+            force: 스냅샷 경로가 같아도 다시 열지 여부.
+        Returns:
+            {"reloaded", "path", "previous_path", "documents", "load_seconds"}
+        """
+        with self._reload_lock:
+            if isinstance(self.retriever, EmbeddingServiceClient):
+                # 공유 사이드카가 벡터 DB를 소유하므로 교체를 위임하고, 워커 쪽 경로/BM25 인덱스/검색 캐시를 새 스냅샷에 맞춤
+                # (다른 워커가 먼저 교체를 요청했으면 reloaded=False이지만 경로는 바뀌었을 수 있음)
+                result = self.retriever.request({"op": "reload", "force": force})
+                path = result.get("path")
+                if path and (result.get("reloaded") or path != self.vector_store_path):
+                    # BM25 인덱스는 워커가 직접 로드하므로, 이전 스냅샷의 청크가 RRF에 섞이지 않도록 함께 교체
+                    self.bm25_index = self._load_bm25_index(path)
+                    self.vector_store_path = path
+                    self.retrieval_cache.rebind(path)
+                    logger.info(f"Vector store switched to {path} (sidecar)")
+                return result
+
+            path = self.snapshot_store.resolve(VECTOR_DB)
+            previous_path = self.vector_store_path
+            if path == previous_path and self.vector_store is not None and not force:
+                return {"reloaded": False, "path": path, "previous_path": previous_path}
+
+            started = time.perf_counter()
+            db = self._load_vector_store(path, self.embedding_model_name)
+            if db is None:
+                raise RuntimeError(f"Failed to open vector store snapshot at {path}")
+            documents = count_documents(db)
+
+            bm25_index = self._load_bm25_index(path)
+
+            previous_store = self.vector_store
+            self.vector_store = db
+            self.retriever = db
+            self.bm25_index = bm25_index
+            self.vector_store_path = path
+            self.retrieval_cache.rebind(path)
+            # 이전 FlatIndex의 mmap/파일 핸들 해제 (진행 중인 검색을 위해 잠시 뒤에 닫음)
+            if previous_store is not None:
+                close_vector_store(previous_store)
+            load_seconds = round(time.perf_counter() - started, 3)
+            logger.info(f"Vector store switched to {path} ({documents} documents, {load_seconds}s)")
+            return {
+                "reloaded": True,
+                "path": path,
+                "previous_path": previous_path,
+                "documents": documents,
+                "load_seconds": load_seconds,
+            }
+
+    @staticmethod
+    def _build_query(event: 'EventModel') -> str:
+        """이벤트 정보로부터 RAG 검색 쿼리 문자열을 생성합니다."""
+        return f"[{event.type}] {event.time}: {event.value}"
+
+    def _format_rag_context(self, docs: List[Document], full_context: bool = False) -> str:
+        """
+        검색된 문서 리스트를 토큰 예산 안의 컨텍스트 문자열로 변환합니다. (인접 청크 병합, 중복 제거, 초과분 절단/제외)
+        full_context가 False이고 RAG_CONTEXT_USE_SUMMARY이면 적재 시 저장된 요약을 원문 대신 사용합니다.
+        """
+        rag_context, stats = self.context_builder.build(docs, use_summary=RAG_CONTEXT_USE_SUMMARY and not full_context)
+        logger.info(
+            f"RAG context: {stats['passages']} passages ({stats['summarized']} summarized), {stats['context_tokens']}/{stats['candidate_tokens']} tokens "
+            f"(duplicates dropped: {stats['duplicates_dropped']}, over budget dropped: {stats['budget_dropped']}, trimmed: {stats['trimmed']})"
+        )
+        return rag_context
+
+    def _log_prompt_tokens(self, prompt: Any, event_id: Any, task: str):
+        """LLM에 보낼 프롬프트의 텍스트 토큰 수(이미지 제외)를 로깅하고 누적 통계에 반영합니다."""
+        prompt_tokens = count_prompt_tokens(prompt)
+        if prompt_tokens is None:
+            return
+        self.context_builder.record_prompt(prompt_tokens)
+        logger.info(f"Prompt tokens for {task} (event ID {event_id}): {prompt_tokens} text tokens + image")
+
+    def _fuse_with_lexical(self, query: str, vector_docs: List[Document], k: int) -> List[Document]:
+        """벡터 검색 결과와 BM25 결과를 RRF로 결합합니다. BM25 인덱스가 없으면 벡터 결과 상위 k개를 그대로 반환."""
+        bm25_index = self.bm25_index
+        if bm25_index is None:
+            return vector_docs[:k]
+        lexical_docs = bm25_index.search(query, k * HYBRID_CANDIDATE_MULTIPLIER)
+        return reciprocal_rank_fusion([vector_docs, lexical_docs], k, rrf_k=HYBRID_RRF_K)
+
+    def _candidate_count(self, k: int) -> int:
+        return k * HYBRID_CANDIDATE_MULTIPLIER if self.bm25_index is not None else k
+
+    def _perform_rag_search(self, query: str, k: int = 5, full_context: bool = False) -> str:
         rag_context = ""
-        if not self.vector_store:
+        if not self.retriever:
             logger.warning("Vector store not available for RAG search. Returning empty context.")
             return rag_context
 
         try:
             logger.info(f"Performing RAG search for query (first 50 chars): '{query[:50]}...' with k={k}")
-            # MMR(Maximal Marginal Relevance) 검색 수행
-            # Chroma 클래스의 search 메서드가 아니라 retriever의 get_relevant_documents를 사용하는 것이 일반적
-            # 또는 유사도 검색인 similarity_search 사용
-            # docs: List[Document] = self.vector_store.search(query, search_type="mmr", k=k) # search 메서드는 Chroma의 기본 메서드가 아닐 수 있음
-            
             # Langchain Chroma 객체의 표준 검색 메서드 사용
-            docs: List[Document] = self.vector_store.similarity_search(query, k=k)
-            # 또는 MMR 검색을 사용하고 싶다면 retriever를 생성해야 함:
+            # MMR 검색을 사용하고 싶다면 retriever를 생성해야 함:
             # retriever = self.vector_store.as_retriever(search_type="mmr", search_kwargs={"k": k})
             # docs = retriever.get_relevant_documents(query)
+            generation = self.retrieval_cache.generation
+            docs = self.retrieval_cache.get(query, k)
+            if docs is None:
+                docs = self.retriever.similarity_search(query, k=self._candidate_count(k))
+                docs = self._fuse_with_lexical(query, docs, k)
+                self.retrieval_cache.set(query, k, docs, generation)
 
             if docs:
-                rag_context = "\n\n---\n\n".join([f"참고문서 출처: {doc.metadata.get('file_name', 'N/A')}\n{doc.page_content}" for doc in docs])
+                rag_context = self._format_rag_context(docs, full_context)
                 logger.info(f"RAG search completed. Found {len(docs)} documents.")
             else:
                 logger.info(f"No relevant documents found for query '{query[:50]}...'.")
@@ -135,11 +359,60 @@ class ChatBot:
 
         return rag_context
 
-    def solve_event(self, event: 'EventModel', image_base64: str, event_explain: str) -> str:
-        query = f"[{event.type}] {event.time}: {event.value}"
-        rag_context = self._perform_rag_search(query)
+    async def _aretrieve_documents(self, query: str, k: int) -> List[Document]:
+        """캐시를 거쳐 벡터 검색 + BM25 결합 결과를 반환합니다. 오류는 호출자에게 전파됩니다."""
+        # 검색 중에 벡터 DB가 교체되면 이전 결과를 캐시에 넣지 않도록 검색 전 generation 기록
+        generation = self.retrieval_cache.generation
+        docs = self.retrieval_cache.get(query, k)
+        if docs is None:
+            docs = await self.retriever.asimilarity_search(query, k=self._candidate_count(k))
+            # BM25 검색은 메모리 내 posting list 순회(1ms 미만)이므로 이벤트 루프에서 바로 실행
+            docs = self._fuse_with_lexical(query, docs, k)
+            self.retrieval_cache.set(query, k, docs, generation)
+        return docs
+
+    async def aprefetch_documents(self, event: 'EventModel', k: int = 5) -> Optional[List[Document]]:
+        """이벤트의 RAG 검색 결과를 미리 계산합니다. 벡터 DB를 쓸 수 없으면 None."""
+        if not self.retriever:
+            return None
+        return await self._aretrieve_documents(self._build_query(event), k)
+
+    async def _aperform_rag_search(
+        self, query: str, k: int = 5, full_context: bool = False, documents: Optional[List[Document]] = None
+    ) -> str:
+        """
+        _perform_rag_search의 비동기 버전.
+        임베딩 계산과 Chroma 검색(CPU 작업)은 asimilarity_search를 통해 executor에서 실행되어 이벤트 루프를 막지 않습니다.
+        documents(미리 계산된 검색 결과)가 주어지면 검색을 생략합니다.
+        """
+        rag_context = ""
+        if documents is not None:
+            logger.info(f"Using {len(documents)} precomputed RAG documents for query (first 50 chars): '{query[:50]}...'")
+            return self._format_rag_context(documents, full_context) if documents else rag_context
+        if not self.retriever:
+            logger.warning("Vector store not available for RAG search. Returning empty context.")
+            return rag_context
+
+        try:
+            logger.info(f"Performing async RAG search for query (first 50 chars): '{query[:50]}...' with k={k}")
+            docs = await self._aretrieve_documents(query, k)
+
+            if docs:
+                rag_context = self._format_rag_context(docs, full_context)
+                logger.info(f"Async RAG search completed. Found {len(docs)} documents.")
+            else:
+                logger.info(f"No relevant documents found for query '{query[:50]}...'.")
+        except Exception as e:
+            logger.exception(f"Error during async RAG search for query '{query[:50]}...': {e}")
+
+        return rag_context
+
+    def solve_event(self, event: 'EventModel', image_base64: str, event_explain: str, full_context: bool = False) -> str:
+        query = self._build_query(event)
+        rag_context = self._perform_rag_search(query, full_context=full_context)
 
         prompt = get_solve_event_prompt(image_base64, event_explain, rag_context)
+        self._log_prompt_tokens(prompt, event.id, "solve_event")
         chain = prompt | self.llm | StrOutputParser()
 
         try:
@@ -159,15 +432,16 @@ class ChatBot:
             return answer
         except Exception as e:
             logger.exception(f"Error invoking LLM chain for solving event ID {event.id}: {e}")
-            return "AI 분석 중 오류가 발생했습니다. 잠시 후 다시 시도해주세요."
+            return SOLVE_EVENT_ERROR_MESSAGE
 
     def make_report_content(self, event: 'EventModel', image_base64: str, event_explain: str, previous_answer: str) -> str:
         logger.info(f"Generating report content for event ID: {event.id}")
 
-        query = f"[{event.type}] {event.time}: {event.value}"
+        query = self._build_query(event)
         rag_context = self._perform_rag_search(query)
 
         prompt = get_report_prompt(image_base64, event_explain, rag_context, previous_answer)
+        self._log_prompt_tokens(prompt, event.id, "report")
         chain = prompt | self.llm | StrOutputParser()
 
         try:
@@ -176,4 +450,90 @@ class ChatBot:
             return report_content
         except Exception as e:
             logger.exception(f"Error invoking LLM chain for generating report for event ID {event.id}: {e}")
-            return "보고서 생성 중 오류가 발생했습니다. 잠시 후 다시 시도해주세요."
\ No newline at end of file
+            return "보고서 생성 중 오류가 발생했습니다. 잠시 후 다시 시도해주세요."
+
+    async def asolve_event(
+        self,
+        event: 'EventModel',
+        image_base64: str,
+        event_explain: str,
+        full_context: bool = False,
+        rag_documents: Optional[List[Document]] = None,
+    ) -> str:
+        """
+        solve_event의 비동기 버전. LLM 응답을 기다리는 동안 이벤트 루프가 다른 요청을 처리할 수 있습니다.
+        rag_documents가 주어지면(이벤트 생성 시 미리 계산된 검색 결과) RAG 검색을 생략합니다.
+        """
+        query = self._build_query(event)
+        rag_context = await self._aperform_rag_search(query, full_context=full_context, documents=rag_documents)
+
+        prompt = get_solve_event_prompt(image_base64, event_explain, rag_context)
+        self._log_prompt_tokens(prompt, event.id, "solve_event")
+        chain = prompt | self.llm | StrOutputParser()
+
+        try:
+            async with self._llm_semaphore:
+                answer = await chain.ainvoke({})
+            logger.info(f"Successfully generated solution for event ID: {event.id}")
+            return answer
+        except Exception as e:
+            logger.exception(f"Error invoking LLM chain for solving event ID {event.id}: {e}")
+            return SOLVE_EVENT_ERROR_MESSAGE
+
+    async def astream_solve_event(
+        self,
+        event: 'EventModel',
+        image_base64: str,
+        event_explain: str,
+        full_context: bool = False,
+        rag_documents: Optional[List[Document]] = None,
+    ) -> AsyncIterator[str]:
+        """
+        asolve_event의 스트리밍 버전. LLM이 생성하는 텍스트 조각을 도착하는 즉시 yield 합니다.
+        오류는 호출자에게 그대로 전파되므로, 호출자가 부분 응답의 저장 여부를 결정해야 합니다.
+        """
+        query = self._build_query(event)
+        rag_context = await self._aperform_rag_search(query, full_context=full_context, documents=rag_documents)
+
+        prompt = get_solve_event_prompt(image_base64, event_explain, rag_context)
+        self._log_prompt_tokens(prompt, event.id, "solve_event")
+        chain = prompt | self.llm | StrOutputParser()
+
+        async with self._llm_semaphore:
+            async for chunk in chain.astream({}):
+                if chunk:
+                    yield chunk
+        logger.info(f"Successfully streamed solution for event ID: {event.id}")
+
+    async def amake_report_content(
+        self,
+        event: 'EventModel',
+        image_base64: str,
+        event_explain: str,
+        previous_answer: str,
+        rag_documents: Optional[List[Document]] = None,
+    ) -> str:
+        """
+        make_report_content의 비동기 버전. rag_documents는 asolve_event와 동일.
+        Raises:
+            Exception: LLM 호출 실패 시 (오류 문구를 반환하지 않음).
+        """
+        logger.info(f"Generating report content for event ID: {event.id}")
+
+        query = self._build_query(event)
+        rag_context = await self._aperform_rag_search(query, documents=rag_documents)
+
+        prompt = get_report_prompt(image_base64, event_explain, rag_context, previous_answer)
+        self._log_prompt_tokens(prompt, event.id, "report")
+        chain = prompt | self.llm | StrOutputParser()
+
+        try:
+            async with self._llm_semaphore:
+                report_content = await chain.ainvoke({})
+        except Exception as e:
+            logger.exception(f"Error invoking LLM chain for generating report for event ID {event.id}: {e}")
+            raise
+        if not report_content or not report_content.strip():
+            raise RuntimeError(f"LLM returned empty report content for event ID {event.id}")
+        logger.info(f"Successfully generated report content for event ID: {event.id}")
+        return report_content
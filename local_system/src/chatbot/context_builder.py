@@ -0,0 +1,194 @@
+#-------------------------------------------------------------------------------------#
+# [ 파일 개요 ]
+# RAG 검색 결과를 프롬프트에 넣기 전에 토큰 예산에 맞춰 정리하는 RagContextBuilder 클래스를 정의합니다.
+# 검색된 문서를 그대로 이어 붙이면 이미지(base64)와 함께 입력 토큰이 커져 첫 토큰까지의 시간이 늘어나므로,
+# 순위가 높은 구절부터 예산 안에서만 담습니다.
+
+# [ 주요 로직 흐름 ]
+# 1. 토큰 계산 (count_tokens): tiktoken의 gpt-4o 인코딩(o200k_base)으로 로컬에서 계산.
+#    tiktoken 또는 인코딩 파일을 쓸 수 없으면 문자 수 기반 근사치(한글 약 1.5자당 1토큰)를 사용.
+# 2. 구절 준비: 같은 원본의 인접 청크를 병합(merge_adjacent_chunks). 검색 결과 순서(RRF/유사도 점수순)가 곧 순위.
+#    use_summary=True이면 적재 시 저장된 추출 요약(메타데이터 summary, vector_db/summarization.py)이 있는 문서는 원문 대신 요약을 사용.
+#    같은 원본의 여러 청크는 요약이 같으므로 다음 단계에서 하나만 남음.
+# 3. 중복 제거: 문자 bigram Jaccard 유사도가 dedup_threshold 이상인 하위 순위 구절은 제외.
+# 4. 예산 적용: 순위 순으로 담다가 남은 예산보다 긴 구절은 문장 단위로 잘라 넣고(남은 예산이 min_passage_tokens 이상일 때),
+#    그 이후 구절은 제외. token_budget이 0 이하이면 예산 없이 모두 담음.
+# 5. 통계: 요청 수, 예산 적용 전/후 컨텍스트 토큰, 제외/절단 구절 수, 프롬프트(텍스트) 토큰 합계를 stats()로 제공.
+#-------------------------------------------------------------------------------------#
+
+import logging
+import math
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+from langchain_core.documents import Document
+
+from vector_db.bm25_index import tokenize
+from vector_db.chunking import merge_adjacent_chunks, sentence_spans
+
+logger = logging.getLogger(__name__)
+
+TIKTOKEN_ENCODING = "o200k_base" # gpt-4o
+PASSAGE_SEPARATOR = "\n\n---\n\n"
+
+_encoding = None
+_encoding_lock = threading.Lock()
+
+
+def _get_encoding():
+    """tiktoken 인코딩을 한 번만 로드합니다. 사용할 수 없으면 False."""
+    global _encoding
+    if _encoding is None:
+        with _encoding_lock:
+            if _encoding is None:
+                try:
+                    import tiktoken
+                    _encoding = tiktoken.get_encoding(TIKTOKEN_ENCODING)
+                except Exception as e:
+                    logger.warning(f"tiktoken encoding '{TIKTOKEN_ENCODING}' unavailable ({e}). Using approximate token counts.")
+                    _encoding = False
+    return _encoding
+
+
+def count_tokens(text: str) -> int:
+    if not text:
+        return 0
+    encoding = _get_encoding()
+    if encoding:
+        return len(encoding.encode(text, disallowed_special=()))
+    return math.ceil(len(text) / 1.5)
+
+
+def count_prompt_tokens(prompt: Any) -> Optional[int]:
+    """ChatPromptTemplate의 텍스트 부분 토큰 수 (이미지 제외). 포맷할 수 없으면 None."""
+    try:
+        messages = prompt.format_messages()
+    except Exception:
+        return None
+    total = 0
+    for message in messages:
+        content = message.content
+        if isinstance(content, str):
+            total += count_tokens(content)
+        else:
+            total += sum(count_tokens(part.get("text", "")) for part in content if isinstance(part, dict) and part.get("type") == "text")
+    return total
+
+
+def _format_passage(doc: Document, content: Optional[str] = None) -> str:
+    return f"참고문서 출처: {doc.metadata.get('file_name', 'N/A')}\n{doc.page_content if content is None else content}"
+
+
+def _use_summary(doc: Document) -> Document:
+    summary = doc.metadata.get("summary")
+    if not summary or len(summary) >= len(doc.page_content):
+        return doc
+    return Document(page_content=summary, metadata=doc.metadata)
+
+
+def _jaccard(a: set, b: set) -> float:
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+def _trim_to_tokens(text: str, max_tokens: int) -> str:
+    """문장 경계 기준으로 max_tokens 이하가 되도록 앞부분만 남깁니다. 첫 문장도 넘치면 토큰 단위로 자릅니다."""
+    end = 0
+    for _, span_end in sentence_spans(text):
+        if count_tokens(text[:span_end]) > max_tokens:
+            break
+        end = span_end
+    if end:
+        return text[:end].rstrip()
+    encoding = _get_encoding()
+    if encoding:
+        return encoding.decode(encoding.encode(text, disallowed_special=())[:max_tokens])
+    return text[:int(max_tokens * 1.5)]
+
+
+class RagContextBuilder:
+    def __init__(self, token_budget: int, dedup_threshold: float = 0.85, min_passage_tokens: int = 80):
+        self.token_budget = token_budget
+        self.dedup_threshold = dedup_threshold
+        self.min_passage_tokens = min_passage_tokens
+        self._lock = threading.Lock()
+        self._stats = {
+            "requests": 0,
+            "summarized": 0,
+            "candidate_tokens": 0,
+            "context_tokens": 0,
+            "duplicates_dropped": 0,
+            "budget_dropped": 0,
+            "trimmed": 0,
+            "prompts": 0,
+            "prompt_tokens": 0,
+        }
+
+    def _deduplicate(self, docs: List[Document]) -> Tuple[List[Document], int]:
+        kept, kept_tokens = [], []
+        for doc in docs:
+            tokens = set(tokenize(doc.page_content))
+            if any(_jaccard(tokens, other) >= self.dedup_threshold for other in kept_tokens):
+                continue
+            kept.append(doc)
+            kept_tokens.append(tokens)
+        return kept, len(docs) - len(kept)
+
+    def build(self, docs: List[Document], use_summary: bool = False) -> Tuple[str, Dict[str, int]]:
+        """순위순 검색 결과로 예산 안의 컨텍스트 문자열과 이번 요청의 통계를 만듭니다. use_summary이면 저장된 요약을 우선 사용."""
+        docs = merge_adjacent_chunks(docs)
+        summarized = 0
+        if use_summary:
+            condensed = [_use_summary(doc) for doc in docs]
+            summarized = sum(a is not b for a, b in zip(docs, condensed))
+            docs = condensed
+        docs, duplicates = self._deduplicate(docs)
+        passages = [_format_passage(doc) for doc in docs]
+        passage_tokens = [count_tokens(p) for p in passages]
+        separator_tokens = count_tokens(PASSAGE_SEPARATOR)
+
+        selected, used, trimmed = [], 0, 0
+        for doc, passage, tokens in zip(docs, passages, passage_tokens):
+            cost = tokens + (separator_tokens if selected else 0)
+            if self.token_budget <= 0 or used + cost <= self.token_budget:
+                selected.append(passage)
+                used += cost
+                continue
+            remaining = self.token_budget - used - (separator_tokens if selected else 0)
+            header_tokens = count_tokens(_format_passage(doc, ""))
+            if remaining - header_tokens >= self.min_passage_tokens:
+                passage = _format_passage(doc, _trim_to_tokens(doc.page_content, remaining - header_tokens))
+                selected.append(passage)
+                used += count_tokens(passage) + (separator_tokens if len(selected) > 1 else 0)
+                trimmed = 1
+            break
+
+        request_stats = {
+            "passages": len(selected),
+            "summarized": summarized,
+            "candidate_tokens": sum(passage_tokens),
+            "context_tokens": used,
+            "duplicates_dropped": duplicates,
+            "budget_dropped": len(passages) - len(selected),
+            "trimmed": trimmed,
+        }
+        with self._lock:
+            self._stats["requests"] += 1
+            for key in ("summarized", "candidate_tokens", "context_tokens", "duplicates_dropped", "budget_dropped", "trimmed"):
+                self._stats[key] += request_stats[key]
+        return PASSAGE_SEPARATOR.join(selected), request_stats
+
+    def record_prompt(self, prompt_tokens: int):
+        with self._lock:
+            self._stats["prompts"] += 1
+            self._stats["prompt_tokens"] += prompt_tokens
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            stats = dict(self._stats)
+        stats["token_budget"] = self.token_budget
+        stats["avg_candidate_tokens"] = stats["candidate_tokens"] / stats["requests"] if stats["requests"] else 0.0
+        stats["avg_context_tokens"] = stats["context_tokens"] / stats["requests"] if stats["requests"] else 0.0
+        stats["avg_prompt_tokens"] = stats["prompt_tokens"] / stats["prompts"] if stats["prompts"] else 0.0
+        return stats
@@ -0,0 +1,108 @@
+#-------------------------------------------------------------------------------------#
+# [ 파일 개요 ]
+# 공유 임베딩/검색 사이드카 프로세스(embedding_server.py)와 Unix 소켓으로 통신하는 EmbeddingServiceClient를 정의합니다.
+# uvicorn --workers N 환경에서 워커마다 SBERT 모델과 Chroma 클라이언트를 올리는 대신,
+# 하나의 사이드카가 모델을 보유하고 워커들은 이 클라이언트로 검색을 요청합니다.
+
+# [ 프로토콜 ]
+# - 메시지: 4바이트 big-endian 길이 + UTF-8 JSON 본문 (요청/응답 모두 동일).
+# - 요청: {"op": "search", "query": str, "k": int} → {"documents": [{"page_content": str, "metadata": dict}, ...]}
+#         {"op": "embed", "texts": [str, ...]}      → {"embeddings": [[float, ...], ...]}
+#         {"op": "stats"}                            → 사이드카 통계
+#         {"op": "reload", "force": bool}          → 게시된 벡터 DB 스냅샷으로 교체 결과
+# - 오류: {"error": str}
+# - 클라이언트는 langchain VectorStore와 같은 similarity_search / asimilarity_search 메서드를 제공하므로
+#   ChatBot에서 Chroma 대신 그대로 사용할 수 있습니다.
+#-------------------------------------------------------------------------------------#
+
+import asyncio
+import json
+import socket
+import struct
+from typing import Any, Dict, List
+
+from langchain_core.documents import Document
+
+_HEADER = struct.Struct(">I")
+
+
+def encode_message(payload: Dict[str, Any]) -> bytes:
+    body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+    return _HEADER.pack(len(body)) + body
+
+
+def _recv_exact(sock: socket.socket, size: int) -> bytes:
+    chunks = []
+    remaining = size
+    while remaining:
+        chunk = sock.recv(remaining)
+        if not chunk:
+            raise ConnectionError("Embedding server closed the connection")
+        chunks.append(chunk)
+        remaining -= len(chunk)
+    return b"".join(chunks)
+
+
+async def read_message(reader: asyncio.StreamReader) -> Dict[str, Any]:
+    header = await reader.readexactly(_HEADER.size)
+    (size,) = _HEADER.unpack(header)
+    return json.loads(await reader.readexactly(size))
+
+
+class EmbeddingServiceError(RuntimeError):
+    """사이드카가 오류 응답을 반환한 경우 발생합니다."""
+
+
+class EmbeddingServiceClient:
+    def __init__(self, socket_path: str, timeout: float = 30.0):
+        self.socket_path = socket_path
+        self.timeout = timeout
+
+    @staticmethod
+    def _check(response: Dict[str, Any]) -> Dict[str, Any]:
+        if "error" in response:
+            raise EmbeddingServiceError(response["error"])
+        return response
+
+    def request(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(self.timeout)
+            sock.connect(self.socket_path)
+            sock.sendall(encode_message(payload))
+            (size,) = _HEADER.unpack(_recv_exact(sock, _HEADER.size))
+            return self._check(json.loads(_recv_exact(sock, size)))
+
+    async def arequest(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        async def _exchange():
+            reader, writer = await asyncio.open_unix_connection(self.socket_path)
+            try:
+                writer.write(encode_message(payload))
+                await writer.drain()
+                return await read_message(reader)
+            finally:
+                writer.close()
+                await writer.wait_closed()
+
+        return self._check(await asyncio.wait_for(_exchange(), timeout=self.timeout))
+
+    @staticmethod
+    def _to_documents(response: Dict[str, Any]) -> List[Document]:
+        return [
+            Document(page_content=doc["page_content"], metadata=doc.get("metadata") or {})
+            for doc in response.get("documents", [])
+        ]
+
+    def similarity_search(self, query: str, k: int = 5) -> List[Document]:
+        return self._to_documents(self.request({"op": "search", "query": query, "k": k}))
+
+    async def asimilarity_search(self, query: str, k: int = 5) -> List[Document]:
+        return self._to_documents(await self.arequest({"op": "search", "query": query, "k": k}))
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return self.request({"op": "embed", "texts": texts})["embeddings"]
+
+    def embed_query(self, text: str) -> List[float]:
+        return self.embed_documents([text])[0]
+
+    def stats(self) -> Dict[str, Any]:
+        return self.request({"op": "stats"})
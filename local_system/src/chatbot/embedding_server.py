@@ -0,0 +1,201 @@
+#-------------------------------------------------------------------------------------#
+# [ 파일 개요 ]
+# 여러 uvicorn 워커가 공유하는 임베딩/검색 사이드카 프로세스입니다.
+# SBERT 임베딩 모델과 Chroma 벡터 DB를 한 번만 로드하고, Unix 소켓으로 들어오는 요청을 처리합니다.
+# 동시에 도착한 쿼리들은 마이크로배치로 묶어 한 번의 forward pass로 임베딩합니다.
+
+# [ 주요 로직 흐름 ]
+# 1. 시작: 임베딩 모델(EMBEDDING_BACKEND: torch 또는 onnx) + 벡터 DB(VECTOR_STORE_BACKEND: chroma 또는 flat) 로드, 오래된 소켓 파일 제거 후 Unix 소켓 서버 시작.
+# 2. 요청 처리 (프로토콜은 embedding_client.py 참고):
+#    - search: 쿼리를 MicroBatcher에 넣어 임베딩 → similarity_search_by_vector로 top-k 검색.
+#    - embed: 텍스트 목록을 MicroBatcher로 임베딩하여 벡터 반환.
+#    - stats: 배치 횟수, 평균 배치 크기 등 통계 반환.
+#    - reload: 게시된 벡터 DB 스냅샷(CURRENT)으로 벡터 DB를 다시 열어 교체 (워커의 ChatBot.reload_vector_store가 위임).
+# 3. MicroBatcher: 첫 요청 도착 후 EMBEDDING_SERVER_BATCH_WAIT_MS 동안(또는 최대 배치 크기까지) 모은 뒤
+#    embed_documents를 스레드에서 한 번 호출.
+
+# [ 사용법 ] (local_system 디렉토리에서 실행)
+#   python -m src.chatbot.embedding_server [--socket /tmp/facman_embedding.sock]
+#   각 워커는 EMBEDDING_SERVER_SOCKET 환경 변수로 같은 소켓 경로를 지정하면 자동으로 사이드카를 사용합니다.
+#-------------------------------------------------------------------------------------#
+
+import argparse
+import asyncio
+import logging
+import os
+from typing import Any, Dict, List, Optional, Tuple
+
+
+from ..core.config import (
+    VECTOR_DB,
+    EMBEDDING_MODEL_NAME,
+    EMBEDDING_SERVER_SOCKET,
+    EMBEDDING_SERVER_MAX_BATCH,
+    EMBEDDING_SERVER_BATCH_WAIT_MS,
+    EMBEDDING_BACKEND,
+    EMBEDDING_ONNX_DIR,
+    EMBEDDING_ONNX_QUANTIZED,
+    VECTOR_DB_SNAPSHOT_DIR,
+    VECTOR_STORE_BACKEND,
+)
+from vector_db.embedders import create_embeddings
+from vector_db.snapshots import SnapshotStore
+from vector_db.vector_stores import close_vector_store, count_documents, open_vector_store
+from .embedding_client import encode_message, read_message
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SOCKET_PATH = "/tmp/facman_embedding.sock"
+
+
+class MicroBatcher:
+    def __init__(self, embed_fn, max_batch: int, max_wait: float):
+        self.embed_fn = embed_fn
+        self.max_batch = max(1, max_batch)
+        self.max_wait = max_wait
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self.batches = 0
+        self.texts = 0
+
+    async def embed(self, text: str) -> List[float]:
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((text, future))
+        return await future
+
+    async def run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch: List[Tuple[str, asyncio.Future]] = [await self._queue.get()]
+            deadline = loop.time() + self.max_wait
+            while len(batch) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout=timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            try:
+                vectors = await asyncio.to_thread(self.embed_fn, [text for text, _ in batch])
+            except Exception as e:
+                logger.exception(f"Embedding batch of {len(batch)} failed: {e}")
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            self.batches += 1
+            self.texts += len(batch)
+            for (_, future), vector in zip(batch, vectors):
+                if not future.done():
+                    future.set_result(vector)
+
+
+class EmbeddingServer:
+    def __init__(self, socket_path: str, persist_directory: Optional[str] = None, model_name: str = EMBEDDING_MODEL_NAME):
+        self.socket_path = socket_path
+        self.snapshot_store = SnapshotStore(VECTOR_DB_SNAPSHOT_DIR)
+        persist_directory = persist_directory or self.snapshot_store.resolve(VECTOR_DB)
+        self.persist_directory = persist_directory
+        logger.info(f"Loading embedding model '{model_name}' and Chroma DB from {persist_directory}")
+        self.embeddings = create_embeddings(
+            model_name=model_name,
+            backend=EMBEDDING_BACKEND,
+            onnx_dir=EMBEDDING_ONNX_DIR or None,
+            quantized=EMBEDDING_ONNX_QUANTIZED,
+        )
+        self.vector_store = open_vector_store(persist_directory, self.embeddings, backend=VECTOR_STORE_BACKEND)
+        self.batcher = MicroBatcher(
+            self.embeddings.embed_documents,
+            max_batch=EMBEDDING_SERVER_MAX_BATCH,
+            max_wait=EMBEDDING_SERVER_BATCH_WAIT_MS / 1000.0,
+        )
+        self.requests = 0
+
+    async def _handle_request(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        op = request.get("op")
+        if op == "search":
+            vector = await self.batcher.embed(request["query"])
+            docs = await asyncio.to_thread(
+                self.vector_store.similarity_search_by_vector, vector, int(request.get("k", 5))
+            )
+            return {"documents": [{"page_content": d.page_content, "metadata": d.metadata} for d in docs]}
+        if op == "embed":
+            vectors = await asyncio.gather(*(self.batcher.embed(text) for text in request["texts"]))
+            return {"embeddings": list(vectors)}
+        if op == "reload":
+            return await asyncio.to_thread(self._reload, bool(request.get("force", False)))
+        if op == "stats":
+            return {
+                "requests": self.requests,
+                "batches": self.batcher.batches,
+                "embedded_texts": self.batcher.texts,
+                "avg_batch_size": (self.batcher.texts / self.batcher.batches) if self.batcher.batches else 0.0,
+            }
+        return {"error": f"Unknown op: {op}"}
+
+    def _reload(self, force: bool) -> Dict[str, Any]:
+        """게시된 스냅샷으로 벡터 DB를 다시 연 뒤 참조를 교체합니다 (임베딩 모델은 재사용)."""
+        path = self.snapshot_store.resolve(VECTOR_DB)
+        previous_path = self.persist_directory
+        if path == previous_path and not force:
+            return {"reloaded": False, "path": path, "previous_path": previous_path}
+        vector_store = open_vector_store(path, self.embeddings, backend=VECTOR_STORE_BACKEND)
+        documents = count_documents(vector_store)
+        previous_store = self.vector_store
+        self.vector_store = vector_store
+        self.persist_directory = path
+        # 이전 FlatIndex의 mmap/파일 핸들 해제 (진행 중인 검색을 위해 잠시 뒤에 닫음)
+        if previous_store is not None:
+            close_vector_store(previous_store)
+        logger.info(f"Vector store switched to {path} ({documents} documents)")
+        return {"reloaded": True, "path": path, "previous_path": previous_path, "documents": documents}
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            request = await read_message(reader)
+            self.requests += 1
+            try:
+                response = await self._handle_request(request)
+            except Exception as e:
+                logger.exception(f"Error handling embedding request: {e}")
+                response = {"error": str(e)}
+            writer.write(encode_message(response))
+            await writer.drain()
+        except asyncio.IncompleteReadError:
+            pass
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except (ConnectionError, BrokenPipeError):
+                pass # 클라이언트가 먼저 연결을 끊은 경우
+
+    async def serve(self):
+        if os.path.exists(self.socket_path):
+            os.remove(self.socket_path) # 이전 실행에서 남은 소켓 파일 제거
+        batcher_task = asyncio.create_task(self.batcher.run())
+        server = await asyncio.start_unix_server(self._handle_connection, path=self.socket_path)
+        os.chmod(self.socket_path, 0o660)
+        logger.info(f"Embedding server listening on {self.socket_path}")
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            batcher_task.cancel()
+            if os.path.exists(self.socket_path):
+                os.remove(self.socket_path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Shared embedding / retrieval sidecar for local_system workers.")
+    parser.add_argument("--socket", default=EMBEDDING_SERVER_SOCKET or DEFAULT_SOCKET_PATH, help="Unix 소켓 경로")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(EmbeddingServer(args.socket).serve())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,192 @@
+#-------------------------------------------------------------------------------------#
+# [ 파일 개요 ]
+# 이벤트(type/value) 임베딩으로 "이 알람의 과거 유사 사례"를 찾기 위한 프로세스 내 벡터 인덱스(EventEmbeddingIndex)를 정의합니다.
+# 이벤트 생성 시 증분으로 추가되며, 10^6건 규모에서도 밀리초 단위로 응답하도록 HNSW(hnswlib, chromadb와 같은 라이브러리)를 사용합니다.
+
+# [ 주요 로직 흐름 ]
+# 1. 라벨 = 이벤트 ID. 이벤트 ID는 생성 순서대로 증가하므로 "이전 이벤트"는 ID < 기준 ID 조건으로 찾음.
+# 2. add(): 첫 추가 시 차원을 정해 인덱스를 만들고, 용량이 부족하면 두 배로 늘림(resize_index). 이미 있는 ID는 건너뜀.
+# 3. query(vector, k, before_id):
+#    - 모든 이벤트가 before_id 이전이면 필터 없이 HNSW 검색.
+#    - 이전 이벤트가 EXACT_SEARCH_MAX건 이하이면(오래된 이벤트 기준) HNSW 필터 검색은 대부분의 후보를 버리며 그래프 전체를 돌게 되므로,
+#      가장 오래된 EXACT_SEARCH_MAX건의 벡터를 따로 보관한 float16 행렬(head)에서 정확 검색.
+#    - 그 외에는 ID < before_id 필터를 건 HNSW 검색.
+# 4. save()/load(): index.bin(hnswlib) + head.npz + meta.json(차원, 모델 이름, 건수, indexed_through)을 임시 파일에 쓴 뒤 교체.
+#    indexed_through는 이 ID 이하의 이벤트가 모두 인덱스에 있다는 표시로, 재시작 시 그 이후 이벤트만 DB에서 다시 임베딩함.
+#-------------------------------------------------------------------------------------#
+
+import json
+import logging
+import os
+import threading
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import hnswlib
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+HNSW_M = 16
+HNSW_EF_CONSTRUCTION = 200
+INITIAL_CAPACITY = 1024
+EXACT_SEARCH_MAX = 20000 # 이전 이벤트가 이 수 이하이면 head 행렬에서 정확 검색
+
+INDEX_FILENAME = "index.bin"
+HEAD_FILENAME = "head.npz"
+META_FILENAME = "meta.json"
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    return vectors / np.clip(np.linalg.norm(vectors, axis=-1, keepdims=True), 1e-12, None)
+
+
+class EventEmbeddingIndex:
+    def __init__(self, ef_search: int = 64, model_name: Optional[str] = None):
+        self.ef_search = ef_search
+        self.model_name = model_name
+        self.indexed_through = 0
+        self._lock = threading.Lock()
+        self._index: Optional[hnswlib.Index] = None
+        self._ids: set = set()
+        self._max_id = 0
+        # 가장 오래된(ID가 작은) EXACT_SEARCH_MAX건의 정규화 벡터, ID 오름차순
+        self._head_ids = np.empty(0, dtype=np.int64)
+        self._head_vectors: Optional[np.ndarray] = None
+
+    @property
+    def dim(self) -> Optional[int]:
+        return self._index.dim if self._index is not None else None
+
+    @property
+    def max_id(self) -> int:
+        return self._max_id
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, event_id: int) -> bool:
+        return event_id in self._ids
+
+    def _create(self, dim: int):
+        self._index = hnswlib.Index(space="cosine", dim=dim)
+        self._index.init_index(max_elements=INITIAL_CAPACITY, M=HNSW_M, ef_construction=HNSW_EF_CONSTRUCTION)
+        self._head_vectors = np.empty((0, dim), dtype=np.float16)
+
+    def add(self, ids: Sequence[int], vectors: Sequence[Sequence[float]]) -> int:
+        """이벤트 벡터를 추가합니다. 이미 있는 ID는 건너뛰며, 추가한 건수를 반환합니다."""
+        vectors = _normalize(np.asarray(vectors, dtype=np.float32))
+        with self._lock:
+            keep = [i for i, event_id in enumerate(ids) if event_id not in self._ids]
+            if not keep:
+                return 0
+            new_ids = np.asarray([ids[i] for i in keep], dtype=np.int64)
+            vectors = vectors[keep]
+            if self._index is None:
+                self._create(vectors.shape[1])
+            capacity = self._index.get_max_elements()
+            if len(self._ids) + len(new_ids) > capacity:
+                self._index.resize_index(max(capacity * 2, len(self._ids) + len(new_ids)))
+            self._index.add_items(vectors, new_ids, num_threads=1)
+            self._ids.update(int(event_id) for event_id in new_ids)
+            self._max_id = max(self._max_id, int(new_ids.max()))
+            self._add_to_head(new_ids, vectors)
+            return len(new_ids)
+
+    def _add_to_head(self, ids: np.ndarray, vectors: np.ndarray):
+        if len(self._head_ids) >= EXACT_SEARCH_MAX and ids.min() > self._head_ids[-1]:
+            return # 대부분의 경우 (새 이벤트는 head보다 최신)
+        head_ids = np.concatenate([self._head_ids, ids])
+        head_vectors = np.concatenate([self._head_vectors, vectors.astype(np.float16)])
+        order = np.argsort(head_ids, kind="stable")[:EXACT_SEARCH_MAX]
+        self._head_ids, self._head_vectors = head_ids[order], head_vectors[order]
+
+    def get_vector(self, event_id: int) -> Optional[np.ndarray]:
+        with self._lock:
+            if event_id not in self._ids:
+                return None
+            return np.asarray(self._index.get_items([event_id])[0], dtype=np.float32)
+
+    def query(self, vector: Sequence[float], k: int, before_id: Optional[int] = None) -> List[Tuple[int, float]]:
+        """vector와 가장 유사한 이벤트 (ID, 코사인 유사도) 목록. before_id가 주어지면 그보다 ID가 작은 이벤트만."""
+        query = _normalize(np.asarray(vector, dtype=np.float32))
+        with self._lock:
+            if self._index is None or not self._ids or k <= 0:
+                return []
+            if before_id is None or before_id > self._max_id:
+                return self._knn(query, min(k, len(self._ids)))
+            if len(self._head_ids) < EXACT_SEARCH_MAX or before_id <= self._head_ids[-1]:
+                return self._exact_head(query, k, before_id)
+            return self._knn(query, k, filter=lambda label: label < before_id)
+
+    def _knn(self, query: np.ndarray, k: int, filter=None) -> List[Tuple[int, float]]:
+        self._index.set_ef(max(self.ef_search, k))
+        labels, distances = self._index.knn_query(query, k=k, num_threads=1, filter=filter)
+        return [(int(label), 1.0 - float(distance)) for label, distance in zip(labels[0], distances[0])]
+
+    def _exact_head(self, query: np.ndarray, k: int, before_id: int) -> List[Tuple[int, float]]:
+        count = int(np.searchsorted(self._head_ids, before_id))
+        if count == 0:
+            return []
+        scores = self._head_vectors[:count].astype(np.float32) @ query
+        top = np.argsort(-scores)[:k] if count <= k else np.argpartition(-scores, k)[:k]
+        top = top[np.argsort(-scores[top])]
+        return [(int(self._head_ids[i]), float(scores[i])) for i in top]
+
+    def save(self, directory: str):
+        with self._lock:
+            if self._index is None:
+                return
+            os.makedirs(directory, exist_ok=True)
+            meta = {
+                "dim": self._index.dim,
+                "model_name": self.model_name,
+                "count": len(self._ids),
+                "indexed_through": self.indexed_through,
+            }
+            index_path = os.path.join(directory, INDEX_FILENAME)
+            head_path = os.path.join(directory, HEAD_FILENAME)
+            self._index.save_index(f"{index_path}.tmp")
+            with open(f"{head_path}.tmp", "wb") as f:
+                np.savez(f, ids=self._head_ids, vectors=self._head_vectors)
+        os.replace(f"{index_path}.tmp", index_path)
+        os.replace(f"{head_path}.tmp", head_path)
+        # meta를 마지막에 교체 (indexed_through가 저장된 인덱스보다 앞서지 않도록)
+        meta_path = os.path.join(directory, META_FILENAME)
+        with open(f"{meta_path}.tmp", "w", encoding="utf-8") as f:
+            json.dump(meta, f)
+        os.replace(f"{meta_path}.tmp", meta_path)
+
+    def load(self, directory: str) -> bool:
+        """저장된 인덱스를 엽니다. 없거나 다른 임베딩 모델로 만든 인덱스이면 False (처음부터 다시 구축)."""
+        meta_path = os.path.join(directory, META_FILENAME)
+        try:
+            with open(meta_path, encoding="utf-8") as f:
+                meta = json.load(f)
+        except FileNotFoundError:
+            return False
+        if self.model_name and meta.get("model_name") != self.model_name:
+            logger.warning(f"Event index was built with '{meta.get('model_name')}', not '{self.model_name}'. Rebuilding.")
+            return False
+        index = hnswlib.Index(space="cosine", dim=meta["dim"])
+        index.load_index(os.path.join(directory, INDEX_FILENAME), max_elements=max(INITIAL_CAPACITY, meta["count"]))
+        with np.load(os.path.join(directory, HEAD_FILENAME)) as head:
+            head_ids, head_vectors = head["ids"], head["vectors"]
+        ids = set(int(label) for label in index.get_ids_list())
+        with self._lock:
+            self._index = index
+            self._ids = ids
+            self._max_id = max(ids, default=0)
+            self._head_ids, self._head_vectors = head_ids, head_vectors
+            self.indexed_through = meta.get("indexed_through", 0)
+        return True
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "size": len(self._ids),
+                "capacity": self._index.get_max_elements() if self._index is not None else 0,
+                "dim": self.dim,
+                "max_event_id": self._max_id,
+                "indexed_through": self.indexed_through,
+                "ef_search": self.ef_search,
+            }
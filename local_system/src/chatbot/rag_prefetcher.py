@@ -0,0 +1,224 @@
+#-------------------------------------------------------------------------------------#
+# [ 파일 개요 ]
+# 이벤트가 생성되면 해결 요청(solve_event)이 오기 전의 유휴 시간에 RAG 검색(쿼리 임베딩 + 벡터/BM25 검색)을
+# 미리 실행해 두는 RagPrefetcher를 정의합니다. 해결 요청 시에는 저장된 결과로 바로 LLM을 호출합니다.
+
+# [ 주요 로직 흐름 ]
+# 1. submit(event): 이벤트 생성 서비스가 호출. 큐가 가득 차면 버리고(dropped) 해결 시점에 평소처럼 검색.
+# 2. 백그라운드 태스크: ChatBot.aprefetch_documents()로 검색 → 이벤트 ID를 키로 메모리(LRU)와
+#    RAG_PREFETCH_DIR/<event_id>.json에 저장 (서버 재시작 후에도 사용 가능).
+# 3. get(event_id, vector_store_path): 메모리 → 디스크 순으로 조회. 다른 벡터 DB 스냅샷으로 계산된 결과나
+#    RAG_PREFETCH_TTL_SECONDS가 지난 결과는 사용하지 않음(stale).
+#    조회 시 stale로 판정된 결과는 메모리와 디스크에서 바로 삭제.
+# 4. 파일 정리(_prune): start()와 실행 중 prune_interval마다 TTL이 지난 파일을 삭제하고, 파일 수가 max_files를 넘으면
+#    오래된 것부터 삭제 (해결 후에도 보고서 생성에서 재사용하므로 해결 시점에는 지우지 않음).
+# 5. stats()로 hit/miss/처리/정리 건수를 제공.
+#-------------------------------------------------------------------------------------#
+
+import asyncio
+import json
+import logging
+import os
+import time
+from typing import Any, Dict, List, Optional
+
+from cachetools import LRUCache
+from langchain_core.documents import Document
+
+from ..core.config import RAG_PREFETCH_DIR, RAG_PREFETCH_CACHE_SIZE, RAG_PREFETCH_QUEUE_SIZE, RAG_PREFETCH_TTL_SECONDS
+from ..core.config import RAG_PREFETCH_MAX_FILES, RAG_PREFETCH_PRUNE_INTERVAL_SECONDS
+from ..db.models import EventModel
+from .chatbot import ChatBot
+
+logger = logging.getLogger(__name__)
+
+
+class RagPrefetcher:
+    def __init__(
+        self,
+        persist_dir: str = RAG_PREFETCH_DIR,
+        cache_size: int = RAG_PREFETCH_CACHE_SIZE,
+        queue_size: int = RAG_PREFETCH_QUEUE_SIZE,
+        ttl: float = RAG_PREFETCH_TTL_SECONDS,
+        max_files: int = RAG_PREFETCH_MAX_FILES,
+        prune_interval: float = RAG_PREFETCH_PRUNE_INTERVAL_SECONDS,
+    ):
+        self.persist_dir = persist_dir
+        self.ttl = ttl
+        self.max_files = max(1, max_files)
+        self.prune_interval = prune_interval
+        self._cache: LRUCache = LRUCache(maxsize=cache_size)
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self._task: Optional[asyncio.Task] = None
+        self._counts = {"queued": 0, "dropped": 0, "completed": 0, "failed": 0, "hits": 0, "misses": 0, "stale": 0, "pruned": 0}
+        self._last_prune = time.monotonic()
+        self._prefetch_seconds = 0.0
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None
+
+    async def start(self):
+        if self._task is not None:
+            return
+        os.makedirs(self.persist_dir, exist_ok=True)
+        await self._prune()
+        self._task = asyncio.create_task(self._run(), name="rag-prefetcher")
+        logger.info(f"RAG prefetcher started (persist dir: {self.persist_dir})")
+
+    async def stop(self):
+        """대기 중인 이벤트는 버립니다 (해결 요청 시 평소처럼 검색)."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    def submit(self, event: EventModel) -> bool:
+        if self._task is None:
+            return False
+        # 요청 세션과 분리된 복사본 (세션 종료 후에도 속성 접근 가능)
+        snapshot = EventModel(id=event.id, type=event.type, value=event.value, time=event.time)
+        try:
+            self._queue.put_nowait(snapshot)
+        except asyncio.QueueFull:
+            self._counts["dropped"] += 1
+            return False
+        self._counts["queued"] += 1
+        return True
+
+    async def _run(self):
+        while True:
+            timeout = max(0.0, self.prune_interval - (time.monotonic() - self._last_prune))
+            try:
+                event = await asyncio.wait_for(self._queue.get(), timeout=timeout)
+            except asyncio.TimeoutError:
+                await self._prune()
+                continue
+            try:
+                await self._prefetch(event)
+            except Exception as e:
+                self._counts["failed"] += 1
+                logger.exception(f"RAG prefetch failed for event ID {event.id}: {e}")
+            finally:
+                self._queue.task_done()
+            if time.monotonic() - self._last_prune >= self.prune_interval:
+                await self._prune()
+
+    async def _prefetch(self, event: EventModel):
+        # 최초 생성 시 임베딩 모델/벡터 DB 로딩이 오래 걸리므로 스레드에서 인스턴스화 (싱글톤)
+        chatbot = await asyncio.to_thread(ChatBot)
+        started = time.perf_counter()
+        docs = await chatbot.aprefetch_documents(event)
+        if docs is None:
+            return
+        entry = {
+            "event_id": event.id,
+            "vector_store": chatbot.vector_store_path,
+            "created_at": time.time(),
+            "documents": [{"page_content": d.page_content, "metadata": d.metadata} for d in docs],
+        }
+        self._cache[event.id] = entry
+        await asyncio.to_thread(self._write, entry)
+        self._prefetch_seconds += time.perf_counter() - started
+        self._counts["completed"] += 1
+        logger.debug(f"Prefetched {len(docs)} RAG documents for event ID {event.id}")
+
+    def _path(self, event_id: int) -> str:
+        return os.path.join(self.persist_dir, f"{event_id}.json")
+
+    def _write(self, entry: Dict[str, Any]):
+        path = self._path(entry["event_id"])
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(entry, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    def _read(self, event_id: int) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self._path(event_id), encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Ignoring unreadable RAG prefetch entry for event ID {event_id}: {e}")
+            return None
+
+    def _remove_file(self, event_id: int):
+        try:
+            os.remove(self._path(event_id))
+        except OSError:
+            pass
+
+    def _prune_files(self) -> int:
+        """TTL이 지난 파일을 삭제하고, 남은 파일이 max_files를 넘으면 오래된 것부터 삭제합니다."""
+        removed = 0
+        cutoff = time.time() - self.ttl
+        remaining = []
+        with os.scandir(self.persist_dir) as entries:
+            for entry in entries:
+                try:
+                    mtime = entry.stat().st_mtime
+                    if mtime < cutoff:
+                        os.remove(entry.path)
+                        removed += 1
+                    else:
+                        remaining.append((mtime, entry.path))
+                except OSError:
+                    continue
+        if len(remaining) > self.max_files:
+            remaining.sort()
+            for _, path in remaining[:len(remaining) - self.max_files]:
+                try:
+                    os.remove(path)
+                    removed += 1
+                except OSError:
+                    continue
+        return removed
+
+    async def _prune(self):
+        self._last_prune = time.monotonic()
+        try:
+            removed = await asyncio.to_thread(self._prune_files)
+        except OSError as e:
+            logger.warning(f"Failed to prune RAG prefetch entries in {self.persist_dir}: {e}")
+            return
+        if removed:
+            self._counts["pruned"] += removed
+            logger.info(f"Removed {removed} expired or excess RAG prefetch entries")
+
+    async def get(self, event_id: int, vector_store_path: Optional[str]) -> Optional[List[Document]]:
+        """미리 계산된 검색 결과. 없거나 현재 벡터 DB와 맞지 않으면 None."""
+        entry = self._cache.get(event_id)
+        if entry is None:
+            entry = await asyncio.to_thread(self._read, event_id)
+            if entry is not None:
+                self._cache[event_id] = entry
+        if entry is None:
+            self._counts["misses"] += 1
+            return None
+        if entry.get("vector_store") != vector_store_path or time.time() - entry.get("created_at", 0) > self.ttl:
+            # 다른 벡터 DB로 계산되었거나 만료된 결과는 다시 쓰이지 않으므로 바로 삭제
+            self._counts["stale"] += 1
+            self._cache.pop(event_id, None)
+            await asyncio.to_thread(self._remove_file, event_id)
+            return None
+        self._counts["hits"] += 1
+        return [Document(page_content=d["page_content"], metadata=d.get("metadata") or {}) for d in entry["documents"]]
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self._counts["hits"] + self._counts["misses"] + self._counts["stale"]
+        return {
+            "running": self.running,
+            **self._counts,
+            "pending": self._queue.qsize(),
+            "hit_rate": (self._counts["hits"] / lookups) if lookups else 0.0,
+            "avg_prefetch_ms": (self._prefetch_seconds * 1000 / self._counts["completed"]) if self._counts["completed"] else 0.0,
+            "cached": len(self._cache),
+        }
+
+
+rag_prefetcher = RagPrefetcher()
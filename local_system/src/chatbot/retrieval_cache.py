@@ -0,0 +1,116 @@
+#-------------------------------------------------------------------------------------#
+# [ 파일 개요 ]
+# RAG 검색 결과(Document 리스트)를 메모리에 캐싱하는 RetrievalCache 클래스를 정의합니다.
+# 같은 이벤트에 대한 solve_event / make_report_content 호출이나 반복 요청 시
+# SBERT 임베딩 계산과 Chroma 유사도 검색을 생략하기 위해 사용됩니다.
+
+# [ 주요 로직 흐름 ]
+# 1. 키 생성: 쿼리 문자열을 정규화(공백 정리, 대소문자 통일)한 값과 k를 묶어 캐시 키로 사용.
+# 2. 저장소: cachetools.TTLCache (LRU 교체 + TTL 만료) 를 스레드 락으로 보호하여 사용.
+# 3. 무효화: 사용 중인 백엔드의 저장소 파일(chroma: chroma.sqlite3, flat: flat_index/manifest.json) 수정 시각/크기를
+#    지문(fingerprint)으로 기록하고, 조회 시 지문이 바뀌었으면(벡터 DB 재구축) 캐시 전체를 비움. invalidate()로 수동 무효화도 가능.
+#    새 스냅샷으로 교체되면 rebind()로 감시 대상 디렉토리를 바꾸고 캐시를 비움.
+#    캐시를 비울 때마다 generation을 올리고, 비우기 전에 시작된 검색 결과(set의 generation이 다름)는 저장하지 않음.
+# 4. 통계: hit/miss/무효화 횟수와 hit rate를 stats()로 제공.
+#-------------------------------------------------------------------------------------#
+
+import logging
+import os
+import re
+import threading
+from typing import Dict, List, Optional, Tuple
+
+from cachetools import TTLCache
+from langchain_core.documents import Document
+
+from vector_db.vector_stores import store_marker_path
+
+logger = logging.getLogger(__name__)
+
+
+class RetrievalCache:
+    def __init__(self, maxsize: int, ttl: float, persist_directory: Optional[str] = None, backend: Optional[str] = None):
+        self._cache: TTLCache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._lock = threading.Lock()
+        self.persist_directory = persist_directory
+        self.backend = backend
+        self._fingerprint = self._store_fingerprint()
+        self.generation = 0 # 캐시를 비울 때마다 증가
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.stale_sets = 0
+
+    @staticmethod
+    def make_key(query: str, k: int) -> Tuple[str, int]:
+        """쿼리를 정규화하여 (정규화된 쿼리, k) 형태의 캐시 키를 만듭니다."""
+        normalized = re.sub(r"\s+", " ", query).strip().casefold()
+        return normalized, k
+
+    def _store_fingerprint(self) -> Optional[Tuple[float, int]]:
+        """벡터 DB 파일의 (수정 시각, 크기). 벡터 DB가 재구축되면 값이 바뀝니다."""
+        if not self.persist_directory:
+            return None
+        try:
+            stat = os.stat(store_marker_path(self.persist_directory, self.backend))
+            return stat.st_mtime, stat.st_size
+        except OSError:
+            return None
+
+    def _check_store_changed(self):
+        fingerprint = self._store_fingerprint()
+        if fingerprint != self._fingerprint:
+            logger.info("Vector store change detected. Invalidating RAG retrieval cache.")
+            self._cache.clear()
+            self._fingerprint = fingerprint
+            self.generation += 1
+            self.invalidations += 1
+
+    def get(self, query: str, k: int) -> Optional[List[Document]]:
+        key = self.make_key(query, k)
+        with self._lock:
+            self._check_store_changed()
+            docs = self._cache.get(key)
+            if docs is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        logger.debug(f"RAG retrieval cache hit for query (first 50 chars): '{query[:50]}...'")
+        return list(docs)
+
+    def set(self, query: str, k: int, docs: List[Document], generation: Optional[int] = None):
+        """검색 결과를 저장합니다. generation(검색 시작 전 값)이 현재와 다르면 이전 벡터 DB의 결과이므로 버립니다."""
+        key = self.make_key(query, k)
+        with self._lock:
+            self._check_store_changed()
+            if generation is not None and generation != self.generation:
+                self.stale_sets += 1
+                return
+            self._cache[key] = list(docs)
+
+    def rebind(self, persist_directory: Optional[str]):
+        """감시할 벡터 DB 디렉토리를 바꾸고 캐시를 비웁니다. (새 스냅샷으로 교체한 경우)"""
+        with self._lock:
+            self.persist_directory = persist_directory
+        self.invalidate()
+
+    def invalidate(self):
+        """캐시 전체를 비웁니다. (벡터 DB를 다시 로드한 경우 등)"""
+        with self._lock:
+            self._cache.clear()
+            self._fingerprint = self._store_fingerprint()
+            self.generation += 1
+            self.invalidations += 1
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": (self.hits / total) if total else 0.0,
+                "size": len(self._cache),
+                "maxsize": self._cache.maxsize,
+                "invalidations": self.invalidations,
+                "stale_sets": self.stale_sets,
+            }
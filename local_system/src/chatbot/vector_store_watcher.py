@@ -0,0 +1,71 @@
+#-------------------------------------------------------------------------------------#
+# [ 파일 개요 ]
+# 벡터 DB 스냅샷 포인터(VECTOR_DB_SNAPSHOT_DIR/CURRENT)를 주기적으로 확인하여,
+# 새 스냅샷이 게시되면 실행 중인 ChatBot이 서버 재시작 없이 새 벡터 DB를 열도록 하는 VectorStoreWatcher를 정의합니다.
+
+# [ 주요 로직 흐름 ]
+# 1. start(): VECTOR_DB_WATCH_INTERVAL_SECONDS 주기로 CURRENT의 (수정 시각, 내용)을 확인하는 asyncio 태스크 시작.
+# 2. 값이 바뀌면 ChatBot.reload_vector_store()를 스레드에서 실행 (이벤트 루프를 막지 않음).
+#    ChatBot이 아직 생성되지 않았다면 생성 시 현재 스냅샷을 열므로 교체를 생략.
+# 3. 교체에 실패하면 이전 벡터 DB를 유지하고 다음 주기에 다시 시도.
+#-------------------------------------------------------------------------------------#
+
+import asyncio
+import logging
+from typing import Any, Dict, Optional
+
+from vector_db.snapshots import SnapshotStore
+
+from ..core.config import VECTOR_DB_SNAPSHOT_DIR
+from .chatbot import ChatBot
+
+logger = logging.getLogger(__name__)
+
+
+class VectorStoreWatcher:
+    def __init__(self, snapshot_dir: str = VECTOR_DB_SNAPSHOT_DIR):
+        self.snapshot_store = SnapshotStore(snapshot_dir)
+        self._task: Optional[asyncio.Task] = None
+        self._fingerprint = None
+        self.reloads = 0
+        self.last_result: Optional[Dict[str, Any]] = None
+        self.last_error: Optional[str] = None
+
+    async def start(self, interval: float):
+        if self._task is not None:
+            return
+        self._fingerprint = self.snapshot_store.pointer_fingerprint()
+        self._task = asyncio.create_task(self._run(interval))
+        logger.info(f"Vector store snapshot watcher started (interval: {interval}s)")
+
+    async def stop(self):
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self, interval: float):
+        while True:
+            await asyncio.sleep(interval)
+            fingerprint = self.snapshot_store.pointer_fingerprint()
+            if fingerprint == self._fingerprint:
+                continue
+            instance = ChatBot._instance
+            if instance is None or not getattr(instance, "_initialized", False):
+                self._fingerprint = fingerprint
+                continue
+            try:
+                self.last_result = await asyncio.to_thread(instance.reload_vector_store)
+                self.last_error = None
+                self._fingerprint = fingerprint
+                self.reloads += 1
+            except Exception as e:
+                logger.exception(f"Failed to reload vector store snapshot: {e}")
+                self.last_error = str(e)
+
+
+vector_store_watcher = VectorStoreWatcher()
@@ -0,0 +1,84 @@
+#-------------------------------------------------------------------------------------#
+# [ 파일 개요 ]
+# 서버 시작 시 ChatBot(임베딩 모델, Chroma 벡터 DB, LLM 클라이언트)을 백그라운드 스레드에서 미리 로드하고
+# 더미 쿼리를 한 번 실행하여 첫 요청의 지연을 없애는 ChatBotWarmup 클래스를 정의합니다.
+# /ai/local/ready 엔드포인트는 status()를 사용하여 로드 밸런서에 준비 상태를 알려줍니다.
+
+# [ 상태 ]
+# - disabled: 시작 시 warm-up을 하지 않음 (첫 요청 시 지연 로드, 항상 ready로 보고)
+# - pending / loading: 아직 준비되지 않음 (503)
+# - ready: 모든 구성요소 로드 및 warm-up 쿼리 완료
+# - degraded: 일부 구성요소(예: 벡터 DB) 로드 실패, LLM 호출은 가능
+# - failed: ChatBot 생성 자체가 실패 (503)
+#-------------------------------------------------------------------------------------#
+
+import logging
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from .chatbot import ChatBot
+
+logger = logging.getLogger(__name__)
+
+
+class ChatBotWarmup:
+    def __init__(self):
+        self.state = "pending"
+        self.error: Optional[str] = None
+        self._started_at: Optional[float] = None
+        self._finished_at: Optional[float] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        """백그라운드 스레드에서 warm-up을 시작합니다 (이벤트 루프를 막지 않음)."""
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name="chatbot-warmup", daemon=True)
+        self._thread.start()
+
+    def disable(self):
+        self.state = "disabled"
+
+    def _run(self):
+        self.state = "loading"
+        self._started_at = time.perf_counter()
+        logger.info("ChatBot warm-up started")
+        try:
+            chatbot = ChatBot()
+            chatbot.warm_up()
+            failed = [
+                name for name, status in chatbot.component_status.items()
+                if status["state"] != "ready"
+            ]
+            self.state = "degraded" if failed else "ready"
+            if failed:
+                logger.warning(f"ChatBot warm-up finished with unavailable components: {failed}")
+        except Exception as e:
+            logger.exception(f"ChatBot warm-up failed: {e}")
+            self.state = "failed"
+            self.error = str(e)
+        finally:
+            self._finished_at = time.perf_counter()
+            logger.info(f"ChatBot warm-up finished in {self._finished_at - self._started_at:.2f}s (state: {self.state})")
+
+    @property
+    def ready(self) -> bool:
+        return self.state in ("ready", "degraded", "disabled")
+
+    def status(self) -> Dict[str, Any]:
+        elapsed = None
+        if self._started_at is not None:
+            elapsed = round((self._finished_at or time.perf_counter()) - self._started_at, 3)
+        instance = ChatBot._instance
+        components = dict(getattr(instance, "component_status", {}) or {}) if instance else {}
+        return {
+            "ready": self.ready,
+            "state": self.state,
+            "elapsed_seconds": elapsed,
+            "error": self.error,
+            "components": components,
+        }
+
+
+chatbot_warmup = ChatBotWarmup()
@@ -1,2 +1,15 @@
-from .config import OPENAI_API_KEY, VECTOR_DB, EMAIL_ADDRESS, EMAIL_PASSWORD
+from .config import OPENAI_API_KEY, VECTOR_DB, IMAGE_STORE_DIR, EMAIL_ADDRESS, EMAIL_PASSWORD, LLM_MAX_CONCURRENCY, REPORT_WORKER_COUNT
+from .config import RAG_CACHE_MAXSIZE, RAG_CACHE_TTL_SECONDS, EVENT_BULK_MAX_ITEMS, EVENT_BULK_BATCH_SIZE, EVENT_BULK_MAX_BYTES
 from .facman_application import FacmanApplication
+from .config import EVENT_WRITE_BUFFER_ENABLED, EVENT_WRITE_BUFFER_MAX_BATCH, EVENT_WRITE_BUFFER_FLUSH_MS, EVENT_WRITE_BUFFER_MAX_PENDING
+from .config import IMAGE_MAX_UPLOAD_BYTES, IMAGE_EXECUTOR, IMAGE_WORKERS
+from .config import CHATBOT_WARMUP_ON_STARTUP
+from .config import EMBEDDING_MODEL_NAME, EMBEDDING_SERVER_SOCKET, EMBEDDING_SERVER_MAX_BATCH, EMBEDDING_SERVER_BATCH_WAIT_MS
+from .config import EMBEDDING_BACKEND, EMBEDDING_ONNX_DIR, EMBEDDING_ONNX_QUANTIZED
+from .config import VECTOR_DB_SNAPSHOT_DIR, VECTOR_DB_SNAPSHOT_KEEP, VECTOR_DB_WATCH_INTERVAL_SECONDS, VECTOR_STORE_BACKEND
+from .config import HYBRID_SEARCH_ENABLED, HYBRID_RRF_K, HYBRID_CANDIDATE_MULTIPLIER
+from .config import RAG_CONTEXT_TOKEN_BUDGET, RAG_CONTEXT_DEDUP_THRESHOLD, RAG_CONTEXT_MIN_PASSAGE_TOKENS, RAG_CONTEXT_USE_SUMMARY
+from .config import ANSWER_CACHE_ENABLED, ANSWER_CACHE_MAXSIZE, ANSWER_CACHE_THRESHOLD
+from .config import RAG_PREFETCH_ENABLED, RAG_PREFETCH_DIR, RAG_PREFETCH_CACHE_SIZE, RAG_PREFETCH_QUEUE_SIZE, RAG_PREFETCH_TTL_SECONDS
+from .config import RAG_PREFETCH_MAX_FILES, RAG_PREFETCH_PRUNE_INTERVAL_SECONDS
+from .config import EVENT_INDEX_ENABLED, EVENT_INDEX_DIR, EVENT_INDEX_QUEUE_SIZE, EVENT_INDEX_BATCH_SIZE, EVENT_INDEX_SAVE_INTERVAL_SECONDS, EVENT_INDEX_EF_SEARCH
@@ -14,6 +14,40 @@
 #    - BASE_DIR: 프로젝트의 루트 디렉토리 경로 (config.py 위치 기준 계산).
 #    - VECTOR_DB_DIR: 벡터 데이터베이스 파일들이 저장될 디렉토리 경로.
 #    - VECTOR_DB: 실제 ChromaDB 데이터가 저장될 최종 경로.
+#    - IMAGE_STORE_DIR: 이벤트 이미지(JPEG 원본 바이트)를 sha256 기반 경로로 저장하는 blob 저장소 디렉토리.
+# 4. 성능 관련 설정:
+#    - LLM_MAX_CONCURRENCY: 동시에 진행할 수 있는 LLM(OpenAI) 호출 수의 상한 (업스트림 보호용).
+#    - REPORT_WORKER_COUNT: 보고서 생성/이메일 전송 백그라운드 작업을 처리하는 워커 수.
+#    - RAG_CACHE_MAXSIZE / RAG_CACHE_TTL_SECONDS: RAG 검색 결과 캐시의 최대 항목 수와 만료 시간(초).
+#    - HYBRID_SEARCH_ENABLED / HYBRID_RRF_K / HYBRID_CANDIDATE_MULTIPLIER: BM25 + 벡터 검색 RRF 결합 여부, RRF 상수, 결합 전 각 검색기의 후보 수 배수.
+#    - RAG_CONTEXT_TOKEN_BUDGET: 프롬프트에 넣을 RAG 컨텍스트의 최대 토큰 수 (0이면 제한 없음).
+#    - RAG_CONTEXT_DEDUP_THRESHOLD / RAG_CONTEXT_MIN_PASSAGE_TOKENS: 중복 구절 판정 유사도(문자 bigram Jaccard)와 잘라서라도 넣을 구절의 최소 토큰 수.
+#    - RAG_CONTEXT_USE_SUMMARY: 적재 시 저장한 문서 요약(메타데이터 summary)을 원문 대신 컨텍스트에 넣을지 여부 (요청에서 full_context=true면 원문).
+#    - RAG_PREFETCH_ENABLED: 이벤트 생성 시 백그라운드에서 RAG 검색을 미리 실행하고, 해결/보고서 요청 시 결과를 재사용할지 여부.
+#    - ANSWER_CACHE_ENABLED: 같은 유형의 유사한 이벤트에 대해 이전 AI 답변을 재사용하는 의미 기반 답변 캐시 사용 여부 (요청에서 refresh=true면 새로 생성).
+#    - ANSWER_CACHE_MAXSIZE / ANSWER_CACHE_THRESHOLD: 답변 캐시 최대 항목 수(초과 시 LRU 교체)와 재사용 기준 코사인 유사도.
+#    - RAG_PREFETCH_DIR / RAG_PREFETCH_CACHE_SIZE / RAG_PREFETCH_QUEUE_SIZE / RAG_PREFETCH_TTL_SECONDS: 결과 저장 디렉토리, 메모리 캐시 항목 수, 대기 큐 크기, 결과 유효 시간(초).
+#    - RAG_PREFETCH_MAX_FILES / RAG_PREFETCH_PRUNE_INTERVAL_SECONDS: 디스크에 보관할 최대 결과 파일 수(초과 시 오래된 것부터 삭제)와 만료 파일 정리 주기(초).
+#    - EVENT_INDEX_ENABLED: 이벤트 생성 시 type/value를 임베딩해 유사 과거 이벤트 검색용 HNSW 인덱스에 추가할지 여부 (GET /ai/local/event/{id}/similar).
+#    - EVENT_INDEX_DIR / EVENT_INDEX_QUEUE_SIZE / EVENT_INDEX_BATCH_SIZE: 인덱스 저장 디렉토리, 대기 큐 크기, 임베딩 배치 크기.
+#    - EVENT_INDEX_SAVE_INTERVAL_SECONDS / EVENT_INDEX_EF_SEARCH: 변경된 인덱스를 디스크에 저장하는 주기(초)와 HNSW 검색 후보 수(ef).
+#    - EVENT_BULK_MAX_ITEMS / EVENT_BULK_BATCH_SIZE: 일괄 이벤트 등록 요청당 최대 항목 수와 INSERT 문 하나에 담을 행 수.
+#    - EVENT_BULK_MAX_BYTES: 일괄 이벤트 등록 요청 본문 최대 크기 (초과 시 읽기를 중단하고 413).
+#    - EVENT_WRITE_BUFFER_ENABLED: 단건 이벤트 생성을 write-behind 버퍼(그룹 커밋)로 처리할지 여부.
+#    - EVENT_WRITE_BUFFER_MAX_BATCH / EVENT_WRITE_BUFFER_FLUSH_MS: 버퍼 플러시 기준 (건수 / 밀리초).
+#    - EVENT_WRITE_BUFFER_MAX_PENDING: 플러시를 기다리는 이벤트 수 상한 (초과 시 503으로 거절하여 DB 장애 시 메모리 증가 방지).
+#    - IMAGE_MAX_UPLOAD_BYTES: 업로드 이미지 최대 크기 (초과 시 413).
+#    - IMAGE_EXECUTOR / IMAGE_WORKERS: 이미지 전처리를 실행할 풀 종류(thread 또는 process)와 워커 수.
+#    - CHATBOT_WARMUP_ON_STARTUP: 서버 시작 시 ChatBot(임베딩 모델, 벡터 DB)을 백그라운드에서 미리 로드할지 여부.
+#    - EMBEDDING_MODEL_NAME: RAG 임베딩에 사용하는 HuggingFace 모델 이름.
+#    - EMBEDDING_BACKEND: 임베딩 실행 백엔드 (torch 또는 onnx). onnx는 vector_db/export_onnx_embedder.py로 내보낸 모델 사용.
+#    - EMBEDDING_ONNX_DIR / EMBEDDING_ONNX_QUANTIZED: ONNX 모델 디렉토리(비어 있으면 vector_db/onnx/<모델 이름>)와 int8 양자화 모델 사용 여부.
+#    - VECTOR_STORE_BACKEND: RAG 검색 백엔드 (chroma 또는 flat: 벡터 DB 디렉토리의 flat_index를 memory-mapped 정확 검색으로 사용).
+#    - VECTOR_DB_SNAPSHOT_DIR: 벡터 DB 스냅샷 루트 (CURRENT가 가리키는 스냅샷을 사용, 없으면 VECTOR_DB 사용).
+#    - VECTOR_DB_SNAPSHOT_KEEP: 새 스냅샷 게시 후 보관할 최근 스냅샷 수.
+#    - VECTOR_DB_WATCH_INTERVAL_SECONDS: CURRENT 변경을 감지해 벡터 DB를 다시 여는 감시 주기 (0이면 감시 안 함, 관리자 엔드포인트로만 교체).
+#    - EMBEDDING_SERVER_SOCKET: 공유 임베딩/검색 사이드카의 Unix 소켓 경로 (설정 시 워커는 모델을 직접 로드하지 않음).
+#    - EMBEDDING_SERVER_MAX_BATCH / EMBEDDING_SERVER_BATCH_WAIT_MS: 사이드카 마이크로배치 최대 크기와 대기 시간.
 #================================================================================#
 
 
@@ -30,5 +64,90 @@ VECTOR_DB_DIR = os.path.join(os.path.dirname(BASE_DIR), "vector_db")
 
 VECTOR_DB = os.path.join(VECTOR_DB_DIR, "chroma_db_from_json")
 
+# RAG 검색 백엔드 (chroma: sqlite + HNSW / flat: vector_db/flat_index.py의 memory-mapped 인덱스)
+VECTOR_STORE_BACKEND = os.getenv("VECTOR_STORE_BACKEND", "chroma").lower()
+
+# 버전별 벡터 DB 스냅샷 (vector_db/snapshots.py). 재구축 시 새 스냅샷을 만든 뒤 CURRENT를 원자적으로 교체
+VECTOR_DB_SNAPSHOT_DIR = os.getenv("VECTOR_DB_SNAPSHOT_DIR", os.path.join(VECTOR_DB_DIR, "chroma_snapshots"))
+VECTOR_DB_SNAPSHOT_KEEP = int(os.getenv("VECTOR_DB_SNAPSHOT_KEEP", "3"))
+VECTOR_DB_WATCH_INTERVAL_SECONDS = float(os.getenv("VECTOR_DB_WATCH_INTERVAL_SECONDS", "0"))
+
+IMAGE_STORE_DIR = os.getenv("IMAGE_STORE_DIR", os.path.join(os.path.dirname(BASE_DIR), "image_store"))
+
 EMAIL_ADDRESS = os.getenv("EMAIL_ADDRESS")
-EMAIL_PASSWORD = os.getenv("EMAIL_PASSWORD")
\ No newline at end of file
+EMAIL_PASSWORD = os.getenv("EMAIL_PASSWORD")
+
+# 동시에 진행할 수 있는 LLM 호출 수 (OpenAI 업스트림 보호용 세마포어 크기)
+LLM_MAX_CONCURRENCY = int(os.getenv("LLM_MAX_CONCURRENCY", "8"))
+
+# 보고서 생성 → PDF → 이메일 백그라운드 작업을 동시에 처리하는 워커 수
+REPORT_WORKER_COUNT = int(os.getenv("REPORT_WORKER_COUNT", "2"))
+
+# RAG 검색 결과 캐시 (LRU + TTL)
+RAG_CACHE_MAXSIZE = int(os.getenv("RAG_CACHE_MAXSIZE", "256"))
+RAG_CACHE_TTL_SECONDS = float(os.getenv("RAG_CACHE_TTL_SECONDS", "3600"))
+
+# 하이브리드 검색 (벡터 DB 디렉토리의 BM25 인덱스 + 벡터 검색, reciprocal rank fusion)
+HYBRID_SEARCH_ENABLED = os.getenv("HYBRID_SEARCH_ENABLED", "true").lower() in ("1", "true", "yes")
+HYBRID_RRF_K = int(os.getenv("HYBRID_RRF_K", "60"))
+HYBRID_CANDIDATE_MULTIPLIER = int(os.getenv("HYBRID_CANDIDATE_MULTIPLIER", "2"))
+
+# RAG 컨텍스트 토큰 예산 (순위순으로 담고, 중복 구절 제거 후 예산 초과분은 자르거나 제외)
+RAG_CONTEXT_TOKEN_BUDGET = int(os.getenv("RAG_CONTEXT_TOKEN_BUDGET", "1500"))
+RAG_CONTEXT_DEDUP_THRESHOLD = float(os.getenv("RAG_CONTEXT_DEDUP_THRESHOLD", "0.85"))
+RAG_CONTEXT_MIN_PASSAGE_TOKENS = int(os.getenv("RAG_CONTEXT_MIN_PASSAGE_TOKENS", "80"))
+RAG_CONTEXT_USE_SUMMARY = os.getenv("RAG_CONTEXT_USE_SUMMARY", "true").lower() in ("1", "true", "yes")
+
+# 의미 기반 답변 캐시 (event.type + value + 설명 임베딩, 같은 유형에서 threshold 이상이면 이전 답변 재사용)
+ANSWER_CACHE_ENABLED = os.getenv("ANSWER_CACHE_ENABLED", "false").lower() in ("1", "true", "yes")
+ANSWER_CACHE_MAXSIZE = int(os.getenv("ANSWER_CACHE_MAXSIZE", "2000"))
+ANSWER_CACHE_THRESHOLD = float(os.getenv("ANSWER_CACHE_THRESHOLD", "0.92"))
+
+# 이벤트 생성 시 RAG 검색 사전 계산 (이벤트 ID별로 메모리 + 디스크에 저장)
+RAG_PREFETCH_ENABLED = os.getenv("RAG_PREFETCH_ENABLED", "false").lower() in ("1", "true", "yes")
+RAG_PREFETCH_DIR = os.getenv("RAG_PREFETCH_DIR", os.path.join(os.path.dirname(BASE_DIR), "rag_prefetch"))
+RAG_PREFETCH_CACHE_SIZE = int(os.getenv("RAG_PREFETCH_CACHE_SIZE", "1024"))
+RAG_PREFETCH_QUEUE_SIZE = int(os.getenv("RAG_PREFETCH_QUEUE_SIZE", "1000"))
+RAG_PREFETCH_TTL_SECONDS = float(os.getenv("RAG_PREFETCH_TTL_SECONDS", str(7 * 24 * 3600)))
+RAG_PREFETCH_MAX_FILES = int(os.getenv("RAG_PREFETCH_MAX_FILES", "20000"))
+RAG_PREFETCH_PRUNE_INTERVAL_SECONDS = float(os.getenv("RAG_PREFETCH_PRUNE_INTERVAL_SECONDS", "600"))
+
+# 유사 과거 이벤트 검색용 이벤트 임베딩 인덱스 (hnswlib, 이벤트 생성 시 증분 추가)
+EVENT_INDEX_ENABLED = os.getenv("EVENT_INDEX_ENABLED", "false").lower() in ("1", "true", "yes")
+EVENT_INDEX_DIR = os.getenv("EVENT_INDEX_DIR", os.path.join(os.path.dirname(BASE_DIR), "event_index"))
+EVENT_INDEX_QUEUE_SIZE = int(os.getenv("EVENT_INDEX_QUEUE_SIZE", "10000"))
+EVENT_INDEX_BATCH_SIZE = int(os.getenv("EVENT_INDEX_BATCH_SIZE", "64"))
+EVENT_INDEX_SAVE_INTERVAL_SECONDS = float(os.getenv("EVENT_INDEX_SAVE_INTERVAL_SECONDS", "300"))
+EVENT_INDEX_EF_SEARCH = int(os.getenv("EVENT_INDEX_EF_SEARCH", "64"))
+
+# 일괄 이벤트 등록 (POST /create_events)
+EVENT_BULK_MAX_ITEMS = int(os.getenv("EVENT_BULK_MAX_ITEMS", "5000"))
+EVENT_BULK_BATCH_SIZE = int(os.getenv("EVENT_BULK_BATCH_SIZE", "500"))
+EVENT_BULK_MAX_BYTES = int(os.getenv("EVENT_BULK_MAX_BYTES", str(16 * 1024 * 1024)))
+
+# 단건 이벤트 생성 write-behind 버퍼 (그룹 커밋)
+EVENT_WRITE_BUFFER_ENABLED = os.getenv("EVENT_WRITE_BUFFER_ENABLED", "false").lower() in ("1", "true", "yes")
+EVENT_WRITE_BUFFER_MAX_BATCH = int(os.getenv("EVENT_WRITE_BUFFER_MAX_BATCH", "500"))
+EVENT_WRITE_BUFFER_FLUSH_MS = float(os.getenv("EVENT_WRITE_BUFFER_FLUSH_MS", "50"))
+EVENT_WRITE_BUFFER_MAX_PENDING = int(os.getenv("EVENT_WRITE_BUFFER_MAX_PENDING", "10000"))
+
+# 업로드 이미지 전처리 (이벤트 루프 밖에서 실행)
+IMAGE_MAX_UPLOAD_BYTES = int(os.getenv("IMAGE_MAX_UPLOAD_BYTES", str(25 * 1024 * 1024)))
+IMAGE_EXECUTOR = os.getenv("IMAGE_EXECUTOR", "thread").lower()
+IMAGE_WORKERS = int(os.getenv("IMAGE_WORKERS", "2"))
+
+# 서버 시작 시 ChatBot warm-up (readiness: GET /ai/local/ready)
+CHATBOT_WARMUP_ON_STARTUP = os.getenv("CHATBOT_WARMUP_ON_STARTUP", "true").lower() in ("1", "true", "yes")
+
+# RAG 임베딩 모델
+EMBEDDING_MODEL_NAME = os.getenv("EMBEDDING_MODEL_NAME", "snunlp/KR-SBERT-V40K-klueNLI-augSTS")
+
+# 임베딩 실행 백엔드 (torch: sentence-transformers / onnx: onnxruntime, 선택적으로 int8 양자화)
+EMBEDDING_BACKEND = os.getenv("EMBEDDING_BACKEND", "torch").lower()
+EMBEDDING_ONNX_DIR = os.getenv("EMBEDDING_ONNX_DIR", "")
+EMBEDDING_ONNX_QUANTIZED = os.getenv("EMBEDDING_ONNX_QUANTIZED", "false").lower() in ("1", "true", "yes")
+
+# 공유 임베딩/검색 사이드카 (python -m src.chatbot.embedding_server). 비어 있으면 워커가 직접 로드
+EMBEDDING_SERVER_SOCKET = os.getenv("EMBEDDING_SERVER_SOCKET", "")
+EMBEDDING_SERVER_MAX_BATCH = int(os.getenv("EMBEDDING_SERVER_MAX_BATCH", "32"))
+EMBEDDING_SERVER_BATCH_WAIT_MS = float(os.getenv("EMBEDDING_SERVER_BATCH_WAIT_MS", "5"))
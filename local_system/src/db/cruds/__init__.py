@@ -5,15 +5,26 @@
 
 # [ 주요 로직 흐름 ]
 # 1. 파이썬 인터프리터가 이 디렉토리를 패키지로 처리하도록 함.
-# 2. event_crud 모듈에서 이벤트 관련 CRUD 함수를 임포트.
+# 2. event_crud 모듈에서 이벤트 관련 CRUD 함수(이벤트 임베딩 인덱스 백필 및 유사 이벤트 조회용 포함)를 임포트.
 # 3. event_detail_crud 모듈에서 이벤트 상세 정보 관련 CRUD 함수를 임포트.
-# 4. solution_crud 모듈에서 해결 방안 CRUD 함수를 임포트.
-# 5. 결과적으로, 이 패키지를 임포트하면 여기에 임포트된 모든 함수들을 패키지 네임스페이스를 통해 직접 사용할 수 있게 됩니다.
+# 4. solution_crud 모듈에서 해결 방안 CRUD 함수(답변 캐시용 최근 해결 이벤트 조회 포함)를 임포트.
+# 5. report_job_crud 모듈에서 보고서 생성 작업(백그라운드 잡) CRUD 함수를 임포트.
+# 6. 결과적으로, 이 패키지를 임포트하면 여기에 임포트된 모든 함수들을 패키지 네임스페이스를 통해 직접 사용할 수 있게 됩니다.
 #    (예: import package.crud -> crud.create_event 사용 가능)
 #====================================================================================================#
 
 
-from .event_crud import create_event, get_event, get_events
+from .event_crud import (
+    create_event,
+    create_events_bulk,
+    get_event,
+    get_events,
+    get_event_list,
+    get_events_after_id,
+    get_event_list_by_ids,
+    encode_event_cursor,
+    decode_event_cursor,
+)
 from .event_detail_crud import (
     create_event_detail,
     get_event_detail,
@@ -24,4 +35,12 @@ from .solution_crud import (
     get_solution,
     update_solution,
     update_solution_complete,
+    get_recent_solved_events,
+)
+from .report_job_crud import (
+    UNFINISHED_REPORT_JOB_STATUSES,
+    create_report_job,
+    get_report_job,
+    get_unfinished_report_jobs,
+    update_report_job,
 )
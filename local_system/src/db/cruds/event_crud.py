@@ -1,13 +1,45 @@
+import base64
+import json
 import logging
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from typing import List, Optional
+from sqlalchemy import select, insert, or_, and_
+from sqlalchemy.orm import raiseload
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 from datetime import datetime
 
-from ..models import EventModel
+from ..models import EventModel, SolutionModel
 
 logger = logging.getLogger(__name__)
 
+def encode_event_cursor(time: datetime, event_id: int) -> str:
+    """
+    목록의 마지막 이벤트 (time, id)를 불투명한 커서 문자열로 인코딩합니다.
+    Args:
+        time: 마지막 이벤트의 발생 시간.
+        event_id: 마지막 이벤트의 ID.
+    Returns:
+        URL-safe base64 커서 문자열.
+    """
+    payload = json.dumps({"t": time.isoformat(), "id": event_id}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+def decode_event_cursor(cursor: str) -> Tuple[datetime, int]:
+    """
+    encode_event_cursor로 만든 커서를 (time, id)로 디코딩합니다.
+    Args:
+        cursor: 커서 문자열.
+    Returns:
+        (time, id) 튜플.
+    Raises:
+        ValueError: 커서 형식이 올바르지 않은 경우.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        return datetime.fromisoformat(payload["t"]), int(payload["id"])
+    except Exception as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
 async def create_event(db: AsyncSession, type: str, value: str) -> EventModel:
     """
     새로운 이벤트 레코드를 데이터베이스에 생성합니다.
@@ -32,6 +64,42 @@ async def create_event(db: AsyncSession, type: str, value: str) -> EventModel:
         await db.rollback() # 오류 발생 시 롤백
         raise # 예외를 다시 발생시켜 상위 계층에서 처리하도록 함
 
+async def create_events_bulk(
+    db: AsyncSession, events: List[Dict[str, Any]], batch_size: int = 500
+) -> List[int]:
+    """
+    여러 이벤트를 배치 단위의 다중 행 INSERT 문으로 생성하고 하나의 트랜잭션으로 커밋합니다.
+    Args:
+        db: SQLAlchemy AsyncSession 인스턴스.
+        events: type, value (선택: time) 키를 가진 dict 리스트.
+        batch_size: INSERT 문 하나에 담을 최대 행 수.
+    Returns:
+        입력 순서와 동일한 순서의 생성된 이벤트 ID 리스트.
+    Raises:
+        SQLAlchemyError: 데이터베이스 작업 중 오류 발생 시 (전체 롤백).
+    """
+    if not events:
+        return []
+    try:
+        now = datetime.now()
+        rows = [
+            {"type": event["type"], "value": event["value"], "time": event.get("time") or now}
+            for event in events
+        ]
+        # RETURNING + sort_by_parameter_order로 입력 순서와 동일한 순서의 ID를 받음 (MariaDB 10.5+)
+        stmt = insert(EventModel).returning(EventModel.id, sort_by_parameter_order=True)
+        ids: List[int] = []
+        for start in range(0, len(rows), batch_size):
+            result = await db.execute(stmt, rows[start:start + batch_size])
+            ids.extend(result.scalars().all())
+        await db.commit()
+        logger.info(f"Successfully created {len(ids)} events in bulk")
+        return ids
+    except Exception as e:
+        logger.exception(f"Failed to create {len(events)} events in bulk. Error: {e}")
+        await db.rollback()
+        raise
+
 async def get_event(db: AsyncSession, event_id: int) -> Optional[EventModel]:
     """
     주어진 ID에 해당하는 이벤트를 데이터베이스에서 조회합니다.
@@ -43,7 +111,11 @@ async def get_event(db: AsyncSession, event_id: int) -> Optional[EventModel]:
     """
     logger.debug(f"Fetching event with ID: {event_id}")
     try:
-        stmt = select(EventModel).filter(EventModel.id == event_id) # ID를 기준으로 EventModel 조회 쿼리 생성
+        stmt = ( # ID를 기준으로 EventModel 조회 쿼리 생성 (이미지가 포함된 관계는 로드하지 않음)
+            select(EventModel)
+            .options(raiseload(EventModel.event_details), raiseload(EventModel.solutions))
+            .filter(EventModel.id == event_id)
+        )
         result = await db.execute(stmt)     # 쿼리 실행 및 결과 가져오기
         event = result.scalar_one_or_none() # 단일 결과 반환 (없으면 None)
         if event:
@@ -69,8 +141,9 @@ async def get_events(
     """
     logger.debug(f"Fetching events with skip: {skip}, limit: {limit}")
     try:
-        stmt = ( # 시간(time) 기준 내림차순 정렬, offset, limit 적용 쿼리 생성
+        stmt = ( # 시간(time) 기준 내림차순 정렬, offset, limit 적용 쿼리 생성 (관계는 로드하지 않음)
             select(EventModel)
+            .options(raiseload(EventModel.event_details), raiseload(EventModel.solutions))
             .order_by(EventModel.time.desc())
             .offset(skip)
             .limit(limit)
@@ -82,3 +155,102 @@ async def get_events(
         logger.exception(f"Error fetching events with skip {skip}, limit {limit}: {e}")
         raise
 
+async def get_event_list(
+    db: AsyncSession,
+    skip: int = 0,
+    limit: int = 30,
+    include_status: bool = False,
+    after: Optional[Tuple[datetime, int]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    이벤트 목록 응답에 필요한 컬럼만 조회합니다 (event_details의 이미지 등 관계 데이터는 로드하지 않음).
+    정렬은 (time DESC, id DESC)이며 ix_events_time_id 인덱스를 사용합니다.
+    Args:
+        db: SQLAlchemy AsyncSession 인스턴스.
+        skip: 건너뛸 레코드 수 (기본값: 0). after가 주어지면 무시됩니다.
+        limit: 반환할 최대 레코드 수 (기본값: 30).
+        include_status: True이면 solutions 테이블을 같은 쿼리에서 outer join하여 해결 상태를 함께 조회.
+        after: (time, id) 커서. 주어지면 해당 이벤트 이후(더 과거)의 이벤트만 조회 (keyset 페이지네이션).
+    Returns:
+        id, type, value, time (및 include_status 시 has_solution, complete) 키를 가진 dict 리스트.
+    """
+    logger.debug(f"Fetching event list with skip: {skip}, limit: {limit}, include_status: {include_status}, after: {after}")
+    try:
+        stmt = select(EventModel.id, EventModel.type, EventModel.value, EventModel.time)
+        if include_status:
+            stmt = (
+                stmt.add_columns(
+                    SolutionModel.event_id.is_not(None).label("has_solution"),
+                    SolutionModel.complete,
+                )
+                .outerjoin(SolutionModel, SolutionModel.event_id == EventModel.id)
+            )
+        if after is not None:
+            after_time, after_id = after
+            stmt = stmt.filter(
+                or_(
+                    EventModel.time < after_time,
+                    and_(EventModel.time == after_time, EventModel.id < after_id),
+                )
+            )
+        else:
+            stmt = stmt.offset(skip)
+        stmt = stmt.order_by(EventModel.time.desc(), EventModel.id.desc()).limit(limit)
+        result = await db.execute(stmt)
+        return [dict(row) for row in result.mappings().all()]
+    except Exception as e:
+        logger.exception(f"Error fetching event list with skip {skip}, limit {limit}, after {after}: {e}")
+        raise
+
+async def get_events_after_id(db: AsyncSession, after_id: int, limit: int) -> List[Dict[str, Any]]:
+    """
+    주어진 ID보다 큰 이벤트의 id, type, value를 ID 오름차순으로 조회합니다 (이벤트 임베딩 인덱스 백필용).
+    Args:
+        db: SQLAlchemy AsyncSession 인스턴스.
+        after_id: 이 ID 이후의 이벤트만 조회 (keyset 페이지네이션).
+        limit: 반환할 최대 레코드 수.
+    Returns:
+        id, type, value 키를 가진 dict 리스트.
+    """
+    try:
+        stmt = (
+            select(EventModel.id, EventModel.type, EventModel.value)
+            .filter(EventModel.id > after_id)
+            .order_by(EventModel.id)
+            .limit(limit)
+        )
+        result = await db.execute(stmt)
+        return [dict(row) for row in result.mappings().all()]
+    except Exception as e:
+        logger.exception(f"Error fetching events after ID {after_id}: {e}")
+        raise
+
+async def get_event_list_by_ids(db: AsyncSession, event_ids: Sequence[int]) -> List[Dict[str, Any]]:
+    """
+    주어진 ID들의 이벤트 목록 항목을 해결 상태와 함께 조회합니다 (유사 이벤트 응답용, 순서는 보장하지 않음).
+    Args:
+        db: SQLAlchemy AsyncSession 인스턴스.
+        event_ids: 조회할 이벤트 ID 목록.
+    Returns:
+        id, type, value, time, has_solution, complete 키를 가진 dict 리스트.
+    """
+    if not event_ids:
+        return []
+    try:
+        stmt = (
+            select(
+                EventModel.id,
+                EventModel.type,
+                EventModel.value,
+                EventModel.time,
+                SolutionModel.event_id.is_not(None).label("has_solution"),
+                SolutionModel.complete,
+            )
+            .outerjoin(SolutionModel, SolutionModel.event_id == EventModel.id)
+            .filter(EventModel.id.in_(event_ids))
+        )
+        result = await db.execute(stmt)
+        return [dict(row) for row in result.mappings().all()]
+    except Exception as e:
+        logger.exception(f"Error fetching events by IDs {list(event_ids)[:10]}: {e}")
+        raise
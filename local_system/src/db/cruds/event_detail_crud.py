@@ -8,14 +8,15 @@ from ..models import EventDetailModel
 logger = logging.getLogger(__name__)
 
 async def create_event_detail(
-    db: AsyncSession, event_id: int, file: str, explain: str
+    db: AsyncSession, event_id: int, image_hash: str, image_size: int, explain: str
 ) -> EventDetailModel:
     """
     새로운 이벤트 상세 정보 레코드를 데이터베이스에 생성합니다.
     Args:
         db: SQLAlchemy AsyncSession 인스턴스.
         event_id: 연결될 이벤트의 ID.
-        file: Base64 인코딩된 이미지 파일 문자열.
+        image_hash: image_store에 저장된 이미지의 sha256 해시.
+        image_size: 이미지 바이트 크기.
         explain: 이벤트에 대한 설명 문자열.
     Returns:
         생성된 EventDetailModel 객체.
@@ -24,7 +25,9 @@ async def create_event_detail(
     """
     logger.info(f"Creating event detail for event ID: {event_id}")
     try:
-        db_event_detail = EventDetailModel(event_id=event_id, file=file, explain=explain)
+        db_event_detail = EventDetailModel(
+            event_id=event_id, image_hash=image_hash, image_size=image_size, explain=explain
+        )
         db.add(db_event_detail)
         await db.commit()
         # 생성된 객체 새로고침
@@ -67,7 +70,7 @@ async def get_event_detail(
         raise
 
 async def update_event_detail(
-    db: AsyncSession, event_id: int, file: str, explain: str
+    db: AsyncSession, event_id: int, image_hash: str, image_size: int, explain: str
 ) -> Optional[EventDetailModel]:
     """
     기존 이벤트 상세 정보 레코드를 업데이트합니다.
@@ -75,7 +78,8 @@ async def update_event_detail(
     Args:
         db: SQLAlchemy AsyncSession 인스턴스.
         event_id: 업데이트할 이벤트 상세 정보의 이벤트 ID.
-        file: 업데이트할 Base64 인코딩된 이미지 파일 문자열.
+        image_hash: image_store에 저장된 새 이미지의 sha256 해시.
+        image_size: 새 이미지 바이트 크기.
         explain: 업데이트할 이벤트 설명 문자열.
 
     Returns:
@@ -92,7 +96,9 @@ async def update_event_detail(
         if event_detail:
             logger.debug(f"Found event detail for update. Updating fields for event ID: {event_id}")
             # 필드 업데이트
-            event_detail.file = file
+            event_detail.image_hash = image_hash
+            event_detail.image_size = image_size
+            event_detail.file = None # 레거시 Base64 데이터 제거
             event_detail.explain = explain
             # 변경사항 커밋
             await db.commit()
@@ -0,0 +1,118 @@
+import logging
+import uuid
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select
+from typing import List, Optional
+
+from ..models import ReportJobModel
+
+logger = logging.getLogger(__name__)
+
+# 재시작 시 다시 큐에 넣어야 하는(종료되지 않은) 작업 상태
+UNFINISHED_REPORT_JOB_STATUSES = ("queued", "generating", "rendering", "sending")
+
+async def create_report_job(db: AsyncSession, event_id: int, email: str) -> ReportJobModel:
+    """
+    새로운 보고서 생성 작업 레코드를 'queued' 상태로 생성합니다.
+    Args:
+        db: SQLAlchemy AsyncSession 인스턴스.
+        event_id: 보고서 대상 이벤트의 ID.
+        email: 보고서를 받을 이메일 주소.
+    Returns:
+        생성된 ReportJobModel 객체.
+    Raises:
+        SQLAlchemyError: 데이터베이스 작업 중 오류 발생 시.
+    """
+    try:
+        db_job = ReportJobModel(id=uuid.uuid4().hex, event_id=event_id, email=email, status="queued", attempts=0)
+        db.add(db_job)
+        await db.commit()
+        await db.refresh(db_job)
+        logger.info(f"Successfully created report job {db_job.id} for event ID: {event_id}")
+        return db_job
+    except Exception as e:
+        logger.exception(f"Failed to create report job for event ID {event_id}. Error: {e}")
+        await db.rollback()
+        raise
+
+async def get_report_job(db: AsyncSession, job_id: str) -> Optional[ReportJobModel]:
+    """
+    주어진 ID에 해당하는 보고서 생성 작업을 조회합니다.
+    Args:
+        db: SQLAlchemy AsyncSession 인스턴스.
+        job_id: 조회할 작업의 ID.
+    Returns:
+        조회된 ReportJobModel 객체 또는 찾지 못한 경우 None.
+    """
+    try:
+        stmt = select(ReportJobModel).filter(ReportJobModel.id == job_id)
+        result = await db.execute(stmt)
+        return result.scalar_one_or_none()
+    except Exception as e:
+        logger.exception(f"Error fetching report job {job_id}: {e}")
+        raise
+
+async def get_unfinished_report_jobs(db: AsyncSession) -> List[ReportJobModel]:
+    """
+    완료/실패하지 않은 보고서 생성 작업을 생성 시간 순으로 조회합니다 (재시작 시 복구용).
+    Args:
+        db: SQLAlchemy AsyncSession 인스턴스.
+    Returns:
+        조회된 ReportJobModel 객체의 리스트.
+    """
+    try:
+        stmt = (
+            select(ReportJobModel)
+            .filter(ReportJobModel.status.in_(UNFINISHED_REPORT_JOB_STATUSES))
+            .order_by(ReportJobModel.created_at.asc())
+        )
+        result = await db.execute(stmt)
+        return list(result.scalars().all())
+    except Exception as e:
+        logger.exception(f"Error fetching unfinished report jobs: {e}")
+        raise
+
+async def update_report_job(
+    db: AsyncSession,
+    job_id: str,
+    status: Optional[str] = None,
+    report_content: Optional[str] = None,
+    error: Optional[str] = None,
+    increment_attempts: bool = False,
+) -> Optional[ReportJobModel]:
+    """
+    보고서 생성 작업의 상태 및 결과 필드를 업데이트합니다. (None인 인자는 변경하지 않음)
+    Args:
+        db: SQLAlchemy AsyncSession 인스턴스.
+        job_id: 업데이트할 작업의 ID.
+        status: 변경할 작업 상태.
+        report_content: 저장할 보고서 내용.
+        error: 저장할 오류 메시지.
+        increment_attempts: True이면 시도 횟수를 1 증가.
+    Returns:
+        업데이트된 ReportJobModel 객체 또는 해당 ID의 레코드가 없는 경우 None.
+    Raises:
+        SQLAlchemyError: 데이터베이스 작업 중 오류 발생 시.
+    """
+    try:
+        job = await get_report_job(db, job_id)
+        if not job:
+            logger.warning(f"Report job {job_id} not found. Cannot update.")
+            return None
+
+        if status is not None:
+            job.status = status
+        if report_content is not None:
+            job.report_content = report_content
+        if error is not None:
+            job.error = error
+        if increment_attempts:
+            job.attempts = (job.attempts or 0) + 1
+        await db.commit()
+        await db.refresh(job)
+        logger.debug(f"Report job {job_id} updated (status: {job.status})")
+        return job
+    except Exception as e:
+        logger.exception(f"Failed to update report job {job_id}. Error: {e}")
+        await db.rollback()
+        raise
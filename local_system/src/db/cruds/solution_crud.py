@@ -1,9 +1,9 @@
 import logging
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
-from typing import Optional
+from typing import Any, Dict, List, Optional
 
-from ..models import SolutionModel
+from ..models import EventDetailModel, EventModel, SolutionModel
 
 logger = logging.getLogger(__name__)
 
@@ -119,3 +119,30 @@ async def update_solution_complete(
         logger.exception(f"Failed to update solution complete status for event ID {event_id}. Error: {e}")
         await db.rollback() # 오류 발생 시 롤백
         raise # 예외를 다시 발생시켜 상위 계층에서 처리하도록 함
+
+async def get_recent_solved_events(db: AsyncSession, limit: int) -> List[Dict[str, Any]]:
+    """
+    해결 방안이 있는 최근 이벤트를 (이벤트 ID, 유형, 내용, 사용자 설명, 답변) 형태로 최신순 조회합니다.
+    의미 기반 답변 캐시(answer_cache)를 서버 시작 시 채우는 데 사용됩니다.
+    Args:
+        db: SQLAlchemy AsyncSession 인스턴스.
+        limit: 최대 조회 건수.
+    Returns:
+        {"event_id", "type", "value", "explain", "answer"} 딕셔너리 리스트.
+    """
+    try:
+        stmt = (
+            select(EventModel.id, EventModel.type, EventModel.value, EventDetailModel.explain, SolutionModel.answer)
+            .join(SolutionModel, SolutionModel.event_id == EventModel.id)
+            .join(EventDetailModel, EventDetailModel.event_id == EventModel.id)
+            .order_by(EventModel.time.desc(), EventModel.id.desc())
+            .limit(limit)
+        )
+        result = await db.execute(stmt)
+        return [
+            {"event_id": row.id, "type": row.type, "value": row.value, "explain": row.explain, "answer": row.answer}
+            for row in result
+        ]
+    except Exception as e:
+        logger.exception(f"Error fetching recent solved events: {e}")
+        raise
@@ -1,3 +1,4 @@
 from .event_model import EventModel
 from .event_detail_model import EventDetailModel
 from .solution_model import SolutionModel
+from .report_job_model import ReportJobModel
@@ -1,5 +1,5 @@
-from sqlalchemy import Column, Integer, Text, ForeignKey
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, String, Text, ForeignKey
+from sqlalchemy.orm import relationship, deferred
 from ..database import Base
 
 
@@ -18,11 +18,25 @@ class EventDetailModel(Base):
         comment="참조하는 이벤트의 ID (PK, FK)"
     )
     
-    file = Column(
-        Text(length=16777215),
-        nullable=False,
-        comment="이벤트 관련 이미지 (Base64 인코딩된 문자열)"
+    image_hash = Column(
+        String(64),
+        nullable=True,
+        comment="이벤트 관련 이미지(JPEG)의 sha256 해시 (image_store blob 저장소 키)"
     )
+
+    image_size = Column(
+        Integer,
+        nullable=True,
+        comment="이벤트 관련 이미지의 바이트 크기"
+    )
+
+    # (레거시) Base64 이미지 문자열. image_store_migration.py로 blob 저장소로 이전된 후에는 NULL.
+    # 일반 조회 시 로드되지 않도록 deferred 처리
+    file = deferred(Column(
+        Text(length=16777215),
+        nullable=True,
+        comment="(레거시) 이벤트 관련 이미지 (Base64 인코딩된 문자열)"
+    ))
     
     explain = Column(
         Text,
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, DateTime, Text
+from sqlalchemy import Column, Integer, DateTime, Text, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 
@@ -11,6 +11,11 @@ class EventModel(Base):
     EventDetailModel 및 SolutionModel과 관계를 가집니다.
     """
     __tablename__ = "events"
+    __table_args__ = (
+        # 목록 조회의 정렬 키 (time DESC, id DESC) 및 커서(keyset) 페이지네이션용 복합 인덱스
+        # (기존 데이터베이스에는 python -m src.event_index_migration 으로 추가)
+        Index("ix_events_time_id", "time", "id"),
+    )
 
     id = Column(
         Integer,
@@ -35,8 +40,7 @@ class EventModel(Base):
         DateTime,
         default=datetime.now,
         nullable=False,
-        index=True,
-        comment="이벤트 발생 시간"
+        comment="이벤트 발생 시간 (ix_events_time_id 복합 인덱스의 선두 컬럼)"
     )
 
     event_details = relationship(
@@ -0,0 +1,77 @@
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey
+from datetime import datetime
+
+from ..database import Base
+
+
+class ReportJobModel(Base):
+    """
+    보고서 생성 및 이메일 전송 작업(백그라운드 잡)을 나타내는 SQLAlchemy 모델 클래스.
+    작업 상태를 DB에 저장하여 서버 재시작 시에도 대기 중인 작업을 이어서 처리할 수 있습니다.
+    """
+    __tablename__ = "report_jobs"
+
+    id = Column(
+        String(32),
+        primary_key=True,
+        comment="작업 고유 식별자 (UUID hex, PK)"
+    )
+
+    event_id = Column(
+        Integer,
+        ForeignKey("events.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+        comment="보고서 대상 이벤트의 ID (FK)"
+    )
+
+    email = Column(
+        String(320),
+        nullable=False,
+        comment="보고서를 받을 이메일 주소"
+    )
+
+    status = Column(
+        String(20),
+        nullable=False,
+        default="queued",
+        index=True, # 재시작 시 미완료 작업 조회용
+        comment="작업 상태 (queued, generating, rendering, sending, completed, failed)"
+    )
+
+    report_content = Column(
+        Text,
+        nullable=True,
+        comment="AI가 생성한 보고서 내용 (생성 단계 완료 후 저장)"
+    )
+
+    error = Column(
+        Text,
+        nullable=True,
+        comment="작업 실패 시 오류 메시지"
+    )
+
+    attempts = Column(
+        Integer,
+        nullable=False,
+        default=0,
+        comment="작업 실행 시도 횟수"
+    )
+
+    created_at = Column(
+        DateTime,
+        default=datetime.now,
+        nullable=False,
+        comment="작업 생성 시간"
+    )
+
+    updated_at = Column(
+        DateTime,
+        default=datetime.now,
+        onupdate=datetime.now,
+        nullable=False,
+        comment="작업 상태 마지막 변경 시간"
+    )
+
+    def __repr__(self):
+        return f"<ReportJob(id={self.id}, event_id={self.event_id}, status='{self.status}')>"
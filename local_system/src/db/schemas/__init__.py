@@ -4,9 +4,15 @@ from .event_schema import (
     EventUpdate,
     EventInDB,
     EventResponse,
+    EventListItem,
     EventsResponse,
+    SimilarEventItem,
+    SimilarEventsResponse,
     SolveEventResponse,
-    ReportResponse
+    ReportResponse,
+    BulkEventCreated,
+    BulkEventError,
+    BulkEventCreateResponse,
 )
 from .event_detail_schema import (
     EventDetailBase,
@@ -25,3 +31,4 @@ from .solution_schema import (
     EventCompleteRequest,
     EventCompleteResponse
 )
+from .report_job_schema import ReportJobResponse
@@ -6,7 +6,8 @@ orm_config = ConfigDict(from_attributes=True)
 class EventDetailBase(BaseModel):
     """이벤트 상세 정보의 기본 필드를 정의하는 스키마."""
     event_id: int = Field(..., description="관련 이벤트의 고유 ID", example=1)
-    file: str = Field(..., description="Base64로 인코딩된 이미지 데이터 문자열")
+    image_hash: Optional[str] = Field(None, description="이미지(JPEG)의 sha256 해시 (image_store 키)")
+    image_size: Optional[int] = Field(None, description="이미지 바이트 크기")
     explain: str = Field(..., description="이벤트에 대한 사용자 설명", 
                          example="일부 생산라인에 화재가 발생하여 공장 전체에 정전이 발생했습니다.")
 
@@ -19,7 +20,8 @@ class EventDetailCreate(EventDetailBase):
 
 class EventDetailUpdate(BaseModel):
     """이벤트 상세 정보 업데이트를 위한 스키마."""
-    file: Optional[str] = Field(None, description="업데이트할 Base64 인코딩 이미지 데이터 문자열")
+    image_hash: Optional[str] = Field(None, description="업데이트할 이미지의 sha256 해시")
+    image_size: Optional[int] = Field(None, description="업데이트할 이미지 바이트 크기")
     explain: Optional[str] = Field(None, min_length=1, description="업데이트할 이벤트 설명 (최소 1자 이상)")
 
 class EventDetailInDB(EventDetailBase):
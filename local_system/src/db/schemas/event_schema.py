@@ -30,15 +30,48 @@ class EventResponse(EventInDB):
     """API 응답으로 사용될 이벤트 정보 스키마."""
     pass
 
+class EventListItem(EventResponse):
+    """이벤트 목록의 각 항목 스키마. 해결 상태는 include_status 요청 시에만 채워집니다."""
+    has_solution: Optional[bool] = Field(None, description="AI 해결 방안 존재 여부 (include_status=true일 때만 제공)")
+    complete: Optional[bool] = Field(None, description="이벤트 해결 완료 여부 (include_status=true이고 해결 방안이 있을 때만 제공)")
+
 class EventsResponse(BaseModel):
     """이벤트 목록 API 응답을 위한 스키마."""
-    events: List[EventResponse] = Field(..., description="이벤트 객체의 리스트")
+    events: List[EventListItem] = Field(..., description="이벤트 객체의 리스트")
+    next_cursor: Optional[str] = Field(None, description="다음 페이지 조회용 커서 (cursor 파라미터로 전달, 마지막 페이지이면 null)")
+
+class SimilarEventItem(EventListItem):
+    """유사 과거 이벤트 항목 스키마. 해결 상태(has_solution, complete)는 항상 채워집니다."""
+    similarity: float = Field(..., description="기준 이벤트와의 type/value 임베딩 코사인 유사도")
+
+class SimilarEventsResponse(BaseModel):
+    """유사 과거 이벤트 조회 API 응답 스키마."""
+    event_id: int = Field(..., description="기준 이벤트 ID")
+    similar: List[SimilarEventItem] = Field(..., description="기준 이벤트보다 먼저 발생한 유사 이벤트 (유사도 내림차순)")
 
 class SolveEventResponse(BaseModel):
     """이벤트 해결 정보 제출 API의 응답 스키마."""
     event_id: int = Field(..., description="처리된 이벤트의 ID")
     answer: str = Field(..., description="AI가 생성한 분석 및 해결 방안")
+    cached: bool = Field(False, description="유사한 이전 이벤트의 답변을 재사용했는지 여부 (refresh=true로 다시 요청하면 새로 생성)")
+    cached_from_event_id: Optional[int] = Field(None, description="재사용한 답변의 원래 이벤트 ID (cached=true일 때만 제공)")
+    similarity: Optional[float] = Field(None, description="재사용한 이벤트와의 코사인 유사도 (cached=true일 때만 제공)")
 
 class ReportResponse(BaseModel):
     """이벤트 보고서 생성 및 이메일 전송 API의 응답 스키마."""
-    answer: str = Field(..., description="AI가 생성한 보고서 내용")
\ No newline at end of file
+    answer: str = Field(..., description="AI가 생성한 보고서 내용")
+
+class BulkEventCreated(BaseModel):
+    """일괄 이벤트 등록에서 생성에 성공한 항목."""
+    index: int = Field(..., description="요청 배열(또는 NDJSON 줄)에서의 항목 위치 (0부터 시작)")
+    id: int = Field(..., description="생성된 이벤트 ID")
+
+class BulkEventError(BaseModel):
+    """일괄 이벤트 등록에서 검증에 실패한 항목."""
+    index: int = Field(..., description="요청 배열(또는 NDJSON 줄)에서의 항목 위치 (0부터 시작)")
+    detail: str = Field(..., description="검증 오류 내용")
+
+class BulkEventCreateResponse(BaseModel):
+    """일괄 이벤트 등록 API의 응답 스키마."""
+    created: List[BulkEventCreated] = Field(..., description="생성된 이벤트 목록 (요청 순서)")
+    errors: List[BulkEventError] = Field(..., description="검증에 실패하여 제외된 항목 목록")
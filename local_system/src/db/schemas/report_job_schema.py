@@ -0,0 +1,18 @@
+from pydantic import BaseModel, ConfigDict, Field
+from datetime import datetime
+from typing import Optional
+
+orm_config = ConfigDict(from_attributes=True)
+
+class ReportJobResponse(BaseModel):
+    """보고서 생성 작업의 상태를 나타내는 API 응답 스키마."""
+    id: str = Field(..., description="작업 고유 ID", example="3f2b9c0e8a1d4e6f9b7c5a3d1e0f2a4b")
+    event_id: int = Field(..., description="보고서 대상 이벤트의 ID", example=1)
+    email: str = Field(..., description="보고서를 받을 이메일 주소")
+    status: str = Field(..., description="작업 상태 (queued, generating, rendering, sending, completed, failed)", example="queued")
+    error: Optional[str] = Field(None, description="작업 실패 시 오류 메시지")
+    attempts: int = Field(..., description="작업 실행 시도 횟수")
+    created_at: datetime = Field(..., description="작업 생성 시간")
+    updated_at: datetime = Field(..., description="작업 상태 마지막 변경 시간")
+
+    model_config = orm_config
@@ -0,0 +1,50 @@
+#-----------------------------------------------------------------------------------------#
+# [ 파일 개요 ]
+# 기존 데이터베이스의 events 테이블에 목록 조회용 복합 인덱스(ix_events_time_id)를 추가합니다.
+# 새 데이터베이스는 db_migration.py(create_all)로 만들 때 생성되지만, 이미 운영 중인 테이블에는 create_all이 인덱스를 추가하지 않으므로
+# 이 스크립트를 한 번 실행해야 GET /ai/local/events의 (time DESC, id DESC) 정렬과 커서(keyset) 조회가 인덱스를 사용합니다.
+# 여러 번 실행해도 안전합니다.
+
+# [ 주요 로직 흐름 ]
+# 1. 스키마 보정: ix_events_time_id (time, id) 인덱스가 없으면 생성 (MariaDB).
+#    기존 단일 컬럼 time 인덱스(ix_events_time)는 복합 인덱스의 선두 컬럼과 중복되지만 그대로 둡니다.
+
+# [ 사용법 ]
+#   python -m src.event_index_migration
+#-----------------------------------------------------------------------------------------#
+
+import asyncio
+import logging
+
+from sqlalchemy import text
+
+from .db.database import async_engine
+
+logger = logging.getLogger(__name__)
+
+SCHEMA_STATEMENTS = (
+    "CREATE INDEX IF NOT EXISTS ix_events_time_id ON events (time, id)",
+)
+
+
+async def ensure_schema():
+    async with async_engine.begin() as conn:
+        for statement in SCHEMA_STATEMENTS:
+            await conn.execute(text(statement))
+
+
+async def run():
+    try:
+        await ensure_schema()
+        logger.info("Event index migration completed (ix_events_time_id).")
+    finally:
+        await async_engine.dispose()
+
+
+def main():
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+#-----------------------------------------------------------------------------------------#
+# [ 파일 개요 ]
+# event_details.file 컬럼(Base64 MEDIUMTEXT)에 저장된 기존 이미지를 content-addressed blob 저장소(image_store)로 이전합니다.
+# 이전된 행은 image_hash / image_size만 남기고 file 컬럼을 NULL로 비웁니다. 여러 번 실행해도 안전합니다.
+
+# [ 주요 로직 흐름 ]
+# 1. 스키마 보정: event_details에 image_hash / image_size 컬럼이 없으면 추가하고, file 컬럼을 NULL 허용으로 변경 (MariaDB).
+# 2. 아직 이전되지 않은 행(image_hash IS NULL AND file IS NOT NULL)을 event_id 순으로 batch 단위 조회.
+# 3. 각 행의 Base64를 디코딩하여 image_store에 저장하고, 해시/크기를 기록한 뒤 file을 NULL로 변경.
+# 4. batch마다 커밋하여 중단되더라도 다음 실행에서 남은 행부터 이어서 처리.
+
+# [ 사용법 ]
+#   python -m src.image_store_migration [--batch-size 100]
+#-----------------------------------------------------------------------------------------#
+
+import argparse
+import asyncio
+import base64
+import logging
+
+from sqlalchemy import select, text, update
+
+from .db.database import AsyncSessionLocal, async_engine
+from .db.models import EventDetailModel
+from .utils.blob_store import image_store
+
+logger = logging.getLogger(__name__)
+
+SCHEMA_STATEMENTS = (
+    "ALTER TABLE event_details ADD COLUMN IF NOT EXISTS image_hash VARCHAR(64) NULL",
+    "ALTER TABLE event_details ADD COLUMN IF NOT EXISTS image_size INT NULL",
+    "ALTER TABLE event_details MODIFY COLUMN file MEDIUMTEXT NULL",
+)
+
+
+async def ensure_schema():
+    async with async_engine.begin() as conn:
+        for statement in SCHEMA_STATEMENTS:
+            await conn.execute(text(statement))
+
+
+async def migrate_images(batch_size: int = 100) -> int:
+    migrated = 0
+    last_event_id = 0
+    while True:
+        async with AsyncSessionLocal() as db:
+            stmt = (
+                select(EventDetailModel.event_id, EventDetailModel.file)
+                .filter(
+                    EventDetailModel.event_id > last_event_id,
+                    EventDetailModel.image_hash.is_(None),
+                    EventDetailModel.file.is_not(None),
+                )
+                .order_by(EventDetailModel.event_id)
+                .limit(batch_size)
+            )
+            rows = (await db.execute(stmt)).all()
+            if not rows:
+                break
+
+            for event_id, file in rows:
+                last_event_id = event_id
+                try:
+                    image_bytes = base64.b64decode(file)
+                except Exception as e:
+                    logger.error(f"Skipping event ID {event_id}: invalid Base64 image data ({e})")
+                    continue
+                image_hash, image_size = await asyncio.to_thread(image_store.put, image_bytes)
+                await db.execute(
+                    update(EventDetailModel)
+                    .where(EventDetailModel.event_id == event_id)
+                    .values(image_hash=image_hash, image_size=image_size, file=None)
+                )
+                migrated += 1
+            await db.commit()
+            logger.info(f"Migrated {migrated} images so far (last event ID: {last_event_id})")
+    return migrated
+
+
+async def run(batch_size: int):
+    try:
+        await ensure_schema()
+        migrated = await migrate_images(batch_size)
+        logger.info(f"Image store migration completed. {migrated} images moved to {image_store.root}")
+    finally:
+        await async_engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Move event_details.file Base64 images into the content-addressed image store.")
+    parser.add_argument("--batch-size", type=int, default=100, help="한 번에 이전할 행 수 (기본값: 100)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(run(args.batch_size))
+
+
+if __name__ == "__main__":
+    main()
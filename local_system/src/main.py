@@ -1,10 +1,66 @@
+import asyncio
+import logging
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from .api.router import router
+from .core.config import EVENT_WRITE_BUFFER_ENABLED, CHATBOT_WARMUP_ON_STARTUP, VECTOR_DB_WATCH_INTERVAL_SECONDS, RAG_PREFETCH_ENABLED
+from .core.config import ANSWER_CACHE_ENABLED, EVENT_INDEX_ENABLED
+from .chatbot import chatbot_warmup, vector_store_watcher, rag_prefetcher
+from .services.report_job_service import report_job_worker
+from .services.event_write_buffer import event_write_buffer
+from .services.event_index_service import event_indexer
+from .services.event_service import load_answer_cache_service
+from .utils import shutdown_image_executor
 # db_migration.py 모듈 가져오기
 from .db_migration import main as db_main
 
-app = FastAPI()
+logger = logging.getLogger(__name__)
+
+
+async def _load_answer_cache():
+    try:
+        await load_answer_cache_service()
+    except Exception as e:
+        logger.exception(f"Failed to load answer cache: {e}")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 임베딩 모델 / 벡터 DB / LLM 클라이언트를 백그라운드 스레드에서 미리 로드 (GET /ai/local/ready로 상태 확인)
+    if CHATBOT_WARMUP_ON_STARTUP:
+        chatbot_warmup.start()
+    else:
+        chatbot_warmup.disable()
+    # 보고서 생성 백그라운드 워커 시작 (미완료 작업 복구 포함)
+    await report_job_worker.start()
+    # 단건 이벤트 생성 그룹 커밋 버퍼 (옵션)
+    if EVENT_WRITE_BUFFER_ENABLED:
+        await event_write_buffer.start()
+    # 새 벡터 DB 스냅샷 게시 감지 시 자동 교체 (옵션, POST /ai/local/vector_store/reload로도 가능)
+    if VECTOR_DB_WATCH_INTERVAL_SECONDS > 0:
+        await vector_store_watcher.start(VECTOR_DB_WATCH_INTERVAL_SECONDS)
+    # 이벤트 생성 시 RAG 검색 사전 계산 (옵션)
+    if RAG_PREFETCH_ENABLED:
+        await rag_prefetcher.start()
+    # 유사 이벤트 답변 캐시를 최근 해결된 이벤트로 채움 (옵션, 임베딩 모델 로드를 기다리므로 백그라운드 실행)
+    answer_cache_task = asyncio.create_task(_load_answer_cache()) if ANSWER_CACHE_ENABLED else None
+    # 유사 과거 이벤트 검색용 이벤트 임베딩 인덱스 (옵션, 저장된 인덱스 이후의 이벤트는 백그라운드에서 백필)
+    if EVENT_INDEX_ENABLED:
+        await event_indexer.start()
+    yield
+    if answer_cache_task:
+        answer_cache_task.cancel()
+    await event_indexer.stop()
+    await rag_prefetcher.stop()
+    await vector_store_watcher.stop()
+    # 종료 시 버퍼에 남은 이벤트를 모두 저장한 뒤 종료
+    await event_write_buffer.stop()
+    await report_job_worker.stop()
+    shutdown_image_executor()
+
+
+app = FastAPI(lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
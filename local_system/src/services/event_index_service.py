@@ -0,0 +1,202 @@
+#-----------------------------------------------------------------------------------------#
+# [ 파일 개요 ]
+# 생성된 이벤트의 type/value를 백그라운드에서 임베딩해 이벤트 임베딩 인덱스(chatbot.event_index.EventEmbeddingIndex)에
+# 증분 추가하는 EventIndexer를 정의합니다. 유사 과거 이벤트 조회(GET /ai/local/event/{id}/similar)는 이 인덱스를 사용합니다.
+
+# [ 주요 로직 흐름 ]
+# 1. start(): EVENT_INDEX_DIR에 저장된 인덱스를 열고 백그라운드 태스크 시작.
+# 2. 백필: 저장된 indexed_through 이후의 이벤트(처음이면 전체)를 DB에서 ID 순으로 읽어 배치 임베딩 후 추가.
+# 3. submit()/submit_many(): 이벤트 생성 서비스가 호출. 큐가 가득 차면 버리고(dropped) 다음 재시작 시 백필로 복구.
+# 4. _run(): 큐에서 최대 batch_size건씩 꺼내 ChatBot.embed_texts(RAG와 같은 임베딩 모델)로 임베딩하여 추가.
+#    변경이 있으면 save_interval마다, 그리고 stop() 시 디스크에 저장.
+# 5. search(): 인덱스에 있는 이벤트는 저장된 벡터로, 아직 없으면 즉시 임베딩하여 이전 이벤트 중 가장 유사한 k건을 찾음.
+#-----------------------------------------------------------------------------------------#
+
+import asyncio
+import logging
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from ..chatbot import ChatBot, EventEmbeddingIndex
+from ..core.config import EMBEDDING_MODEL_NAME, EVENT_INDEX_DIR, EVENT_INDEX_QUEUE_SIZE, EVENT_INDEX_BATCH_SIZE
+from ..core.config import EVENT_INDEX_SAVE_INTERVAL_SECONDS, EVENT_INDEX_EF_SEARCH
+from ..db import cruds
+from ..db.database import AsyncSessionLocal
+from ..utils.metrics import LatencyHistogram
+
+logger = logging.getLogger(__name__)
+
+
+class EventIndexer:
+    def __init__(
+        self,
+        persist_dir: str = EVENT_INDEX_DIR,
+        queue_size: int = EVENT_INDEX_QUEUE_SIZE,
+        batch_size: int = EVENT_INDEX_BATCH_SIZE,
+        save_interval: float = EVENT_INDEX_SAVE_INTERVAL_SECONDS,
+    ):
+        self.persist_dir = persist_dir
+        self.batch_size = max(1, batch_size)
+        self.save_interval = save_interval
+        self.index = EventEmbeddingIndex(ef_search=EVENT_INDEX_EF_SEARCH, model_name=EMBEDDING_MODEL_NAME)
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self._pending_ids: set = set() # 큐에 있거나 처리 중인 이벤트 ID
+        self._missed_ids: set = set() # 버렸거나 인덱싱에 실패한 이벤트 ID (다음 시작 시 백필)
+        self._task: Optional[asyncio.Task] = None
+        self._dirty = False
+        self._last_save = time.monotonic()
+        self.backfill_done = False
+        self.query_latency = LatencyHistogram()
+        self._counts = {"queued": 0, "dropped": 0, "indexed": 0, "backfilled": 0, "failed": 0, "saves": 0}
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None
+
+    @staticmethod
+    def make_text(event_type: str, value: str) -> str:
+        return f"[{event_type}] {value}"
+
+    async def start(self):
+        if self._task is not None:
+            return
+        try:
+            loaded = await asyncio.to_thread(self.index.load, self.persist_dir)
+        except Exception as e:
+            logger.exception(f"Failed to load event index from {self.persist_dir}, rebuilding: {e}")
+            self.index = EventEmbeddingIndex(ef_search=EVENT_INDEX_EF_SEARCH, model_name=EMBEDDING_MODEL_NAME)
+            loaded = False
+        if loaded:
+            logger.info(f"Loaded event index with {len(self.index)} events from {self.persist_dir}")
+        self._task = asyncio.create_task(self._run(), name="event-indexer")
+
+    async def stop(self):
+        """대기 중인 이벤트는 버리고(다음 시작 시 백필) 변경된 인덱스를 저장한 뒤 종료합니다."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        await self._save()
+
+    def submit(self, event_id: int, event_type: str, value: str) -> bool:
+        if self._task is None:
+            return False
+        try:
+            self._queue.put_nowait((event_id, event_type, value))
+        except asyncio.QueueFull:
+            self._missed_ids.add(event_id)
+            self._counts["dropped"] += 1
+            return False
+        self._pending_ids.add(event_id)
+        self._counts["queued"] += 1
+        return True
+
+    def submit_many(self, events: Iterable[Tuple[int, str, str]]):
+        for event_id, event_type, value in events:
+            self.submit(event_id, event_type, value)
+
+    async def _embed_and_add(self, events: List[Tuple[int, str, str]]) -> int:
+        # 최초 생성 시 임베딩 모델 로딩이 오래 걸리므로 스레드에서 인스턴스화 (싱글톤)
+        chatbot = await asyncio.to_thread(ChatBot)
+        texts = [self.make_text(event_type, value) for _, event_type, value in events]
+        vectors = await asyncio.to_thread(chatbot.embed_texts, texts)
+        added = await asyncio.to_thread(self.index.add, [event_id for event_id, _, _ in events], vectors)
+        self._dirty = self._dirty or added > 0
+        return added
+
+    async def _backfill(self):
+        after_id = self.index.indexed_through
+        while True:
+            async with AsyncSessionLocal() as db:
+                rows = await cruds.get_events_after_id(db, after_id=after_id, limit=self.batch_size * 16)
+            if not rows:
+                break
+            for start in range(0, len(rows), self.batch_size):
+                batch = [(row["id"], row["type"], row["value"]) for row in rows[start:start + self.batch_size]]
+                batch = [event for event in batch if event[0] not in self.index]
+                if batch:
+                    self._counts["backfilled"] += await self._embed_and_add(batch)
+            after_id = rows[-1]["id"]
+            self.index.indexed_through = after_id
+            await self._maybe_save()
+        self.backfill_done = True
+        logger.info(f"Event index backfill complete ({len(self.index)} events)")
+
+    async def _run(self):
+        while not self.backfill_done:
+            try:
+                await self._backfill()
+            except Exception as e:
+                logger.exception(f"Event index backfill failed, retrying in 30s: {e}")
+                await asyncio.sleep(30)
+        while True:
+            try:
+                first = await asyncio.wait_for(self._queue.get(), timeout=self.save_interval)
+            except asyncio.TimeoutError:
+                await self._maybe_save()
+                continue
+            batch = [first]
+            while len(batch) < self.batch_size and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            try:
+                self._counts["indexed"] += await self._embed_and_add(batch)
+            except Exception as e:
+                self._counts["failed"] += len(batch)
+                self._missed_ids.update(event_id for event_id, _, _ in batch)
+                logger.exception(f"Failed to index {len(batch)} events: {e}")
+            finally:
+                for event_id, _, _ in batch:
+                    self._pending_ids.discard(event_id)
+                    self._queue.task_done()
+            self._advance_indexed_through()
+            await self._maybe_save()
+
+    def _advance_indexed_through(self):
+        """대기 중이거나 누락된 가장 작은 이벤트 ID 직전까지 (없으면 인덱스의 최대 ID까지) 인덱싱 완료로 기록합니다."""
+        unindexed = self._pending_ids | self._missed_ids
+        through = (min(unindexed) - 1) if unindexed else self.index.max_id
+        self.index.indexed_through = max(self.index.indexed_through, through)
+
+    async def _maybe_save(self):
+        if self._dirty and time.monotonic() - self._last_save >= self.save_interval:
+            await self._save()
+
+    async def _save(self):
+        if not self._dirty:
+            return
+        try:
+            await asyncio.to_thread(self.index.save, self.persist_dir)
+            self._dirty = False
+            self._counts["saves"] += 1
+        except Exception as e:
+            logger.exception(f"Failed to save event index to {self.persist_dir}: {e}")
+        self._last_save = time.monotonic()
+
+    async def search(self, event_id: int, event_type: str, value: str, k: int) -> List[Tuple[int, float]]:
+        """event_id보다 먼저 생성된 이벤트 중 type/value 임베딩이 가장 유사한 k건의 (이벤트 ID, 유사도)."""
+        vector = self.index.get_vector(event_id)
+        if vector is None:
+            chatbot = await asyncio.to_thread(ChatBot)
+            vector = (await asyncio.to_thread(chatbot.embed_texts, [self.make_text(event_type, value)]))[0]
+        started = time.perf_counter()
+        # 저장(save) 중에는 인덱스 잠금을 기다릴 수 있으므로 이벤트 루프 밖에서 검색
+        results = await asyncio.to_thread(self.index.query, vector, k, event_id)
+        self.query_latency.observe(time.perf_counter() - started)
+        return results
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "running": self.running,
+            "backfill_done": self.backfill_done,
+            **self._counts,
+            "pending": self._queue.qsize(),
+            **self.index.stats(),
+            "query_latency": self.query_latency.snapshot(),
+        }
+
+
+event_indexer = EventIndexer()
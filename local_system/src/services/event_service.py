@@ -1,18 +1,146 @@
+import asyncio
+import json
+import logging
+from datetime import datetime
 from fastapi import HTTPException, UploadFile
+from pydantic import ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
 from ..db import models as db_models
 from ..db import cruds
 from ..db import schemas as db_schemas
-from ..utils import encode_image, make_pdf, send_email
-from ..chatbot import ChatBot
+from ..db.database import AsyncSessionLocal
+from ..utils import to_base64, image_store, make_pdf, send_email, format_sse
+from ..utils import apreprocess_image, read_upload_limited, UploadTooLargeError
+from ..chatbot import ChatBot, chatbot_warmup, rag_prefetcher, answer_cache, CachedAnswer, SOLVE_EVENT_ERROR_MESSAGE
+from ..core.config import EVENT_BULK_MAX_ITEMS, EVENT_BULK_BATCH_SIZE, EVENT_BULK_MAX_BYTES, EVENT_WRITE_BUFFER_ENABLED, RAG_PREFETCH_ENABLED
+from ..core.config import ANSWER_CACHE_ENABLED, EVENT_INDEX_ENABLED
+from .event_write_buffer import EventWriteBufferFull, event_write_buffer
+from .event_index_service import event_indexer
+
+logger = logging.getLogger(__name__)
 
 async def create_event_service(
     db: AsyncSession, event_data: db_schemas.EventCreate
 ) -> db_models.EventModel:
-    """이벤트 생성 서비스 로직"""
-    return await cruds.create_event(db=db, type=event_data.type, value=event_data.value)
+    """
+    이벤트 생성 서비스 로직.
+    RAG_PREFETCH_ENABLED이면 해결 요청 전에 RAG 검색을 백그라운드에서 미리 실행하고,
+    EVENT_INDEX_ENABLED이면 유사 이벤트 검색용 이벤트 임베딩 인덱스에 추가합니다.
+    """
+    if EVENT_WRITE_BUFFER_ENABLED and event_write_buffer.running:
+        # write-behind 버퍼에 넣고 그룹 커밋 후 할당된 ID를 받음 (버퍼가 가득 차면 503으로 재시도 유도)
+        try:
+            event_id, event_time = await event_write_buffer.submit(event_data.type, event_data.value)
+        except EventWriteBufferFull as e:
+            raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "1"})
+        event = db_models.EventModel(id=event_id, type=event_data.type, value=event_data.value, time=event_time)
+    else:
+        event = await cruds.create_event(db=db, type=event_data.type, value=event_data.value)
+    if RAG_PREFETCH_ENABLED:
+        rag_prefetcher.submit(event)
+    if EVENT_INDEX_ENABLED:
+        event_indexer.submit(event.id, event.type, event.value)
+    return event
+
+def _too_many_events(count: Any) -> HTTPException:
+    return HTTPException(
+        status_code=413,
+        detail=f"Too many events in one request: {count} (max {EVENT_BULK_MAX_ITEMS})",
+    )
+
+def _append_ndjson_item(items: List[Any], line: bytes):
+    if not line.strip():
+        return
+    try:
+        items.append(json.loads(line))
+    except ValueError as e:
+        # 잘못된 줄은 해당 항목의 검증 오류로 보고 (배치 전체를 실패시키지 않음)
+        items.append(e)
+    if len(items) > EVENT_BULK_MAX_ITEMS:
+        raise _too_many_events(f"more than {EVENT_BULK_MAX_ITEMS}")
+
+async def _read_bulk_events_payload(
+    body: AsyncIterator[bytes], content_type: str, content_length: Optional[int] = None
+) -> List[Any]:
+    """
+    요청 본문을 JSON 배열 또는 NDJSON(한 줄에 하나의 JSON 객체)으로 해석하여 항목 리스트를 반환합니다.
+    본문은 청크 단위로 읽으며 EVENT_BULK_MAX_BYTES를 넘으면 즉시 413. NDJSON은 읽는 동안 줄 단위로 해석하여
+    EVENT_BULK_MAX_ITEMS를 넘는 순간 중단합니다.
+    """
+    if content_length is not None and content_length > EVENT_BULK_MAX_BYTES:
+        raise HTTPException(status_code=413, detail=f"Request body is too large: {content_length} bytes (max {EVENT_BULK_MAX_BYTES})")
+    ndjson = "ndjson" in content_type or "jsonlines" in content_type
+    buffer = bytearray()
+    items: List[Any] = []
+    total = 0
+    async for chunk in body:
+        total += len(chunk)
+        if total > EVENT_BULK_MAX_BYTES:
+            raise HTTPException(status_code=413, detail=f"Request body exceeds {EVENT_BULK_MAX_BYTES} bytes")
+        buffer.extend(chunk)
+        if ndjson:
+            end = buffer.rfind(b"\n")
+            if end >= 0:
+                for line in bytes(buffer[:end]).split(b"\n"):
+                    _append_ndjson_item(items, line)
+                del buffer[:end + 1]
+
+    if ndjson:
+        _append_ndjson_item(items, bytes(buffer))
+        return items
+
+    try:
+        items = json.loads(bytes(buffer))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"Invalid JSON body: {e}")
+    if not isinstance(items, list):
+        raise HTTPException(status_code=400, detail="Request body must be a JSON array of events or NDJSON.")
+    if len(items) > EVENT_BULK_MAX_ITEMS:
+        raise _too_many_events(len(items))
+    return items
+
+async def create_events_bulk_service(
+    db: AsyncSession, body: AsyncIterator[bytes], content_type: str, content_length: Optional[int] = None
+) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    일괄 이벤트 생성 서비스 로직 (본문 크기/항목 수 제한, 항목별 검증, 유효한 항목만 배치 INSERT).
+    생성된 이벤트는 단건 생성과 같이 RAG 검색 사전 계산/이벤트 임베딩 인덱스에 넘김 (각 큐가 가득 차면 버림).
+    """
+    items = await _read_bulk_events_payload(body, content_type, content_length)
+
+    # 사전 계산 쿼리에 이벤트 시간이 들어가므로 INSERT할 시간을 여기서 정함
+    now = datetime.now()
+    valid_indexes: List[int] = []
+    valid_events: List[Dict[str, Any]] = []
+    errors: List[Dict[str, Any]] = []
+    for index, item in enumerate(items):
+        if isinstance(item, Exception):
+            errors.append({"index": index, "detail": f"Invalid JSON: {item}"})
+            continue
+        try:
+            event = db_schemas.EventCreate.model_validate(item)
+        except ValidationError as e:
+            errors.append({"index": index, "detail": "; ".join(
+                f"{'.'.join(str(loc) for loc in err['loc']) or 'item'}: {err['msg']}" for err in e.errors()
+            )})
+            continue
+        valid_indexes.append(index)
+        valid_events.append({"type": event.type, "value": event.value, "time": now})
+
+    try:
+        ids = await cruds.create_events_bulk(db=db, events=valid_events, batch_size=EVENT_BULK_BATCH_SIZE)
+    except Exception as e:
+        logger.exception(f"Bulk event creation failed ({len(valid_events)} events): {e}")
+        raise HTTPException(status_code=500, detail=f"Failed to create events: {e}")
+    created = [{"index": index, "id": event_id} for index, event_id in zip(valid_indexes, ids)]
+    if RAG_PREFETCH_ENABLED:
+        for event_id, event in zip(ids, valid_events):
+            rag_prefetcher.submit(db_models.EventModel(id=event_id, **event))
+    if EVENT_INDEX_ENABLED:
+        event_indexer.submit_many((event_id, event["type"], event["value"]) for event_id, event in zip(ids, valid_events))
+    return {"created": created, "errors": errors}
 
 async def get_event_service(db: AsyncSession, event_id: int) -> db_models.EventModel:
     """특정 이벤트 조회 서비스 로직"""
@@ -22,51 +150,211 @@ async def get_event_service(db: AsyncSession, event_id: int) -> db_models.EventM
     return event
 
 async def get_events_service(
-    db: AsyncSession, skip: int = 0, limit: int = 30
-) -> List[db_models.EventModel]:
-    """이벤트 목록 조회 서비스 로직"""
-    return await cruds.get_events(db=db, skip=skip, limit=limit)
+    db: AsyncSession,
+    skip: int = 0,
+    limit: int = 30,
+    include_status: bool = False,
+    cursor: Optional[str] = None,
+) -> Dict[str, Any]:
+    """이벤트 목록 조회 서비스 로직 (응답에 필요한 컬럼만 조회, skip 또는 cursor 기반 페이지네이션)"""
+    after = None
+    if cursor:
+        try:
+            after = cruds.decode_event_cursor(cursor)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor.")
 
-async def solve_event_service(
-    db: AsyncSession, event_id: int, image: UploadFile, explain: str
-) -> str:
-    """이벤트 해결 정보 제출 및 AI 분석 서비스 로직"""
-    event = await get_event_service(db, event_id) # 내부 서비스 함수 재사용 및 404 처리
+    # 다음 페이지 존재 여부를 알기 위해 1건 더 조회
+    events = await cruds.get_event_list(
+        db=db, skip=skip, limit=limit + 1, include_status=include_status, after=after
+    )
+    next_cursor = None
+    if len(events) > limit:
+        events = events[:limit]
+        if events:
+            last = events[-1]
+            next_cursor = cruds.encode_event_cursor(last["time"], last["id"])
+    return {"events": events, "next_cursor": next_cursor}
 
+async def get_similar_events_service(db: AsyncSession, event_id: int, k: int = 5) -> Dict[str, Any]:
+    """이벤트 임베딩 인덱스로 기준 이벤트보다 먼저 발생한 유사 이벤트 k건을 해결 상태와 함께 조회하는 서비스 로직"""
+    event = await get_event_service(db, event_id)
+    if not EVENT_INDEX_ENABLED or not event_indexer.running:
+        raise HTTPException(status_code=503, detail="Event similarity index is not enabled (EVENT_INDEX_ENABLED).")
     try:
-        bytes_data = await image.read()
+        neighbors = await event_indexer.search(event.id, event.type, event.value, k)
+    except Exception as e:
+        logger.exception(f"Similar event search failed for event ID {event_id}: {e}")
+        raise HTTPException(status_code=500, detail=f"Failed to search similar events: {e}")
+
+    rows = {row["id"]: row for row in await cruds.get_event_list_by_ids(db, [neighbor_id for neighbor_id, _ in neighbors])}
+    similar = [
+        {**rows[neighbor_id], "similarity": round(similarity, 4)}
+        for neighbor_id, similarity in neighbors
+        if neighbor_id in rows # 인덱스에는 있지만 DB에서 삭제된 이벤트는 제외
+    ]
+    return {"event_id": event_id, "similar": similar}
+
+async def _save_event_detail(
+    db: AsyncSession, event_id: int, image: UploadFile, explain: str
+) -> bytes:
+    """업로드 이미지를 압축해 image_store에 저장하고 EventDetail을 생성/업데이트한 뒤 JPEG 바이트를 반환합니다."""
+    try:
+        # 크기 상한을 넘으면 읽기를 중단하고, 디코딩/축소는 이벤트 루프 밖의 풀에서 실행
+        bytes_data = await read_upload_limited(image)
         if not bytes_data:
              raise HTTPException(status_code=400, detail="Image file is empty.")
-        encoded_image = encode_image(bytes_data)
+        image_bytes = await apreprocess_image(bytes_data)
+    except HTTPException:
+        raise
+    except UploadTooLargeError as e:
+        raise HTTPException(status_code=413, detail=f"Image file is too large: {e}")
     except Exception as e:
         # 이미지 처리 오류 핸들링 강화
         raise HTTPException(status_code=400, detail=f"Failed to process image: {e}")
     finally:
         await image.close() # 파일 핸들 닫기
 
+    # DB에는 해시와 크기만 저장 (원본 바이트는 sha256 기반 blob 저장소에 저장)
+    image_hash, image_size = await asyncio.to_thread(image_store.put, image_bytes)
+
     # EventDetail 생성 또는 업데이트
     event_detail = await cruds.get_event_detail(db, event_id)
     if event_detail:
-        await cruds.update_event_detail(db, event_id, encoded_image, explain)
+        await cruds.update_event_detail(db, event_id, image_hash, image_size, explain)
     else:
-        await cruds.create_event_detail(db, event_id, encoded_image, explain)
+        await cruds.create_event_detail(db, event_id, image_hash, image_size, explain)
 
-    # Chatbot 호출
-    try:
-        chatbot = ChatBot() # ChatBot 인스턴스화 (싱글톤 패턴 가정)
-        answer = chatbot.solve_event(event, encoded_image, explain)
-    except Exception as e:
-        # Chatbot 호출 오류 핸들링
-        raise HTTPException(status_code=500, detail=f"Failed to get analysis from AI: {e}")
+    return image_bytes
+
+async def prefetched_rag_documents(chatbot: ChatBot, event_id: int) -> Optional[List[Any]]:
+    """이벤트 생성 시 미리 계산된 RAG 검색 결과 (없거나 벡터 DB가 바뀌었으면 None → ChatBot이 직접 검색)"""
+    if not RAG_PREFETCH_ENABLED:
+        return None
+    return await rag_prefetcher.get(event_id, chatbot.vector_store_path)
+
+async def load_event_image_base64(event_detail: db_models.EventDetailModel) -> str:
+    """LLM 프롬프트에 넣을 Base64 이미지 문자열을 만듭니다 (blob 저장소 우선, 미이전 행은 레거시 file 컬럼 사용)."""
+    if event_detail.image_hash:
+        image_bytes = await asyncio.to_thread(image_store.get, event_detail.image_hash)
+        return to_base64(image_bytes)
+    return await event_detail.awaitable_attrs.file
 
-    # Solution 생성 또는 업데이트
+async def _save_solution(db: AsyncSession, event_id: int, answer: str) -> None:
+    """Solution 생성 또는 업데이트"""
     solution = await cruds.get_solution(db, event_id)
     if solution:
         await cruds.update_solution(db, event_id, answer)
     else:
         await cruds.create_solution(db, event_id, answer)
 
-    return answer
+async def _answer_cache_vector(chatbot: ChatBot, event: db_models.EventModel, explain: str) -> Optional[List[float]]:
+    """답변 캐시 키 벡터 (이벤트 유형/내용 + 사용자 설명 임베딩). 캐시를 쓰지 않거나 임베딩에 실패하면 None."""
+    if not ANSWER_CACHE_ENABLED:
+        return None
+    text = answer_cache.make_text(event.type, event.value, explain)
+    try:
+        return (await asyncio.to_thread(chatbot.embed_texts, [text]))[0]
+    except Exception as e:
+        logger.warning(f"Answer cache embedding failed for event ID {event.id}: {e}")
+        return None
+
+def _cached_answer_fields(cached: Optional[CachedAnswer]) -> Dict[str, Any]:
+    if cached is None:
+        return {"cached": False}
+    return {"cached": True, "cached_from_event_id": cached.event_id, "similarity": round(cached.similarity, 4)}
+
+def _remember_answer(event: db_models.EventModel, vector: Optional[List[float]], answer: str, refresh: bool):
+    """LLM이 새로 생성한 정상 답변을 답변 캐시에 저장 (refresh 요청이면 기존 유사 답변을 대체)"""
+    if vector is not None and answer and answer != SOLVE_EVENT_ERROR_MESSAGE:
+        answer_cache.put(event.id, event.type, vector, answer, supersede=refresh)
+
+async def solve_event_service(
+    db: AsyncSession, event_id: int, image: UploadFile, explain: str, full_context: bool = False, refresh: bool = False
+) -> Dict[str, Any]:
+    """
+    이벤트 해결 정보 제출 및 AI 분석 서비스 로직.
+    ANSWER_CACHE_ENABLED이고 refresh가 아니면, 같은 유형의 유사한 이전 이벤트 답변을 LLM 호출 없이 재사용합니다.
+    """
+    event = await get_event_service(db, event_id) # 내부 서비스 함수 재사용 및 404 처리
+    image_bytes = await _save_event_detail(db, event_id, image, explain)
+
+    # Chatbot 호출
+    try:
+        # 최초 생성 시 임베딩 모델/벡터 DB 로딩이 오래 걸리므로 스레드에서 인스턴스화 (싱글톤)
+        chatbot = await asyncio.to_thread(ChatBot)
+        cache_vector = await _answer_cache_vector(chatbot, event, explain)
+        cached = None
+        if cache_vector is not None and not refresh:
+            cached = answer_cache.lookup(event.type, cache_vector, exclude_event_id=event_id)
+        if cached:
+            logger.info(f"Reusing cached answer of event ID {cached.event_id} for event ID {event_id} (similarity {cached.similarity:.3f})")
+            answer = cached.answer
+        else:
+            rag_documents = await prefetched_rag_documents(chatbot, event_id)
+            # Base64 인코딩은 프롬프트 구성 직전에만 수행
+            answer = await chatbot.asolve_event(
+                event, to_base64(image_bytes), explain, full_context=full_context, rag_documents=rag_documents
+            )
+    except Exception as e:
+        # Chatbot 호출 오류 핸들링
+        raise HTTPException(status_code=500, detail=f"Failed to get analysis from AI: {e}")
+
+    await _save_solution(db, event_id, answer)
+    if not cached:
+        _remember_answer(event, cache_vector, answer, refresh)
+
+    return {"answer": answer, **_cached_answer_fields(cached)}
+
+async def solve_event_stream_service(
+    db: AsyncSession, event_id: int, image: UploadFile, explain: str, full_context: bool = False, refresh: bool = False
+) -> AsyncIterator[str]:
+    """
+    이벤트 해결 정보 제출 및 AI 분석 스트리밍 서비스 로직.
+    요청 검증과 EventDetail 저장은 스트림 시작 전에 수행하고(오류 시 일반 HTTP 오류 응답),
+    LLM 토큰은 SSE 메시지로 전달한 뒤 스트림이 정상 종료되면 전체 답변을 Solution으로 저장합니다.
+    답변 캐시 hit이면 재사용한 답변 전체를 delta 하나로 보낸 뒤 바로 done을 보냅니다.
+    """
+    event = await get_event_service(db, event_id)
+    image_bytes = await _save_event_detail(db, event_id, image, explain)
+    try:
+        chatbot = await asyncio.to_thread(ChatBot)
+        cache_vector = await _answer_cache_vector(chatbot, event, explain)
+        cached = None
+        if cache_vector is not None and not refresh:
+            cached = answer_cache.lookup(event.type, cache_vector, exclude_event_id=event_id)
+        rag_documents = None if cached else await prefetched_rag_documents(chatbot, event_id)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to get analysis from AI: {e}")
+
+    async def event_stream() -> AsyncIterator[str]:
+        if cached:
+            async with AsyncSessionLocal() as session:
+                await _save_solution(session, event_id, cached.answer)
+            yield format_sse({"delta": cached.answer})
+            yield format_sse({"event_id": event_id, "answer": cached.answer, **_cached_answer_fields(cached)}, event="done")
+            return
+
+        chunks: List[str] = []
+        try:
+            async for chunk in chatbot.astream_solve_event(
+                event, to_base64(image_bytes), explain, full_context=full_context, rag_documents=rag_documents
+            ):
+                chunks.append(chunk)
+                yield format_sse({"delta": chunk})
+        except Exception as e:
+            logger.exception(f"Error while streaming solution for event ID {event_id}: {e}")
+            yield format_sse({"detail": SOLVE_EVENT_ERROR_MESSAGE}, event="error")
+            return
+
+        answer = "".join(chunks)
+        # 의존성(get_db) 세션은 응답 스트리밍 전에 정리되므로 저장에는 별도 세션을 사용
+        async with AsyncSessionLocal() as session:
+            await _save_solution(session, event_id, answer)
+        _remember_answer(event, cache_vector, answer, refresh)
+        yield format_sse({"event_id": event_id, "answer": answer, "cached": False}, event="done")
+
+    return event_stream()
 
 async def mark_event_complete_service(
     db: AsyncSession, event_id: int, complete: bool
@@ -77,10 +365,10 @@ async def mark_event_complete_service(
         raise HTTPException(status_code=404, detail=f"Solution for event ID {event_id} not found. Cannot mark as complete.")
     return solution
 
-async def generate_and_send_report_service(
-    db: AsyncSession, event_id: int, email: str
-) -> str:
-    """보고서 생성 및 이메일 전송 서비스 로직"""
+async def get_report_inputs_service(
+    db: AsyncSession, event_id: int
+) -> Tuple[db_models.EventModel, db_models.EventDetailModel, db_models.SolutionModel]:
+    """보고서 생성에 필요한 이벤트, 이벤트 상세, 솔루션을 조회하고 검증하는 서비스 로직"""
     event = await get_event_service(db, event_id) # 404 처리 포함
 
     event_detail = await cruds.get_event_detail(db, event_id)
@@ -93,21 +381,87 @@ async def generate_and_send_report_service(
     if not solution.answer:
          raise HTTPException(status_code=400, detail=f"Solution answer for event ID {event_id} is empty. Cannot generate report.")
 
+    return event, event_detail, solution
+
+async def generate_and_send_report_service(
+    db: AsyncSession, event_id: int, email: str
+) -> str:
+    """보고서 생성 및 이메일 전송 서비스 로직"""
+    event, event_detail, solution = await get_report_inputs_service(db, event_id)
+
     # Chatbot 호출하여 보고서 내용 생성
     try:
-        chatbot = ChatBot()
-        report_content = chatbot.make_report_content(
-            event, event_detail.file, event_detail.explain, solution.answer
+        chatbot = await asyncio.to_thread(ChatBot)
+        image_base64 = await load_event_image_base64(event_detail)
+        report_content = await chatbot.amake_report_content(
+            event, image_base64, event_detail.explain, solution.answer,
+            rag_documents=await prefetched_rag_documents(chatbot, event_id),
         )
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to generate report content from AI: {e}")
 
     # PDF 생성 및 이메일 전송
     try:
-        pdf_data = make_pdf(report_content)
-        send_email(email, pdf_data)
+        # PDF 렌더링과 SMTP 전송은 블로킹 작업이므로 이벤트 루프 밖에서 실행
+        pdf_data = await asyncio.to_thread(make_pdf, report_content)
+        await asyncio.to_thread(send_email, email, pdf_data)
     except Exception as e:
         # PDF 또는 이메일 전송 실패 처리
         raise HTTPException(status_code=500, detail=f"Failed to generate or send report PDF: {e}")
 
     return report_content # 또는 성공 메시지 반환
+
+async def get_rag_cache_stats_service() -> Dict[str, float]:
+    """RAG 검색 결과 캐시 통계 조회 서비스 로직"""
+    chatbot = await asyncio.to_thread(ChatBot)
+    return chatbot.retrieval_cache.stats()
+
+async def get_rag_context_stats_service() -> Dict[str, float]:
+    """RAG 컨텍스트 토큰 예산 적용 통계(예산 전/후 토큰, 제외 구절 수, 프롬프트 토큰) 조회 서비스 로직"""
+    chatbot = await asyncio.to_thread(ChatBot)
+    return chatbot.context_builder.stats()
+
+async def get_rag_prefetch_stats_service() -> Dict[str, Any]:
+    """이벤트 생성 시 RAG 검색 사전 계산 통계(처리/대기/버림 건수, hit rate 등) 조회 서비스 로직"""
+    return {"enabled": RAG_PREFETCH_ENABLED, **rag_prefetcher.stats()}
+
+async def load_answer_cache_service(limit: Optional[int] = None) -> int:
+    """최근 해결된 이벤트로 답변 캐시를 채웁니다 (서버 시작 시 백그라운드 실행). 저장한 항목 수를 반환합니다."""
+    async with AsyncSessionLocal() as db:
+        rows = await cruds.get_recent_solved_events(db, limit or answer_cache.maxsize)
+    rows = [row for row in rows if row["answer"] and row["answer"] != SOLVE_EVENT_ERROR_MESSAGE]
+    if not rows:
+        return 0
+    chatbot = await asyncio.to_thread(ChatBot)
+    texts = [answer_cache.make_text(row["type"], row["value"], row["explain"]) for row in rows]
+    vectors = await asyncio.to_thread(chatbot.embed_texts, texts)
+    # 오래된 것부터 넣어 최근 항목이 LRU에서 가장 늦게 교체되도록 함
+    for row, vector in reversed(list(zip(rows, vectors))):
+        answer_cache.put(row["event_id"], row["type"], vector, row["answer"])
+    logger.info(f"Loaded {len(rows)} solved events into the answer cache")
+    return len(rows)
+
+async def get_answer_cache_stats_service() -> Dict[str, Any]:
+    """의미 기반 답변 캐시 통계(hit rate, 교체 횟수, 크기 등) 조회 서비스 로직"""
+    return {"enabled": ANSWER_CACHE_ENABLED, **answer_cache.stats()}
+
+async def get_event_index_stats_service() -> Dict[str, Any]:
+    """이벤트 임베딩 인덱스 통계(인덱스 크기, 백필/대기/버림 건수, 검색 지연 히스토그램) 조회 서비스 로직"""
+    return {"enabled": EVENT_INDEX_ENABLED, **event_indexer.stats()}
+
+async def get_event_write_buffer_stats_service() -> Dict[str, Any]:
+    """이벤트 write-behind 버퍼 통계(대기 건수, 플러시 지연 히스토그램 등) 조회 서비스 로직"""
+    return {"enabled": EVENT_WRITE_BUFFER_ENABLED, **event_write_buffer.stats()}
+
+def get_readiness_service() -> Dict[str, Any]:
+    """ChatBot warm-up 상태 및 구성요소별 로드 시간 조회 서비스 로직"""
+    return chatbot_warmup.status()
+
+async def reload_vector_store_service(force: bool = False) -> Dict[str, Any]:
+    """게시된 벡터 DB 스냅샷으로 ChatBot의 벡터 DB를 교체하는 서비스 로직 (실패 시 이전 DB 유지)"""
+    chatbot = await asyncio.to_thread(ChatBot)
+    try:
+        return await asyncio.to_thread(chatbot.reload_vector_store, force)
+    except Exception as e:
+        logger.exception(f"Vector store reload failed: {e}")
+        raise HTTPException(status_code=500, detail=f"Failed to reload vector store: {e}")
@@ -0,0 +1,161 @@
+#-----------------------------------------------------------------------------------------#
+# [ 파일 개요 ]
+# 단건 이벤트 생성 요청을 메모리 버퍼에 모았다가 한 트랜잭션으로 일괄 INSERT하는 write-behind 버퍼(그룹 커밋)를 정의합니다.
+# 알람이 몰리는 상황에서 이벤트마다 add → commit → refresh 를 수행하는 대신, 여러 요청을 하나의 커밋으로 처리합니다.
+
+# [ 주요 로직 흐름 ]
+# 1. submit(): 이벤트를 버퍼에 넣고 Future를 대기. 플러시 후 할당된 이벤트 ID로 완료됨.
+#    대기 중인 이벤트가 max_pending 이상이면(DB가 느리거나 장애인 상태에서 알람 폭주) EventWriteBufferFull로 즉시 거절 (API는 503).
+# 2. _run(): 첫 항목이 들어오면 flush_interval(예: 50ms)이 지나거나 max_batch_size(예: 500건)가 찰 때까지 기다린 뒤 플러시.
+# 3. _flush(): cruds.create_events_bulk로 한 트랜잭션에 저장하고 각 호출자의 Future에 ID(또는 예외)를 전달.
+#    플러시 소요 시간은 LatencyHistogram에 기록.
+# 4. stop(): 새 요청을 받지 않고 버퍼에 남은 항목을 모두 플러시한 뒤 종료 (종료 시 유실 방지).
+#-----------------------------------------------------------------------------------------#
+
+import asyncio
+import logging
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..core.config import EVENT_WRITE_BUFFER_MAX_BATCH, EVENT_WRITE_BUFFER_FLUSH_MS, EVENT_WRITE_BUFFER_MAX_PENDING
+from ..db import cruds
+from ..db.database import AsyncSessionLocal
+from ..utils.metrics import LatencyHistogram
+
+logger = logging.getLogger(__name__)
+
+
+class EventWriteBufferFull(RuntimeError):
+    """플러시를 기다리는 이벤트가 상한에 도달하여 새 이벤트를 받을 수 없음."""
+
+
+class EventWriteBuffer:
+    def __init__(
+        self,
+        max_batch_size: int = EVENT_WRITE_BUFFER_MAX_BATCH,
+        flush_interval: float = EVENT_WRITE_BUFFER_FLUSH_MS / 1000.0,
+        max_pending: int = EVENT_WRITE_BUFFER_MAX_PENDING,
+    ):
+        self.max_batch_size = max(1, max_batch_size)
+        self.flush_interval = flush_interval
+        self.max_pending = max(self.max_batch_size, max_pending)
+        self._pending: List[Tuple[Dict[str, Any], asyncio.Future]] = []
+        self._has_items = asyncio.Event()
+        self._full = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._closed = False
+        self.flush_latency = LatencyHistogram()
+        self.flushed_batches = 0
+        self.flushed_events = 0
+        self.failed_events = 0
+        self.rejected_events = 0
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._closed
+
+    async def start(self):
+        if self._task is not None:
+            return
+        self._closed = False
+        self._task = asyncio.create_task(self._run(), name="event-write-buffer")
+        logger.info(
+            f"Started event write buffer (max batch: {self.max_batch_size}, flush interval: {self.flush_interval * 1000:.0f}ms)"
+        )
+
+    async def stop(self):
+        """새 요청을 막고 버퍼에 남은 이벤트를 모두 저장한 뒤 종료합니다."""
+        if self._task is None:
+            return
+        self._closed = True
+        self._has_items.set()
+        self._full.set()
+        await self._task
+        self._task = None
+        logger.info("Stopped event write buffer (drained)")
+
+    async def submit(self, type: str, value: str) -> Tuple[int, datetime]:
+        """
+        이벤트를 버퍼에 추가하고 플러시될 때까지 기다립니다.
+        Returns:
+            (할당된 이벤트 ID, 이벤트 시간) 튜플.
+        Raises:
+            RuntimeError: 버퍼가 실행 중이 아닐 때.
+            EventWriteBufferFull: 대기 중인 이벤트가 max_pending 이상일 때.
+            SQLAlchemyError: 플러시(일괄 INSERT) 실패 시.
+        """
+        if not self.running:
+            raise RuntimeError("Event write buffer is not running.")
+        if len(self._pending) >= self.max_pending:
+            self.rejected_events += 1
+            raise EventWriteBufferFull(f"Event write buffer is full ({len(self._pending)} pending events).")
+        future = asyncio.get_running_loop().create_future()
+        event = {"type": type, "value": value, "time": datetime.now()}
+        self._pending.append((event, future))
+        self._has_items.set()
+        if len(self._pending) >= self.max_batch_size:
+            self._full.set()
+        event_id = await future
+        return event_id, event["time"]
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "running": self.running,
+            "pending": len(self._pending),
+            "max_pending": self.max_pending,
+            "rejected_events": self.rejected_events,
+            "flushed_batches": self.flushed_batches,
+            "flushed_events": self.flushed_events,
+            "failed_events": self.failed_events,
+            "flush_latency": self.flush_latency.snapshot(),
+        }
+
+    async def _run(self):
+        while True:
+            await self._has_items.wait()
+            # 첫 항목 도착 후 flush_interval 동안, 또는 배치가 찰 때까지 더 모음
+            if not self._closed and len(self._pending) < self.max_batch_size:
+                try:
+                    await asyncio.wait_for(self._full.wait(), timeout=self.flush_interval)
+                except asyncio.TimeoutError:
+                    pass
+
+            batch = self._pending[:self.max_batch_size]
+            del self._pending[:self.max_batch_size]
+            if not self._pending:
+                self._has_items.clear()
+            if len(self._pending) < self.max_batch_size:
+                self._full.clear()
+
+            if batch:
+                await self._flush(batch)
+            if self._closed and not self._pending:
+                return
+
+    async def _flush(self, batch: List[Tuple[Dict[str, Any], asyncio.Future]]):
+        started = time.perf_counter()
+        try:
+            async with AsyncSessionLocal() as db:
+                ids = await cruds.create_events_bulk(
+                    db=db, events=[event for event, _ in batch], batch_size=self.max_batch_size
+                )
+        except Exception as e:
+            self.failed_events += len(batch)
+            logger.exception(f"Failed to flush {len(batch)} buffered events: {e}")
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        finally:
+            self.flush_latency.observe(time.perf_counter() - started)
+
+        self.flushed_batches += 1
+        self.flushed_events += len(ids)
+        for (_, future), event_id in zip(batch, ids):
+            if not future.done():
+                future.set_result(event_id)
+        logger.debug(f"Flushed {len(ids)} buffered events")
+
+
+event_write_buffer = EventWriteBuffer()
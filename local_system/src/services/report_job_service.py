@@ -0,0 +1,152 @@
+#-----------------------------------------------------------------------------------------#
+# [ 파일 개요 ]
+# 보고서 생성 → PDF 변환 → 이메일 전송을 HTTP 요청과 분리하여 백그라운드에서 처리하는 작업 큐를 정의합니다.
+# 작업 상태는 report_jobs 테이블에 저장되므로, 서버가 재시작되어도 대기/진행 중이던 작업을 다시 처리합니다.
+
+# [ 주요 로직 흐름 ]
+# 1. submit_report_job_service: 입력 검증 후 작업을 'queued' 상태로 저장하고 즉시 작업 ID를 반환.
+# 2. ReportJobWorker:
+#    a. start(): DB에서 미완료 작업을 다시 큐에 넣고, REPORT_WORKER_COUNT 개의 워커 태스크를 시작.
+#    b. _run_job(): generating(LLM) → rendering(PDF) → sending(SMTP) → completed 순으로 상태를 갱신하며 처리.
+#       - 보고서 내용은 생성 직후 저장되므로, 재시작 시 generating/rendering 단계에서 중단된 작업은 저장된 내용으로 PDF 변환부터 재개 (LLM 호출 반복 없음).
+#       - sending 단계에서 중단된 작업은 이미 이메일이 전송되었을 수 있으므로 다시 보내지 않고 'failed'로 기록 (중복 전송 방지).
+#       - 오류 발생 시 'failed' 상태와 오류 메시지를 저장. LLM 호출 실패(amake_report_content 예외)도 실패로 처리하며,
+#         보고서 내용은 저장하지 않으므로 재시도 시 LLM을 다시 호출함.
+#    c. stop(): 워커 태스크를 종료 (진행 중이던 작업은 다음 시작 시 위 규칙에 따라 다시 처리됨).
+# 3. get_report_job_service: 작업 상태 조회 (404 처리 포함).
+#-----------------------------------------------------------------------------------------#
+
+import asyncio
+import logging
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List
+
+from ..core.config import REPORT_WORKER_COUNT
+from ..db import models as db_models
+from ..db import cruds
+from ..db.database import AsyncSessionLocal
+from ..utils import make_pdf, send_email
+from ..chatbot import ChatBot
+from .event_service import get_report_inputs_service, load_event_image_base64, prefetched_rag_documents
+
+logger = logging.getLogger(__name__)
+
+
+class ReportJobWorker:
+    def __init__(self, worker_count: int = REPORT_WORKER_COUNT):
+        self.worker_count = max(1, worker_count)
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._tasks: List[asyncio.Task] = []
+
+    async def start(self):
+        """미완료 작업을 복구하고 워커 태스크를 시작합니다."""
+        if self._tasks:
+            return
+        try:
+            async with AsyncSessionLocal() as db:
+                pending_jobs = await cruds.get_unfinished_report_jobs(db)
+            for job in pending_jobs:
+                self._queue.put_nowait(job.id)
+            if pending_jobs:
+                logger.info(f"Re-queued {len(pending_jobs)} unfinished report jobs")
+        except Exception as e:
+            logger.exception(f"Failed to restore unfinished report jobs: {e}")
+
+        self._tasks = [
+            asyncio.create_task(self._worker_loop(i), name=f"report-worker-{i}")
+            for i in range(self.worker_count)
+        ]
+        logger.info(f"Started {self.worker_count} report job workers")
+
+    async def stop(self):
+        """워커 태스크를 종료합니다. 진행 중이던 작업은 DB에 미완료 상태로 남아 다음 시작 시 재처리됩니다 (sending 단계는 실패 처리)."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        logger.info("Stopped report job workers")
+
+    def enqueue(self, job_id: str):
+        self._queue.put_nowait(job_id)
+
+    @property
+    def queue_size(self) -> int:
+        return self._queue.qsize()
+
+    async def _worker_loop(self, worker_index: int):
+        while True:
+            job_id = await self._queue.get()
+            try:
+                await self._run_job(job_id)
+            except Exception as e:
+                logger.exception(f"[report-worker-{worker_index}] Unexpected error while running report job {job_id}: {e}")
+            finally:
+                self._queue.task_done()
+
+    async def _run_job(self, job_id: str):
+        async with AsyncSessionLocal() as db:
+            job = await cruds.get_report_job(db, job_id)
+            if not job or job.status not in cruds.UNFINISHED_REPORT_JOB_STATUSES:
+                return
+
+            if job.status == "sending":
+                # 이전 시도가 이메일 전송 중에 중단됨: 이미 전송되었을 수 있으므로 다시 보내지 않음
+                logger.warning(f"Report job {job_id} was interrupted while sending. Marking as failed to avoid a duplicate email.")
+                await cruds.update_report_job(
+                    db, job_id, status="failed",
+                    error="Interrupted while sending the email; it may already have been delivered. Submit a new job to resend.",
+                )
+                return
+
+            await cruds.update_report_job(db, job_id, increment_attempts=True)
+            try:
+                report_content = job.report_content
+                if report_content:
+                    logger.info(f"Report job {job_id} resuming from saved report content (status: {job.status})")
+                else:
+                    await cruds.update_report_job(db, job_id, status="generating")
+                    event, event_detail, solution = await get_report_inputs_service(db, job.event_id)
+                    chatbot = await asyncio.to_thread(ChatBot)
+                    image_base64 = await load_event_image_base64(event_detail)
+                    report_content = await chatbot.amake_report_content(
+                        event, image_base64, event_detail.explain, solution.answer,
+                        rag_documents=await prefetched_rag_documents(chatbot, job.event_id),
+                    )
+                    await cruds.update_report_job(db, job_id, report_content=report_content)
+
+                await cruds.update_report_job(db, job_id, status="rendering")
+                pdf_data = await asyncio.to_thread(make_pdf, report_content)
+
+                await cruds.update_report_job(db, job_id, status="sending")
+                await asyncio.to_thread(send_email, job.email, pdf_data)
+
+                await cruds.update_report_job(db, job_id, status="completed")
+                logger.info(f"Report job {job_id} for event ID {job.event_id} completed")
+            except asyncio.CancelledError:
+                # 종료 중 취소된 작업은 미완료 상태로 남겨 다음 시작 시 재처리
+                raise
+            except Exception as e:
+                detail = e.detail if isinstance(e, HTTPException) else (str(e) or type(e).__name__)
+                logger.exception(f"Report job {job_id} for event ID {job.event_id} failed: {detail}")
+                await cruds.update_report_job(db, job_id, status="failed", error=str(detail))
+
+
+report_job_worker = ReportJobWorker()
+
+
+async def submit_report_job_service(
+    db: AsyncSession, event_id: int, email: str
+) -> db_models.ReportJobModel:
+    """보고서 생성 작업 등록 서비스 로직 (입력 검증 후 즉시 반환)"""
+    await get_report_inputs_service(db, event_id) # 404/400 오류는 등록 시점에 바로 반환
+    job = await cruds.create_report_job(db, event_id=event_id, email=email)
+    report_job_worker.enqueue(job.id)
+    return job
+
+async def get_report_job_service(db: AsyncSession, job_id: str) -> db_models.ReportJobModel:
+    """보고서 생성 작업 상태 조회 서비스 로직"""
+    job = await cruds.get_report_job(db, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail=f"Report job with ID {job_id} not found")
+    return job
@@ -1 +1,3 @@
-from .util import encode_image, make_pdf, send_email
\ No newline at end of file
+from .util import encode_image, compress_image, to_base64, make_pdf, send_email, format_sse
+from .blob_store import BlobStore, image_store
+from .image_processing import apreprocess_image, read_upload_limited, shutdown_image_executor, UploadTooLargeError
@@ -0,0 +1,66 @@
+#-------------------------------------------------------------------------------------#
+# [ 파일 개요 ]
+# 바이너리 데이터(이벤트 이미지 등)를 로컬 디스크에 내용 주소(content-addressed) 방식으로 저장하는 BlobStore 클래스를 정의합니다.
+# DB에는 sha256 해시와 크기만 저장하고, 실제 바이트는 파일로 보관하여 DB 행 크기와 ORM 로딩 비용을 줄입니다.
+
+# [ 주요 로직 흐름 ]
+# 1. put(data): sha256 해시를 계산하고 root/ab/cd/<hash> 경로에 저장 (이미 있으면 생략 → 자연스러운 중복 제거).
+#    임시 파일에 쓴 뒤 os.replace로 원자적으로 이동하여 부분 기록된 파일이 노출되지 않도록 함.
+# 2. get(hash): 해시에 해당하는 바이트를 읽어 반환.
+# 3. path_for(hash): 해시를 2단계 디렉토리로 샤딩한 파일 경로 계산.
+#-------------------------------------------------------------------------------------#
+
+import hashlib
+import os
+import re
+import tempfile
+from typing import Tuple
+
+from ..core.config import IMAGE_STORE_DIR
+
+_HASH_PATTERN = re.compile(r"^[0-9a-f]{64}$")
+
+
+class BlobStore:
+    def __init__(self, root: str):
+        self.root = root
+
+    def path_for(self, digest: str) -> str:
+        if not _HASH_PATTERN.match(digest):
+            raise ValueError(f"Invalid blob hash: {digest}")
+        return os.path.join(self.root, digest[:2], digest[2:4], digest)
+
+    def exists(self, digest: str) -> bool:
+        return os.path.exists(self.path_for(digest))
+
+    def put(self, data: bytes) -> Tuple[str, int]:
+        """
+        데이터를 저장하고 (sha256 hex, 크기)를 반환합니다. 같은 내용은 한 번만 저장됩니다.
+        """
+        digest = hashlib.sha256(data).hexdigest()
+        path = self.path_for(digest)
+        if not os.path.exists(path):
+            directory = os.path.dirname(path)
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(data)
+                os.replace(tmp_path, path)
+            except Exception:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
+        return digest, len(data)
+
+    def get(self, digest: str) -> bytes:
+        """
+        해시에 해당하는 데이터를 읽어 반환합니다.
+        Raises:
+            FileNotFoundError: 해당 blob이 없을 때.
+        """
+        with open(self.path_for(digest), "rb") as f:
+            return f.read()
+
+
+image_store = BlobStore(IMAGE_STORE_DIR)
@@ -0,0 +1,76 @@
+#-------------------------------------------------------------------------------------#
+# [ 파일 개요 ]
+# 업로드 이미지 전처리(디코딩 → 축소 → JPEG 재인코딩)를 이벤트 루프 밖의 풀에서 실행하기 위한 유틸리티입니다.
+
+# [ 주요 로직 흐름 ]
+# 1. read_upload_limited(): UploadFile(SpooledTemporaryFile)을 청크 단위로 읽으며 IMAGE_MAX_UPLOAD_BYTES를 넘으면 즉시 중단.
+# 2. apreprocess_image(): compress_image(draft 모드 디코딩 + reduce 기반 축소)를 스레드/프로세스 풀에서 실행.
+#    - IMAGE_EXECUTOR=thread (기본): PIL은 디코딩/리사이즈 중 GIL을 해제하므로 스레드 풀로도 루프가 막히지 않음.
+#    - IMAGE_EXECUTOR=process: CPU 사용을 완전히 분리하고 싶을 때 사용 (워커 프로세스 메모리 추가 사용).
+# 3. shutdown_image_executor(): 애플리케이션 종료 시 풀 정리.
+#-------------------------------------------------------------------------------------#
+
+import asyncio
+import logging
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Optional
+
+from fastapi import UploadFile
+
+from ..core.config import IMAGE_MAX_UPLOAD_BYTES, IMAGE_EXECUTOR, IMAGE_WORKERS
+from .util import compress_image
+
+logger = logging.getLogger(__name__)
+
+_UPLOAD_CHUNK_SIZE = 1024 * 1024
+_executor: Optional[Executor] = None
+
+
+class UploadTooLargeError(ValueError):
+    """업로드 파일이 허용 크기를 초과한 경우 발생합니다."""
+
+
+async def read_upload_limited(upload: UploadFile, max_bytes: int = IMAGE_MAX_UPLOAD_BYTES) -> bytes:
+    """
+    업로드 파일을 청크 단위로 읽어 바이트로 반환합니다.
+    Raises:
+        UploadTooLargeError: 파일 크기가 max_bytes를 초과한 경우 (초과 시점에 읽기 중단).
+    """
+    if upload.size is not None and upload.size > max_bytes:
+        raise UploadTooLargeError(f"Upload is {upload.size} bytes (max {max_bytes})")
+
+    chunks = []
+    total = 0
+    while True:
+        chunk = await upload.read(_UPLOAD_CHUNK_SIZE)
+        if not chunk:
+            break
+        total += len(chunk)
+        if total > max_bytes:
+            raise UploadTooLargeError(f"Upload exceeds {max_bytes} bytes")
+        chunks.append(chunk)
+    return b"".join(chunks)
+
+
+def _get_executor() -> Executor:
+    global _executor
+    if _executor is None:
+        if IMAGE_EXECUTOR == "process":
+            _executor = ProcessPoolExecutor(max_workers=IMAGE_WORKERS)
+        else:
+            _executor = ThreadPoolExecutor(max_workers=IMAGE_WORKERS, thread_name_prefix="image-preprocess")
+        logger.info(f"Created image preprocessing {IMAGE_EXECUTOR} pool with {IMAGE_WORKERS} workers")
+    return _executor
+
+
+async def apreprocess_image(data: bytes) -> bytes:
+    """compress_image를 풀에서 실행하여 축소된 JPEG 바이트를 반환합니다."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_executor(), compress_image, data)
+
+
+def shutdown_image_executor():
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=True, cancel_futures=True)
+        _executor = None
@@ -0,0 +1,57 @@
+#-------------------------------------------------------------------------------------#
+# [ 파일 개요 ]
+# 서비스 내부 지연 시간 등을 관측하기 위한 간단한 인메모리 히스토그램(LatencyHistogram)을 정의합니다.
+# 외부 모니터링 의존성 없이 API 엔드포인트로 스냅샷을 노출하는 용도입니다.
+#-------------------------------------------------------------------------------------#
+
+import bisect
+import threading
+from typing import Any, Dict, Sequence
+
+# 기본 버킷 경계 (밀리초)
+DEFAULT_LATENCY_BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+
+class LatencyHistogram:
+    def __init__(self, buckets_ms: Sequence[float] = DEFAULT_LATENCY_BUCKETS_MS):
+        self.buckets_ms = tuple(sorted(buckets_ms))
+        self._counts = [0] * (len(self.buckets_ms) + 1) # 마지막 칸은 +Inf
+        self._lock = threading.Lock()
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def observe(self, seconds: float):
+        """관측값(초)을 기록합니다."""
+        ms = seconds * 1000.0
+        with self._lock:
+            self._counts[bisect.bisect_left(self.buckets_ms, ms)] += 1
+            self.count += 1
+            self.total_ms += ms
+            self.max_ms = max(self.max_ms, ms)
+
+    def _quantile(self, q: float) -> float:
+        """버킷 상한 기준의 근사 분위수(ms). 마지막(+Inf) 버킷이면 최댓값을 반환합니다."""
+        if not self.count:
+            return 0.0
+        target = q * self.count
+        cumulative = 0
+        for i, c in enumerate(self._counts):
+            cumulative += c
+            if cumulative >= target:
+                return self.buckets_ms[i] if i < len(self.buckets_ms) else self.max_ms
+        return self.max_ms
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            buckets = {f"le_{b:g}ms": c for b, c in zip(self.buckets_ms, self._counts)}
+            buckets["le_inf"] = self._counts[-1]
+            return {
+                "count": self.count,
+                "avg_ms": (self.total_ms / self.count) if self.count else 0.0,
+                "max_ms": self.max_ms,
+                "p50_ms": self._quantile(0.5),
+                "p95_ms": self._quantile(0.95),
+                "p99_ms": self._quantile(0.99),
+                "buckets": buckets,
+            }
@@ -0,0 +1,59 @@
+#-------------------------------------------------------------------------------------------------#
+# [ 테스트 개요 ]
+# vector_db.bm25_index의 하이브리드 검색 결과 병합(reciprocal_rank_fusion)을 검증합니다.
+
+# [ 사용법 ] (local_system 디렉토리에서 실행)
+#   python -m pytest tests
+#-------------------------------------------------------------------------------------------------#
+
+import pytest
+
+pytest.importorskip("langchain_core")
+
+from langchain_core.documents import Document
+
+from vector_db.bm25_index import document_key, reciprocal_rank_fusion
+
+
+def _doc(name, **metadata):
+    return Document(page_content=f"{name} 본문", metadata={"source": "test", "file_name": name, **metadata})
+
+
+def test_rrf_orders_by_summed_reciprocal_rank():
+    a, b, c, d = _doc("a"), _doc("b"), _doc("c"), _doc("d")
+    dense = [a, b, c]
+    sparse = [c, b, d]
+    # c: 1/63 + 1/61 > b: 1/62 + 1/62 > a: 1/61 > d: 1/63
+    fused = reciprocal_rank_fusion([dense, sparse], k=4)
+    assert [doc.metadata["file_name"] for doc in fused] == ["c", "b", "a", "d"]
+
+
+def test_rrf_truncates_to_k_and_handles_empty_lists():
+    a, b = _doc("a"), _doc("b")
+    assert [doc.metadata["file_name"] for doc in reciprocal_rank_fusion([[a, b], []], k=1)] == ["a"]
+    assert reciprocal_rank_fusion([[], []], k=3) == []
+    assert reciprocal_rank_fusion([[a]], k=0) == []
+
+
+def test_rrf_identifies_same_document_across_lists():
+    # 같은 content_hash는 객체가 달라도 한 문서로 합쳐지고, 처음 나온 객체를 반환
+    dense_hit = _doc("a", content_hash="h1")
+    sparse_hit = Document(page_content="a 본문", metadata={"content_hash": "h1", "score": 3.2})
+    other = _doc("b", content_hash="h2")
+    fused = reciprocal_rank_fusion([[other, dense_hit], [sparse_hit]], k=5)
+    assert len(fused) == 2 and fused[0] is dense_hit
+
+    # content_hash가 없으면 (source, file_name, chunk_index, 내용)으로 구분
+    assert document_key(_doc("a", chunk_index=0)) != document_key(_doc("a", chunk_index=1))
+    assert len(reciprocal_rank_fusion([[_doc("a", chunk_index=0)], [_doc("a", chunk_index=1)]], k=5)) == 2
+
+
+def test_rrf_k_constant_controls_rank_weight():
+    x, y = _doc("x"), _doc("y")
+    fillers = [_doc(f"f{i}") for i in range(8)]
+    # x: 한 목록에서 1위, 다른 목록에서 10위 / y: 두 목록 모두 3위
+    lists = [[x, fillers[0], y], fillers[1:3] + [y] + fillers[3:] + [fillers[0], x]]
+    assert lists[1].index(x) == 9 and lists[1].index(y) == 2
+    # rrf_k가 작으면 상위 순위의 가중치가 커서 x, 기본값(60)에서는 두 목록에 고르게 나온 y가 앞섬
+    assert reciprocal_rank_fusion(lists, k=1, rrf_k=1)[0] is x
+    assert reciprocal_rank_fusion(lists, k=1)[0] is y
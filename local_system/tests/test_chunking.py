@@ -0,0 +1,111 @@
+#-------------------------------------------------------------------------------------------------#
+# [ 테스트 개요 ]
+# vector_db.chunking의 문장 단위 청크 분할(chunk_spans/split_into_chunks)과 인접 청크 병합(merge_adjacent_chunks)을 검증합니다.
+
+# [ 사용법 ] (local_system 디렉토리에서 실행)
+#   python -m pytest tests
+#-------------------------------------------------------------------------------------------------#
+
+import pytest
+
+pytest.importorskip("langchain_core")
+
+from langchain_core.documents import Document
+
+from vector_db.chunking import chunk_spans, merge_adjacent_chunks, sentence_spans, split_into_chunks
+
+SAMPLE_TEXT = (
+    "1. 설비 A의 온도가 기준치를 넘었습니다. 냉각수 밸브를 확인하세요! "
+    "2. 압력 센서 값이 흔들리면 배선 상태를 점검합니까? 필터가 막혔는지도 확인해야 합니다. "
+    "3) 조치 후에는 30분 동안 상태를 관찰하고 이상이 없으면 정상 운전으로 전환합니다. "
+    "반복 발생 시 담당 엔지니어에게 보고하고 교체 부품 목록을 작성합니다."
+)
+
+
+def test_sentence_spans_keep_list_markers_with_sentence():
+    sentences = [SAMPLE_TEXT[start:end] for start, end in sentence_spans(SAMPLE_TEXT)]
+    assert sentences[0] == "1. 설비 A의 온도가 기준치를 넘었습니다."
+    assert sentences[2].startswith("2. 압력 센서")
+    assert sentences[4].startswith("3) 조치 후")
+    assert all(not sentence.startswith(" ") and not sentence.endswith(" ") for sentence in sentences)
+
+
+@pytest.mark.parametrize("chunk_size, chunk_overlap", [(60, 20), (80, 0), (120, 50), (1000, 50)])
+def test_chunk_spans_cover_text_within_limits(chunk_size, chunk_overlap):
+    spans = chunk_spans(SAMPLE_TEXT, chunk_size, chunk_overlap)
+    assert spans[0][0] == 0 and spans[-1][1] == len(SAMPLE_TEXT)
+    for (start, end), (next_start, next_end) in zip(spans, spans[1:]):
+        assert end - start <= chunk_size
+        assert start < next_start and end < next_end
+        # 다음 청크는 직전 청크의 끝 문장들(최대 chunk_overlap 문자)로 시작하거나 바로 다음 문장부터 시작
+        assert next_start >= end - chunk_overlap
+        assert not SAMPLE_TEXT[end:next_start].strip()
+    if chunk_size >= len(SAMPLE_TEXT):
+        assert spans == [(0, len(SAMPLE_TEXT))]
+
+
+def test_chunk_spans_split_long_sentence_on_spaces():
+    text = " ".join(f"단어{i:02d}" for i in range(40)) + "."
+    spans = chunk_spans(text, chunk_size=30, chunk_overlap=10)
+    assert len(spans) > 1
+    assert all(end - start <= 30 for start, end in spans)
+    assert " ".join(text[start:end] for start, end in spans) == text
+
+    # 공백이 없으면 chunk_size 위치에서 나눔
+    spans = chunk_spans("가" * 70, chunk_size=30, chunk_overlap=5)
+    assert spans == [(0, 30), (30, 60), (60, 70)]
+
+
+def test_chunk_spans_rejects_overlap_not_smaller_than_size():
+    with pytest.raises(ValueError):
+        chunk_spans(SAMPLE_TEXT, chunk_size=50, chunk_overlap=50)
+
+
+def test_split_into_chunks_metadata_matches_text():
+    document = Document(page_content=SAMPLE_TEXT, metadata={"source": "manual", "file_name": "a.pdf"})
+    chunks = split_into_chunks(document, chunk_size=60, chunk_overlap=20)
+    assert len(chunks) > 2
+    for index, chunk in enumerate(chunks):
+        meta = chunk.metadata
+        assert meta["source"] == "manual" and meta["file_name"] == "a.pdf"
+        assert meta["chunk_index"] == index and meta["chunk_count"] == len(chunks)
+        assert SAMPLE_TEXT[meta["chunk_start"]:meta["chunk_end"]] == chunk.page_content
+
+
+def test_merge_adjacent_chunks_restores_original_passage():
+    document = Document(page_content=SAMPLE_TEXT, metadata={"source": "manual", "file_name": "a.pdf"})
+    chunks = split_into_chunks(document, chunk_size=60, chunk_overlap=20)
+    assert len(chunks) >= 4
+
+    # 검색 순위와 무관하게 chunk_index 순으로 합치고, 겹치는 문장은 한 번만 포함
+    merged = merge_adjacent_chunks([chunks[2], chunks[0], chunks[1]])
+    assert len(merged) == 1
+    start, end = chunks[0].metadata["chunk_start"], chunks[2].metadata["chunk_end"]
+    assert merged[0].page_content == SAMPLE_TEXT[start:end]
+    assert merged[0].metadata["chunk_index"] == 2 and merged[0].metadata["chunk_end"] == end
+
+    # 모든 청크를 합치면 원문 전체
+    assert merge_adjacent_chunks(list(reversed(chunks)))[0].page_content == SAMPLE_TEXT
+
+
+def test_merge_adjacent_chunks_keeps_gaps_other_parents_and_rank():
+    document = Document(page_content=SAMPLE_TEXT, metadata={"source": "manual", "file_name": "a.pdf"})
+    chunks = split_into_chunks(document, chunk_size=60, chunk_overlap=20)
+    other = split_into_chunks(Document(page_content=SAMPLE_TEXT, metadata={"source": "manual", "file_name": "b.pdf"}), 60, 20)
+    plain = Document(page_content="청크가 아닌 문서", metadata={"source": "event"})
+
+    results = merge_adjacent_chunks([other[0], chunks[3], plain, chunks[0], chunks[1], chunks[3]])
+    # b.pdf 청크(순위 0), a.pdf 3번(순위 1, 중복 제거), 일반 문서(순위 2), a.pdf 0~1번 병합(순위 3)
+    assert [doc.page_content for doc in results] == [
+        other[0].page_content,
+        chunks[3].page_content,
+        plain.page_content,
+        SAMPLE_TEXT[chunks[0].metadata["chunk_start"]:chunks[1].metadata["chunk_end"]],
+    ]
+
+
+def test_merge_adjacent_chunks_without_overlap_joins_with_space():
+    first = Document(page_content="첫 문장입니다.", metadata={"source": "s", "chunk_index": 0, "chunk_start": 0, "chunk_end": 8})
+    second = Document(page_content="둘째 문장입니다.", metadata={"source": "s", "chunk_index": 1, "chunk_start": 9, "chunk_end": 18})
+    merged = merge_adjacent_chunks([second, first])
+    assert [doc.page_content for doc in merged] == ["첫 문장입니다. 둘째 문장입니다."]
@@ -0,0 +1,172 @@
+#-------------------------------------------------------------------------------------------------#
+# [ 테스트 개요 ]
+# vector_db.ingestion의 스트리밍 JSON 읽기(iter_json_array)와 체크포인트 재개 로직을 검증합니다.
+#   - Chroma/임베딩 모델 없이 메모리 저장소(_MemoryDB)와 가짜 임베딩(_CountingEmbeddings)을 사용합니다.
+
+# [ 사용법 ] (local_system 디렉토리에서 실행)
+#   python -m pytest tests
+#-------------------------------------------------------------------------------------------------#
+
+import json
+
+import pytest
+
+pytest.importorskip("langchain_core")
+pytest.importorskip("langchain_chroma")
+
+from langchain_core.documents import Document
+
+from vector_db.chromadb_wrapper import ChromaDBWrapper
+from vector_db.ingestion import file_fingerprint, ingest_documents, iter_json_array, load_checkpoint
+
+
+class _Interrupted(Exception):
+    pass
+
+
+class _CountingEmbeddings:
+    """임베딩한 텍스트를 기록하고, fail_after번째 호출 이후에는 _Interrupted를 발생시킵니다."""
+
+    def __init__(self, fail_after=None):
+        self.fail_after = fail_after
+        self.calls = 0
+        self.texts = []
+
+    def embed_documents(self, texts):
+        if self.fail_after is not None and self.calls >= self.fail_after:
+            raise _Interrupted()
+        self.calls += 1
+        self.texts.extend(texts)
+        return [[float(len(text)), 1.0] for text in texts]
+
+
+class _MemoryDB(ChromaDBWrapper):
+    """ingest_documents가 사용하는 메서드만 메모리 dict로 구현한 ChromaDBWrapper."""
+
+    def __init__(self, embeddings):
+        self.model_name = "test"
+        self.backend = None
+        self.embeddings = embeddings
+        self.records = {}
+
+    def existing_metadatas(self, ids=None):
+        return {doc_id: self.records[doc_id][1] for doc_id in (ids or self.records) if doc_id in self.records}
+
+    def upsert_embedded(self, ids, documents, embeddings):
+        for doc_id, doc, vector in zip(ids, documents, embeddings):
+            self.records[doc_id] = (doc.page_content, doc.metadata, vector)
+
+    def delete_stale(self, keep_ids, sources, file_names, existing_metadatas=None):
+        stale = [doc_id for doc_id, (_, metadata, _) in self.records.items() if doc_id not in keep_ids and metadata.get("source") in sources]
+        for doc_id in stale:
+            del self.records[doc_id]
+        return len(stale)
+
+
+def _write_items(path, count):
+    items = [{"id": item, "text": f"항목 {item} 본문. " + "내용 " * (item % 7)} for item in range(count)]
+    path.write_text(json.dumps(items, ensure_ascii=False, indent=1), encoding="utf-8")
+    return items
+
+
+def _documents(items, chunks_per_item=3):
+    """항목마다 청크 여러 개를 만들어 배치 경계가 항목 중간에 걸리도록 합니다."""
+    for item_no, item in enumerate(items):
+        for chunk_index in range(chunks_per_item):
+            yield item_no, Document(
+                page_content=f"{item['text']} #{chunk_index}",
+                metadata={"source": "test", "file_name": f"{item['id']}.json", "chunk_index": chunk_index},
+            )
+
+
+def _interrupt_after(documents, count):
+    for i, document in enumerate(documents):
+        if i == count:
+            raise _Interrupted()
+        yield document
+
+
+def test_iter_json_array_across_chunk_boundaries(tmp_path):
+    path = tmp_path / "items.json"
+    items = _write_items(path, 50)
+    items.append({"nested": {"list": [1, 2, {"s": "], ["}], "quote": "\"}\""}})
+    path.write_text(json.dumps(items, ensure_ascii=False), encoding="utf-8")
+
+    # 버퍼 크기를 항목보다 작게 잡아 항목이 여러 번의 read에 걸쳐 나뉘도록 함
+    for chunk_size in (1, 7, 64, 1 << 16):
+        assert list(iter_json_array(str(path), chunk_size=chunk_size)) == items
+
+
+def test_iter_json_array_empty_and_invalid(tmp_path):
+    empty = tmp_path / "empty.json"
+    empty.write_text("  [ \n ]  ", encoding="utf-8")
+    assert list(iter_json_array(str(empty), chunk_size=2)) == []
+
+    not_list = tmp_path / "object.json"
+    not_list.write_text('{"a": 1}', encoding="utf-8")
+    with pytest.raises(ValueError):
+        list(iter_json_array(str(not_list)))
+
+    truncated = tmp_path / "truncated.json"
+    truncated.write_text('[{"a": 1}, {"b": ', encoding="utf-8")
+    with pytest.raises(json.JSONDecodeError):
+        list(iter_json_array(str(truncated), chunk_size=4))
+
+
+def test_resume_after_interruption(tmp_path):
+    path = tmp_path / "items.json"
+    _write_items(path, 40)
+    checkpoint = str(tmp_path / "ingest.checkpoint")
+    fingerprint = file_fingerprint(str(path))
+
+    def run(embeddings, stop_after=None):
+        db.embeddings = embeddings
+        documents = _documents(iter_json_array(str(path), chunk_size=32))
+        if stop_after is not None:
+            documents = _interrupt_after(documents, stop_after)
+        return ingest_documents(db, documents, batch_size=8, checkpoint_path=checkpoint, fingerprint=fingerprint)
+
+    db = _MemoryDB(_CountingEmbeddings())
+    with pytest.raises(_Interrupted):
+        run(_CountingEmbeddings(fail_after=5))
+    items_done = load_checkpoint(checkpoint, fingerprint)
+    # 배치 크기 8(청크 3개씩)이므로 배치 마지막 항목은 다음 배치에 이어짐 → 그 이전 항목까지만 완료
+    assert 0 < items_done < 40
+    written = set(db.records)
+
+    # 재개 직후(이미 완료된 항목을 건너뛰는 중) 다시 중단되어도 체크포인트가 앞선 배치의 항목 번호로 되돌아가지 않아야 함
+    with pytest.raises(_Interrupted):
+        run(_CountingEmbeddings(), stop_after=20)
+    assert load_checkpoint(checkpoint, fingerprint) >= items_done
+
+    embeddings = _CountingEmbeddings()
+    stats = run(embeddings)
+    assert stats["resumed"] == items_done * 3
+    # 완료로 기록된 항목은 다시 임베딩하지 않고, 일부만 기록된 항목은 변경 없음으로 건너뜀
+    assert not any(text.startswith(f"항목 {item} ") for item in range(items_done) for text in embeddings.texts)
+    assert stats["added"] + stats["unchanged"] + stats["resumed"] == 40 * 3
+    assert stats["unchanged"] >= len(written) - items_done * 3
+    assert len(db.records) == 40 * 3
+    assert not (tmp_path / "ingest.checkpoint").exists()
+
+    # 처음부터 다시 실행하면 모든 문서가 변경 없음으로 처리되어 임베딩하지 않음
+    embeddings = _CountingEmbeddings()
+    stats = run(embeddings)
+    assert stats["unchanged"] == 40 * 3 and embeddings.calls == 0
+
+
+def test_checkpoint_ignored_when_input_changes(tmp_path):
+    path = tmp_path / "items.json"
+    _write_items(path, 10)
+    checkpoint = str(tmp_path / "ingest.checkpoint")
+    # 배치는 다음 배치가 제출될 때 기록되므로 세 번째 배치에서 중단해야 체크포인트가 남음
+    db = _MemoryDB(_CountingEmbeddings(fail_after=2))
+    with pytest.raises(_Interrupted):
+        ingest_documents(
+            db, _documents(iter_json_array(str(path))), batch_size=4,
+            checkpoint_path=checkpoint, fingerprint=file_fingerprint(str(path)),
+        )
+    assert load_checkpoint(checkpoint, file_fingerprint(str(path))) > 0
+
+    _write_items(path, 12)
+    assert load_checkpoint(checkpoint, file_fingerprint(str(path))) == 0
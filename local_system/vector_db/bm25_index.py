@@ -0,0 +1,145 @@
+#-------------------------------------------------------------------------------------------------#
+# [ 파일 개요 ]
+# 벡터 검색이 놓치는 설비 코드(R-501, HV-502)나 화학물질명 같은 정확한 표현을 찾기 위한 BM25 역색인입니다.
+# 적재 시 벡터 DB와 같은 문서(청크)로 만들어 벡터 DB 디렉토리에 저장하고, 서버는 메모리에 올려 사용합니다.
+
+# [ 토크나이저 (tokenize) ]
+# - 한글: 형태소 분석기 없이 문자 bigram (조사/어미가 붙어도 어근 bigram이 일치)
+# - 영문/숫자: 설비 코드·화학식 전체를 하나의 토큰으로 (구분자 -, _, . 를 뺀 형태도 함께 추가: R-501 → r-501, r501)
+
+# [ 주요 로직 흐름 ]
+# 1. BM25Index.build(): 문서별 토큰 빈도로 posting list 생성 → save()로 gzip JSON 저장 (bm25_index.json.gz).
+# 2. search(): 쿼리 토큰의 posting list만 순회하여 BM25 점수 누적 → top-k (수천 건 기준 1ms 미만).
+# 3. reciprocal_rank_fusion(): 벡터 검색 결과와 BM25 결과의 순위를 RRF(1 / (rrf_k + rank))로 합산.
+#-------------------------------------------------------------------------------------------------#
+
+import gzip
+import heapq
+import json
+import math
+import os
+import re
+from collections import Counter
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from langchain_core.documents import Document
+
+BM25_INDEX_FILENAME = "bm25_index.json.gz"
+TOKEN_PATTERN = re.compile(r"[0-9a-z](?:[0-9a-z\-_.]*[0-9a-z])?|[가-힣]+")
+CODE_SEPARATORS = re.compile(r"[\-_.]")
+
+
+def tokenize(text: str, ngram: int = 2) -> List[str]:
+    tokens = []
+    for match in TOKEN_PATTERN.finditer(text.casefold()):
+        word = match.group()
+        if "가" <= word[0] <= "힣":
+            if len(word) <= ngram:
+                tokens.append(word)
+            else:
+                tokens.extend(word[i:i + ngram] for i in range(len(word) - ngram + 1))
+        else:
+            tokens.append(word)
+            compact = CODE_SEPARATORS.sub("", word)
+            if compact != word:
+                tokens.append(compact)
+    return tokens
+
+
+def document_key(document: Document):
+    """같은 문서(청크)를 결과 목록 사이에서 식별하기 위한 키."""
+    metadata = document.metadata or {}
+    if "content_hash" in metadata:
+        return metadata["content_hash"]
+    return metadata.get("source"), metadata.get("file_name"), metadata.get("chunk_index"), document.page_content
+
+
+class BM25Index:
+    def __init__(
+        self,
+        documents: List[Document],
+        postings: Dict[str, List[Tuple[int, int]]],
+        doc_lengths: List[int],
+        k1: float = 1.5,
+        b: float = 0.75,
+    ):
+        self.documents = documents
+        self.postings = postings
+        self.doc_lengths = doc_lengths
+        self.k1 = k1
+        self.b = b
+        self.avg_length = (sum(doc_lengths) / len(doc_lengths)) if doc_lengths else 0.0
+        count = len(documents)
+        self.idf = {
+            token: math.log(1 + (count - len(plist) + 0.5) / (len(plist) + 0.5))
+            for token, plist in postings.items()
+        }
+
+    @classmethod
+    def build(cls, documents: Sequence[Document], k1: float = 1.5, b: float = 0.75) -> "BM25Index":
+        postings: Dict[str, List[Tuple[int, int]]] = {}
+        doc_lengths = []
+        for index, document in enumerate(documents):
+            counts = Counter(tokenize(document.page_content))
+            doc_lengths.append(sum(counts.values()))
+            for token, tf in counts.items():
+                postings.setdefault(token, []).append((index, tf))
+        return cls(list(documents), postings, doc_lengths, k1, b)
+
+    def __len__(self) -> int:
+        return len(self.documents)
+
+    def search_with_scores(self, query: str, k: int = 5) -> List[Tuple[Document, float]]:
+        scores: Dict[int, float] = {}
+        for token, query_tf in Counter(tokenize(query)).items():
+            plist = self.postings.get(token)
+            if not plist:
+                continue
+            idf = self.idf[token]
+            for index, tf in plist:
+                norm = self.k1 * (1 - self.b + self.b * self.doc_lengths[index] / (self.avg_length or 1.0))
+                scores[index] = scores.get(index, 0.0) + query_tf * idf * tf * (self.k1 + 1) / (tf + norm)
+        top = heapq.nlargest(k, scores.items(), key=lambda item: item[1])
+        return [(self.documents[index], score) for index, score in top]
+
+    def search(self, query: str, k: int = 5) -> List[Document]:
+        return [doc for doc, _ in self.search_with_scores(query, k)]
+
+    def save(self, path: str):
+        payload = {
+            "k1": self.k1,
+            "b": self.b,
+            "documents": [{"page_content": d.page_content, "metadata": d.metadata} for d in self.documents],
+            "doc_lengths": self.doc_lengths,
+            "postings": self.postings,
+        }
+        tmp_path = f"{path}.tmp"
+        with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+            json.dump(payload, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> "BM25Index":
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            payload = json.load(f)
+        documents = [Document(page_content=d["page_content"], metadata=d.get("metadata") or {}) for d in payload["documents"]]
+        return cls(documents, payload["postings"], payload["doc_lengths"], payload["k1"], payload["b"])
+
+    @classmethod
+    def load_from_directory(cls, directory: str) -> Optional["BM25Index"]:
+        """벡터 DB 디렉토리에 BM25 인덱스 파일이 있으면 로드합니다."""
+        path = os.path.join(directory, BM25_INDEX_FILENAME)
+        return cls.load(path) if os.path.exists(path) else None
+
+
+def reciprocal_rank_fusion(result_lists: Sequence[Sequence[Document]], k: int, rrf_k: int = 60) -> List[Document]:
+    """여러 검색 결과 목록을 RRF 점수(Σ 1 / (rrf_k + 순위))로 합쳐 상위 k개를 반환합니다."""
+    scores: Dict[object, float] = {}
+    first_seen: Dict[object, Document] = {}
+    for results in result_lists:
+        for rank, document in enumerate(results, start=1):
+            key = document_key(document)
+            scores[key] = scores.get(key, 0.0) + 1.0 / (rrf_k + rank)
+            first_seen.setdefault(key, document)
+    ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)[:k]
+    return [first_seen[key] for key, _ in ranked]
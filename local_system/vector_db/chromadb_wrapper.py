@@ -2,38 +2,40 @@
 
 import os
 import json
+import hashlib
 # from langchain_community.vectorstores import Chroma # 이전 방식
 # from langchain_community.embeddings import HuggingFaceEmbeddings # 이전 방식
 from langchain_chroma import Chroma # 새 방식 (langchain-chroma 패키지)
-from langchain_huggingface import HuggingFaceEmbeddings # 새 방식 (langchain-huggingface 패키지)
+from .embedders import create_embeddings # torch(HuggingFaceEmbeddings) 또는 ONNX 백엔드
 from langchain_core.documents import Document
 from dotenv import load_dotenv
 import logging
 
 logger = logging.getLogger(__name__)
 
+# 문서 ID 계산에 사용하는 메타데이터 키 (같은 원본 문서/청크는 내용이 바뀌어도 같은 ID로 upsert)
+DOCUMENT_KEY_FIELDS = ("source", "file_name", "chunk_index")
+# 한 번의 upsert 호출에 담을 최대 문서 수 (Chroma 최대 배치 크기 이하)
+UPSERT_BATCH_SIZE = 1000
+
 
 class ChromaDBWrapper:
-    def __init__(self, persist_directory="./chroma_db", model_name="snunlp/KR-SBERT-V40K-klueNLI-augSTS"):
+    def __init__(self, persist_directory="./chroma_db", model_name="snunlp/KR-SBERT-V40K-klueNLI-augSTS", backend=None):
         load_dotenv() # OPENAI_API_KEY는 이제 필요 없지만, 다른 환경변수를 위해 남겨둘 수 있음
         self.persist_directory = persist_directory
         self.model_name = model_name
+        self.backend = backend
         
         logger.info(f"ChromaDBWrapper 초기화 시작. 모델: {self.model_name}")
 
         try:
-            # HuggingFaceEmbeddings 초기화
-            # GPU 사용 가능 시 device='cuda', 아니면 device='cpu' (기본값)
+            # 임베딩 초기화 (backend 생략 시 EMBEDDING_BACKEND 환경 변수, 기본값 torch)
             # 멀티프로세싱 관련 경고를 피하기 위해 일부 환경 변수 설정 (필요시)
             # os.environ["TOKENIZERS_PARALLELISM"] = "false"
-            self.embeddings = HuggingFaceEmbeddings(
-                model_name=self.model_name,
-                model_kwargs={'device': 'cpu'}, # CPU 사용 명시, GPU 사용 시 'cuda'
-                encode_kwargs={'normalize_embeddings': True} # 임베딩 정규화 (일반적으로 성능 향상)
-            )
+            self.embeddings = create_embeddings(model_name=self.model_name, backend=backend)
             logger.info(f"임베딩 모델 로드 완료: {self.model_name}")
         except Exception as e:
-            logger.exception(f"HuggingFace 임베딩 모델 로드 중 오류 발생: {e}")
+            logger.exception(f"임베딩 모델 로드 중 오류 발생: {e}")
             self.embeddings = None # 오류 발생 시 None으로 설정
             # 또는 여기서 예외를 다시 발생시켜 프로그램 중단 고려
             raise
@@ -50,7 +52,130 @@ class ChromaDBWrapper:
             # 또는 여기서 예외를 다시 발생시켜 프로그램 중단 고려
             raise
 
+    @staticmethod
+    def content_hash(document: Document) -> str:
+        """문서 내용과 메타데이터(content_hash 제외)의 sha256 해시. 내용이나 메타데이터가 바뀌면 값이 달라집니다."""
+        metadata = {k: v for k, v in (document.metadata or {}).items() if k != "content_hash"}
+        payload = json.dumps({"content": document.page_content, "metadata": metadata}, ensure_ascii=False, sort_keys=True)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    @classmethod
+    def document_id(cls, document: Document, key_fields: tuple = DOCUMENT_KEY_FIELDS) -> str:
+        """
+        문서의 안정적인 ID를 계산합니다.
+        key_fields(예: source, file_name, chunk_index) 중 하나라도 메타데이터에 있으면 그 값들의 해시를 ID로 사용하여
+        같은 원본 문서(청크)가 수정되면 같은 ID로 upsert 되도록 하고, 없으면 내용 해시를 ID로 사용합니다.
+        """
+        metadata = document.metadata or {}
+        if key_fields and any(field in metadata for field in key_fields):
+            key = json.dumps([metadata.get(field) for field in key_fields], ensure_ascii=False)
+            return hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return cls.content_hash(document)
+
+    def prepare_documents(self, documents: list[Document], key_fields: tuple = DOCUMENT_KEY_FIELDS) -> dict[str, Document]:
+        """문서마다 안정적인 ID를 계산하고 메타데이터에 content_hash를 추가합니다. (ID 중복 시 마지막 항목 사용)"""
+        prepared: dict[str, Document] = {}
+        for document in documents:
+            metadata = dict(document.metadata or {})
+            metadata["content_hash"] = self.content_hash(document)
+            doc_id = self.document_id(document, key_fields)
+            if doc_id in prepared:
+                logger.warning(f"⚠️ 같은 ID의 문서가 중복되어 마지막 항목을 사용합니다: {metadata.get('file_name', doc_id)}")
+            prepared[doc_id] = Document(page_content=document.page_content, metadata=metadata)
+        return prepared
+
+    def existing_metadatas(self, ids: list[str] | None = None) -> dict[str, dict]:
+        """DB에 저장된 문서의 ID → 메타데이터 (ids를 지정하면 해당 ID만 조회)."""
+        existing = self.db.get(ids=ids, include=["metadatas"]) if ids is not None else self.db.get(include=["metadatas"])
+        return {
+            doc_id: metadata or {}
+            for doc_id, metadata in zip(existing.get("ids", []), existing.get("metadatas") or [])
+        }
+
+    def upsert_embedded(self, ids: list[str], documents: list[Document], embeddings: list[list[float]]):
+        """이미 계산된 임베딩으로 문서를 upsert 합니다 (임베딩 모델을 다시 호출하지 않음)."""
+        for i in range(0, len(ids), UPSERT_BATCH_SIZE):
+            batch = documents[i:i + UPSERT_BATCH_SIZE]
+            self.db._collection.upsert(
+                ids=ids[i:i + UPSERT_BATCH_SIZE],
+                embeddings=embeddings[i:i + UPSERT_BATCH_SIZE],
+                documents=[d.page_content for d in batch],
+                metadatas=[d.metadata for d in batch],
+            )
+
+    def delete_stale(self, keep_ids: set[str], sources: set, file_names: set, existing_metadatas: dict[str, dict] | None = None) -> int:
+        """
+        sources에 속한 기존 문서 중 keep_ids에 없는 문서를 삭제하고 삭제 건수를 반환합니다.
+        (content_hash가 없는 이전 방식의 자동 ID 문서도 file_names에 있으면 함께 정리됩니다.)
+        """
+        if existing_metadatas is None:
+            existing_metadatas = self.existing_metadatas()
+        stale_ids = [
+            doc_id for doc_id, metadata in existing_metadatas.items()
+            if doc_id not in keep_ids and (
+                metadata.get("source") in sources
+                # 이전 방식(자동 ID, 절대 경로 source)으로 저장된 같은 파일의 문서
+                or ("content_hash" not in metadata and metadata.get("file_name") in file_names)
+            )
+        ]
+        if stale_ids:
+            self.db.delete(ids=stale_ids)
+        return len(stale_ids)
+
+    def sync_documents(self, documents: list[Document], prune: bool = True, key_fields: tuple = DOCUMENT_KEY_FIELDS) -> dict:
+        """
+        문서 목록을 DB와 증분 동기화합니다 (여러 번 실행해도 결과가 같음).
+        - 새 ID: 추가 / 같은 ID인데 content_hash가 다름: upsert / 같은 content_hash: 건너뜀 (임베딩 안 함)
+        - prune=True이면 입력 문서와 같은 source를 가진 기존 문서 중 입력에 없는 ID는 삭제
+          (content_hash가 없는 이전 방식의 자동 ID 문서도 같은 file_name이면 이 단계에서 정리됩니다.)
+        Returns:
+            {"added", "updated", "unchanged", "deleted"} 건수
+        """
+        stats = {"added": 0, "updated": 0, "unchanged": 0, "deleted": 0}
+        if not self.db:
+            logger.error("🚫 Chroma DB가 초기화되지 않아 문서를 동기화할 수 없습니다.")
+            return stats
+
+        incoming = self.prepare_documents(documents, key_fields)
+        existing_metadatas = self.existing_metadatas()
+
+        to_upsert_ids, to_upsert_docs = [], []
+        for doc_id, document in incoming.items():
+            if doc_id not in existing_metadatas:
+                stats["added"] += 1
+            elif existing_metadatas[doc_id].get("content_hash") != document.metadata["content_hash"]:
+                stats["updated"] += 1
+            else:
+                stats["unchanged"] += 1
+                continue
+            to_upsert_ids.append(doc_id)
+            to_upsert_docs.append(document)
+
+        # langchain_chroma의 add_documents(ids=...)는 내부적으로 upsert를 사용합니다.
+        for i in range(0, len(to_upsert_docs), UPSERT_BATCH_SIZE):
+            self.db.add_documents(
+                documents=to_upsert_docs[i:i + UPSERT_BATCH_SIZE], ids=to_upsert_ids[i:i + UPSERT_BATCH_SIZE]
+            )
+
+        if prune:
+            stats["deleted"] = self.delete_stale(
+                set(incoming),
+                {d.metadata.get("source") for d in incoming.values()},
+                {d.metadata.get("file_name") for d in incoming.values()},
+                existing_metadatas,
+            )
+
+        logger.info(
+            f"✅ ChromaDB 동기화 완료: 추가 {stats['added']}, 변경 {stats['updated']}, "
+            f"유지 {stats['unchanged']}, 삭제 {stats['deleted']}"
+        )
+        return stats
+
     def add_documents(self, documents: list[Document]): # 타입 힌트 명시
+        """
+        문서를 추가합니다. 내용 해시 기반 ID를 사용하므로 같은 문서를 다시 추가해도 중복되지 않습니다.
+        (입력에 없는 기존 문서는 삭제하지 않습니다. 전체 동기화는 sync_documents 사용)
+        """
         try:
             if not documents:
                 logger.warning("⚠️ 추가할 문서가 없습니다.")
@@ -59,41 +184,9 @@ class ChromaDBWrapper:
                 logger.error("🚫 Chroma DB가 초기화되지 않아 문서를 추가할 수 없습니다.")
                 return
 
-            # 중복 제거 로직은 기존 문서의 내용을 가져와야 하므로, get() 메서드 사용
-            # 다만, get() 메서드가 현재 모든 document object를 반환하는지, 아니면 텍스트만 반환하는지 확인 필요
-            # 현재 get()은 raw dict를 반환하므로, 여기서 직접 사용하기보다는
-            # ChromaDB의 id를 활용한 중복 방지나, 추가 전에 내용을 비교하는 방식이 더 적합할 수 있음
-            # 단순화를 위해 여기서는 중복 제거 로직을 임시로 주석 처리하거나,
-            # ChromaDB에서 id를 기반으로 한 중복 삽입 방지 기능 활용 (ChromaDB 자체에서 중복 ID 삽입 시 업데이트)
-            
-            # # 중복 제거를 위해 기존 데이터 확인 (텍스트 기반, 비효율적일 수 있음)
-            # existing_docs_texts = set()
-            # try:
-            #     # get() 메서드가 Document 객체의 리스트를 반환한다고 가정.
-            #     # 실제 Chroma.get()은 Document가 아닌 dict의 list를 반환할 수 있음.
-            #     # 이 부분은 ChromaDB의 get() 반환값에 따라 수정 필요.
-            #     # 여기서는 간단히 모든 문서를 추가하는 것으로 가정.
-            #     # existing_data = self.db.get(include=["documents"]) # "documents" 필드 포함
-            #     # if existing_data and existing_data.get("documents"):
-            #     #     existing_docs_texts = {doc_content for doc_content in existing_data["documents"]}
-            #     pass
-            # except Exception as e:
-            #     logger.warning(f"기존 문서 내용을 가져오는 중 오류: {e}. 중복 검사 없이 진행합니다.")
-
-            # new_documents = [
-            #     doc for doc in documents if doc.page_content not in existing_docs_texts
-            # ]
-            
-            # Langchain의 Chroma는 기본적으로 ID가 같으면 업데이트, 다르면 추가.
-            # ID를 명시적으로 관리하지 않으면 자동으로 생성하므로 중복될 수 있음.
-            # 여기서는 Document에 ID를 부여하지 않고 추가합니다.
-            # 필요시, 문서 내용의 해시값을 ID로 사용하는 등의 전략을 고려할 수 있습니다.
-            new_documents = documents # 임시로 중복 검사 없이 모든 문서를 대상으로 함
-
-            if new_documents:
-                # ids = [f"doc_{i}" for i in range(len(new_documents))] # 간단한 ID 생성 예시
-                self.db.add_documents(documents=new_documents) # ids 파라미터는 선택 사항
-                logger.info(f"✅ ChromaDB에 {len(new_documents)}개의 문서 추가 완료")
+            stats = self.sync_documents(documents, prune=False)
+            if stats["added"] or stats["updated"]:
+                logger.info(f"✅ ChromaDB에 {stats['added'] + stats['updated']}개의 문서 추가 완료")
             else:
                 logger.info("ℹ️ 추가할 새 문서가 없습니다 (모두 중복).")
         except Exception as e:
@@ -151,7 +244,7 @@ class ChromaDBWrapper:
                 os.makedirs(self.persist_directory, exist_ok=True)
                 logger.info(f"✅ {self.persist_directory} 디렉토리 초기화 완료. DB 재연결 필요.")
                 # DB 객체를 재초기화
-                self.__init__(self.persist_directory, self.model_name)
+                self.__init__(self.persist_directory, self.model_name, backend=self.backend)
 
             else:
                 logger.info("ℹ️ 삭제할 데이터가 없습니다 (디렉토리 없음).")
@@ -0,0 +1,150 @@
+#-------------------------------------------------------------------------------------------------#
+# [ 파일 개요 ]
+# 긴 원본 문서를 SBERT 최대 입력 길이 안에 들어가는 문장 단위 청크로 나누고,
+# 검색 시 같은 원본의 인접 청크를 다시 하나의 구절로 합치는 유틸리티입니다.
+
+# [ 청크 분할 (split_into_chunks) ]
+# 1. SENTENCE_SPLIT_PATTERN(문장부호 . ? ! 뒤 공백, filter_by_keywords와 동일)으로 문장 경계를 찾음.
+#    "1." 같은 번호 표시만 있는 조각은 다음 문장에 붙입니다.
+#    한국어 문장은 대부분 "~다." "~요?" 형태로 끝나므로 문장부호 기준 분할로 충분합니다.
+# 2. 문장을 chunk_size(문자 수)까지 이어 붙여 청크를 만들고, 다음 청크는 직전 청크의 끝 문장들(최대 chunk_overlap 문자)로 시작.
+# 3. chunk_size보다 긴 문장은 공백 위치에서 강제로 나눔.
+# 4. 각 청크는 원문 text[start:end]와 정확히 같으므로 메타데이터의 chunk_start/chunk_end로 위치를 복원할 수 있습니다.
+
+# [ 인접 청크 병합 (merge_adjacent_chunks) ]
+# 검색 결과 중 같은 원본(source, file_name)에서 나온 연속된 청크(chunk_index가 1씩 증가)를
+# 겹치는 부분을 제거하고 하나의 Document로 합칩니다. 병합 결과는 구성 청크 중 가장 높은 순위 위치에 놓입니다.
+#-------------------------------------------------------------------------------------------------#
+
+import re
+from typing import List, Tuple
+
+from langchain_core.documents import Document
+
+# 문장 분리 정규식 (문장부호 뒤 공백 기준)
+SENTENCE_SPLIT_PATTERN = re.compile(r"(?<=[.?!])\s+")
+# 문장으로 보지 않는 번호 표시 (예: "1.", "(2)", "3)")
+LIST_MARKER_PATTERN = re.compile(r"\(?\d{1,3}[.)]")
+
+DEFAULT_CHUNK_SIZE = 250 # KR-SBERT max_seq_length(128 토큰)에 대략 들어가는 한국어 문자 수
+DEFAULT_CHUNK_OVERLAP = 50
+
+
+def sentence_spans(text: str) -> List[Tuple[int, int]]:
+    """문장별 (시작, 끝) 위치 목록을 반환합니다. text[start:end]가 한 문장입니다."""
+    spans, start = [], 0
+    for match in SENTENCE_SPLIT_PATTERN.finditer(text):
+        if match.start() > start:
+            spans.append((start, match.start()))
+        start = match.end()
+    if start < len(text):
+        spans.append((start, len(text)))
+
+    # "1." 같은 번호 표시만 있는 조각은 다음 문장과 합침
+    merged = []
+    for span in spans:
+        if merged and LIST_MARKER_PATTERN.fullmatch(text[merged[-1][0]:merged[-1][1]]):
+            merged[-1] = (merged[-1][0], span[1])
+        else:
+            merged.append(span)
+    return merged
+
+
+def _split_long_span(text: str, start: int, end: int, chunk_size: int) -> List[Tuple[int, int]]:
+    """chunk_size보다 긴 문장을 공백 위치(없으면 chunk_size 위치)에서 나눕니다."""
+    pieces = []
+    while end - start > chunk_size:
+        cut = text.rfind(" ", start + 1, start + chunk_size + 1)
+        if cut <= start:
+            cut = start + chunk_size
+        pieces.append((start, cut))
+        start = cut
+        while start < end and text[start] == " ":
+            start += 1
+    if start < end:
+        pieces.append((start, end))
+    return pieces
+
+
+def chunk_spans(text: str, chunk_size: int = DEFAULT_CHUNK_SIZE, chunk_overlap: int = DEFAULT_CHUNK_OVERLAP) -> List[Tuple[int, int]]:
+    """text를 문장 단위 청크의 (시작, 끝) 위치 목록으로 나눕니다."""
+    if chunk_overlap >= chunk_size:
+        raise ValueError("chunk_overlap must be smaller than chunk_size")
+
+    sentences = []
+    for start, end in sentence_spans(text):
+        sentences.extend(_split_long_span(text, start, end, chunk_size))
+
+    chunks, current = [], []
+    for sentence in sentences:
+        if current and sentence[1] - current[0][0] > chunk_size:
+            chunks.append((current[0][0], current[-1][1]))
+            # 직전 청크의 끝 문장들 중 chunk_overlap 이내만 다음 청크로 넘김
+            overlap = []
+            for prev in reversed(current):
+                if current[-1][1] - prev[0] > chunk_overlap or sentence[1] - prev[0] > chunk_size:
+                    break
+                overlap.insert(0, prev)
+            current = overlap
+        current.append(sentence)
+    if current:
+        chunks.append((current[0][0], current[-1][1]))
+    return chunks
+
+
+def split_into_chunks(document: Document, chunk_size: int = DEFAULT_CHUNK_SIZE, chunk_overlap: int = DEFAULT_CHUNK_OVERLAP) -> List[Document]:
+    """Document를 청크 Document 목록으로 나눕니다. 원본 메타데이터에 청크 위치 정보가 추가됩니다."""
+    text = document.page_content
+    spans = chunk_spans(text, chunk_size, chunk_overlap)
+    return [
+        Document(
+            page_content=text[start:end],
+            metadata={
+                **document.metadata,
+                "chunk_index": index,
+                "chunk_count": len(spans),
+                "chunk_start": start,
+                "chunk_end": end,
+            },
+        )
+        for index, (start, end) in enumerate(spans)
+    ]
+
+
+def _parent_key(document: Document):
+    return document.metadata.get("source"), document.metadata.get("file_name")
+
+
+def merge_adjacent_chunks(docs: List[Document]) -> List[Document]:
+    """검색 결과에서 같은 원본의 연속된 청크를 하나로 합칩니다. 청크가 아닌 문서는 그대로 둡니다."""
+    groups = {}
+    for rank, doc in enumerate(docs):
+        if "chunk_index" not in doc.metadata:
+            groups[("doc", rank)] = [(rank, doc)]
+        else:
+            groups.setdefault(_parent_key(doc), []).append((rank, doc))
+
+    merged = []
+    for members in groups.values():
+        members.sort(key=lambda item: item[1].metadata.get("chunk_index", 0))
+        best_rank, current = members[0]
+        for rank, doc in members[1:]:
+            prev_meta, meta = current.metadata, doc.metadata
+            if meta["chunk_index"] == prev_meta["chunk_index"]:
+                best_rank = min(best_rank, rank)
+                continue
+            if meta["chunk_index"] != prev_meta["chunk_index"] + 1:
+                merged.append((best_rank, current))
+                best_rank, current = rank, doc
+                continue
+            overlap = prev_meta.get("chunk_end", 0) - meta.get("chunk_start", 0)
+            tail = doc.page_content[overlap:] if overlap > 0 else " " + doc.page_content
+            current = Document(
+                page_content=current.page_content + tail,
+                metadata={**prev_meta, "chunk_index": meta["chunk_index"], "chunk_end": meta.get("chunk_end")},
+            )
+            best_rank = min(best_rank, rank)
+        merged.append((best_rank, current))
+
+    merged.sort(key=lambda item: item[0])
+    return [doc for _, doc in merged]
@@ -0,0 +1,130 @@
+#-------------------------------------------------------------------------------------------------#
+# [ 파일 개요 ]
+# RAG 임베딩 모델(KR-SBERT)을 실행하는 백엔드를 선택할 수 있도록 하는 임베딩 팩토리입니다.
+# ChatBot, 임베딩 사이드카, ChromaDBWrapper가 모두 create_embeddings()로 같은 백엔드를 사용합니다.
+
+# [ 백엔드 ]
+# 1. torch (기본값): langchain HuggingFaceEmbeddings (sentence-transformers + PyTorch, CPU).
+# 2. onnx: export_onnx_embedder.py로 내보낸 ONNX 모델을 onnxruntime으로 실행 (OnnxSentenceEmbeddings).
+#    - 토크나이저는 내보낸 디렉토리의 tokenizer.json을 tokenizers 라이브러리로 한 번만 로드 (허브 접근 없음).
+#    - quantized=True이면 동적 int8 양자화 모델(model.int8.onnx)을 사용.
+#    - 풀링(mean/cls)과 max_seq_length는 내보낼 때 저장한 embedder_config.json을 따르므로 torch 벡터와 호환됩니다.
+
+# [ 환경 변수 ]
+# EMBEDDING_BACKEND (torch|onnx), EMBEDDING_ONNX_DIR, EMBEDDING_ONNX_QUANTIZED (true|false)
+#-------------------------------------------------------------------------------------------------#
+
+import json
+import logging
+import os
+from typing import List, Optional
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MODEL_NAME = "snunlp/KR-SBERT-V40K-klueNLI-augSTS"
+VECTOR_DB_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def default_onnx_dir(model_name: str = DEFAULT_MODEL_NAME) -> str:
+    return os.path.join(VECTOR_DB_DIR, "onnx", model_name.replace("/", "__"))
+
+
+class OnnxSentenceEmbeddings(Embeddings):
+    """onnxruntime으로 실행하는 sentence-transformers 호환 임베딩 (langchain Embeddings 인터페이스)."""
+
+    def __init__(
+        self,
+        model_dir: str,
+        quantized: bool = False,
+        batch_size: int = 32,
+        normalize: bool = True,
+        intra_op_threads: Optional[int] = None,
+    ):
+        import onnxruntime as ort
+        from tokenizers import Tokenizer
+
+        with open(os.path.join(model_dir, "embedder_config.json"), "r", encoding="utf-8") as f:
+            config = json.load(f)
+        self.model_dir = model_dir
+        self.max_seq_length = config["max_seq_length"]
+        self.pooling = config.get("pooling", "mean")
+        self.batch_size = batch_size
+        self.normalize = normalize
+
+        self.tokenizer = Tokenizer.from_file(os.path.join(model_dir, "tokenizer.json"))
+        self.tokenizer.enable_truncation(max_length=self.max_seq_length)
+        self.tokenizer.enable_padding(pad_id=config.get("pad_token_id", 0), pad_token=config.get("pad_token", "[PAD]"))
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        if intra_op_threads:
+            options.intra_op_num_threads = intra_op_threads
+        model_file = "model.int8.onnx" if quantized else "model.onnx"
+        self.session = ort.InferenceSession(
+            os.path.join(model_dir, model_file), options, providers=["CPUExecutionProvider"]
+        )
+        self._input_names = {i.name for i in self.session.get_inputs()}
+        logger.info(f"Loaded ONNX embedder from {model_dir} ({model_file}, pooling: {self.pooling})")
+
+    def _encode_batch(self, texts: List[str]) -> np.ndarray:
+        encodings = self.tokenizer.encode_batch(texts)
+        input_ids = np.array([e.ids for e in encodings], dtype=np.int64)
+        attention_mask = np.array([e.attention_mask for e in encodings], dtype=np.int64)
+        feeds = {"input_ids": input_ids, "attention_mask": attention_mask}
+        if "token_type_ids" in self._input_names:
+            feeds["token_type_ids"] = np.array([e.type_ids for e in encodings], dtype=np.int64)
+
+        hidden = self.session.run(None, feeds)[0] # (batch, seq, dim)
+        if self.pooling == "cls":
+            pooled = hidden[:, 0]
+        else:
+            mask = attention_mask[..., None].astype(hidden.dtype)
+            pooled = (hidden * mask).sum(axis=1) / np.clip(mask.sum(axis=1), 1e-9, None)
+        if self.normalize:
+            pooled = pooled / np.clip(np.linalg.norm(pooled, axis=1, keepdims=True), 1e-12, None)
+        return pooled.astype(np.float32)
+
+    def encode(self, texts: List[str]) -> np.ndarray:
+        if not texts:
+            return np.zeros((0, 0), dtype=np.float32)
+        return np.concatenate(
+            [self._encode_batch(texts[i:i + self.batch_size]) for i in range(0, len(texts), self.batch_size)]
+        )
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return self.encode(list(texts)).tolist()
+
+    def embed_query(self, text: str) -> List[float]:
+        return self.encode([text])[0].tolist()
+
+
+def create_embeddings(
+    model_name: str = DEFAULT_MODEL_NAME,
+    backend: Optional[str] = None,
+    onnx_dir: Optional[str] = None,
+    quantized: Optional[bool] = None,
+) -> Embeddings:
+    """
+    설정된 백엔드로 임베딩 객체를 생성합니다. 인자를 생략하면 환경 변수를 따릅니다.
+    Args:
+        model_name: HuggingFace 모델 이름 (torch 백엔드 및 기본 ONNX 디렉토리 계산에 사용).
+        backend: "torch" 또는 "onnx".
+        onnx_dir: ONNX 모델 디렉토리 (기본값: vector_db/onnx/<모델 이름>).
+        quantized: ONNX int8 양자화 모델 사용 여부.
+    """
+    backend = (backend or os.getenv("EMBEDDING_BACKEND", "torch")).lower()
+    if backend == "onnx":
+        onnx_dir = onnx_dir or os.getenv("EMBEDDING_ONNX_DIR") or default_onnx_dir(model_name)
+        if quantized is None:
+            quantized = os.getenv("EMBEDDING_ONNX_QUANTIZED", "false").lower() in ("1", "true", "yes")
+        return OnnxSentenceEmbeddings(onnx_dir, quantized=quantized)
+
+    from langchain_huggingface import HuggingFaceEmbeddings
+    return HuggingFaceEmbeddings(
+        model_name=model_name,
+        model_kwargs={'device': 'cpu'}, # CPU 사용 명시, GPU 사용 시 'cuda'
+        encode_kwargs={'normalize_embeddings': True} # 임베딩 정규화
+    )
@@ -0,0 +1,94 @@
+#-------------------------------------------------------------------------------------------------#
+# [ 스크립트 개요 ]
+# sentence-transformers 임베딩 모델(KR-SBERT)의 트랜스포머 부분을 ONNX로 내보내고,
+# 선택적으로 동적 int8 양자화 모델을 함께 생성합니다. 결과물은 embedders.OnnxSentenceEmbeddings가 사용합니다.
+
+# [ 출력 디렉토리 구성 ]
+# - model.onnx          : FP32 모델 (입력: input_ids, attention_mask[, token_type_ids] / 출력: last_hidden_state)
+# - model.int8.onnx     : 동적 int8 양자화 모델 (--quantize 지정 시)
+# - tokenizer.json      : fast tokenizer 파일
+# - embedder_config.json: max_seq_length, 풀링 방식, 패딩 토큰 정보
+
+# [ 사용법 ] (local_system 디렉토리에서 실행)
+#   python -m vector_db.export_onnx_embedder [--model snunlp/KR-SBERT-V40K-klueNLI-augSTS] [--output DIR] [--quantize]
+#-------------------------------------------------------------------------------------------------#
+
+import argparse
+import json
+import logging
+import os
+
+import torch
+
+from .embedders import DEFAULT_MODEL_NAME, default_onnx_dir
+
+logger = logging.getLogger(__name__)
+
+
+def export(model_name: str, output_dir: str, quantize: bool, opset: int = 17):
+    from sentence_transformers import SentenceTransformer
+
+    os.makedirs(output_dir, exist_ok=True)
+    st_model = SentenceTransformer(model_name, device="cpu")
+    transformer = st_model[0]
+    auto_model = transformer.auto_model.eval()
+    tokenizer = transformer.tokenizer
+
+    pooling = "mean"
+    if len(st_model) > 1 and hasattr(st_model[1], "get_pooling_mode_str"):
+        pooling = "cls" if st_model[1].get_pooling_mode_str() == "cls" else "mean"
+
+    sample = tokenizer(["샘플 문장입니다."], return_tensors="pt")
+    input_names = [name for name in ("input_ids", "attention_mask", "token_type_ids") if name in sample]
+    dynamic_axes = {name: {0: "batch", 1: "sequence"} for name in input_names}
+    dynamic_axes["last_hidden_state"] = {0: "batch", 1: "sequence"}
+
+    class _Wrapper(torch.nn.Module):
+        def __init__(self, model):
+            super().__init__()
+            self.model = model
+
+        def forward(self, *inputs):
+            return self.model(**dict(zip(input_names, inputs))).last_hidden_state
+
+    model_path = os.path.join(output_dir, "model.onnx")
+    logger.info(f"Exporting {model_name} to {model_path}")
+    with torch.no_grad():
+        torch.onnx.export(
+            _Wrapper(auto_model),
+            tuple(sample[name] for name in input_names),
+            model_path,
+            input_names=input_names,
+            output_names=["last_hidden_state"],
+            dynamic_axes=dynamic_axes,
+            opset_version=opset,
+        )
+
+    tokenizer.backend_tokenizer.save(os.path.join(output_dir, "tokenizer.json"))
+    with open(os.path.join(output_dir, "embedder_config.json"), "w", encoding="utf-8") as f:
+        json.dump({
+            "model_name": model_name,
+            "max_seq_length": st_model.max_seq_length,
+            "pooling": pooling,
+            "pad_token": tokenizer.pad_token,
+            "pad_token_id": tokenizer.pad_token_id,
+        }, f, ensure_ascii=False, indent=2)
+
+    if quantize:
+        from onnxruntime.quantization import QuantType, quantize_dynamic
+
+        quantized_path = os.path.join(output_dir, "model.int8.onnx")
+        logger.info(f"Quantizing to {quantized_path} (dynamic int8)")
+        quantize_dynamic(model_path, quantized_path, weight_type=QuantType.QInt8)
+
+    logger.info(f"ONNX embedder exported to {output_dir}")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    parser = argparse.ArgumentParser(description="Export the SBERT embedder to ONNX (optionally int8-quantized).")
+    parser.add_argument("--model", default=DEFAULT_MODEL_NAME)
+    parser.add_argument("--output", help="출력 디렉토리 (기본값: vector_db/onnx/<모델 이름>)")
+    parser.add_argument("--quantize", action="store_true", help="동적 int8 양자화 모델도 생성")
+    args = parser.parse_args()
+    export(args.model, args.output or default_onnx_dir(args.model), args.quantize)
@@ -1,27 +1,43 @@
+import argparse
 import os
 import json
 # import fitz # PDF 처리 라이브러리 이제 필요 없음
 import re
 from langchain_core.documents import Document # langchain.schema 대신 langchain_core.documents 사용
 from .chromadb_wrapper import ChromaDBWrapper # chromadb_wrapper는 그대로 사용
+from .ingestion import file_fingerprint, ingest_documents, iter_json_array
+from .snapshots import SnapshotStore
+from .flat_index import FLAT_INDEX_DIRNAME, existing_flat_index_dtype, export_from_chroma
+from .bm25_index import BM25_INDEX_FILENAME, BM25Index
+from .chunking import DEFAULT_CHUNK_OVERLAP, DEFAULT_CHUNK_SIZE, split_into_chunks
+from .summarization import DEFAULT_SUMMARY_MAX_CHARS, SUMMARY_KEYWORDS, extractive_summary, keyword_sentences
 import logging
 
 # 로거 설정
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO) # INFO 레벨 이상의 로그를 출력
 
+# 중단된 적재를 재개하기 위한 체크포인트 파일 (ChromaDB 디렉토리 안에 저장, 완료 시 삭제)
+INGEST_CHECKPOINT_FILE = "ingest_checkpoint.json"
+
 class JsonDataProcessor: # 클래스 이름을 좀 더 명확하게 변경
     def __init__(
         self,
         json_data_path: str, # 입력 JSON 파일의 전체 경로
         chroma_dir: str = "./chroma_db_filtered", # ChromaDB 저장 디렉토리
+        chunk_size: int = DEFAULT_CHUNK_SIZE, # 청크 최대 문자 수 (0이면 청크로 나누지 않음)
+        chunk_overlap: int = DEFAULT_CHUNK_OVERLAP, # 인접 청크 간 겹치는 최대 문자 수
+        summary_max_chars: int = 0, # 문서별 추출 요약 최대 문자 수 (0이면 요약하지 않음)
         # output_json_path: str = "filtered_data_output.json" # 필터링된 결과를 저장할 경로 (선택적)
     ):
         self.json_data_path = json_data_path
         # self.output_json_path = output_json_path # 이 예제에서는 필터링 후 별도 저장 안 함
         self.db = ChromaDBWrapper(persist_directory=chroma_dir) # ChromaDBWrapper 사용
         self.data_for_chroma = [] # ChromaDB에 저장할 Document 객체 리스트
-        self.keywords = ["안전", "보안", "위험", "준수", "조치"] # 키워드 필터링은 유지 (선택 사항)
+        self.keywords = list(SUMMARY_KEYWORDS) # 키워드 필터링은 유지 (추출 요약의 후보 문장 선정에 사용)
+        self.chunk_size = chunk_size
+        self.chunk_overlap = chunk_overlap
+        self.summary_max_chars = summary_max_chars
 
     def clean_text(self, text: str) -> str:
         # 줄바꿈과 연속 공백 정리
@@ -31,12 +47,7 @@ class JsonDataProcessor: # 클래스 이름을 좀 더 명확하게 변경
     def filter_by_keywords(self, text: str) -> str:
         # 문장 단위로 나누어 키워드 포함 문장만 추출 (기존 로직 유지)
         # 더 정교한 필터링이 필요하면 이 부분을 수정하거나, 키워드 리스트를 확장/변경
-        sentences = re.split(r"(?<=[.?!])\s+", text) # 문장 분리
-        filtered_sentences = [
-            sentence
-            for sentence in sentences
-            if any(keyword in sentence for keyword in self.keywords)
-        ]
+        filtered_sentences = keyword_sentences(text, self.keywords) # 문장 분리는 chunking과 같은 기준
         # 필터링된 문장이 없으면 원본 텍스트의 일부라도 반환하거나, 빈 문자열 반환 결정 필요
         # 여기서는 필터링된 문장이 있으면 합치고, 없으면 원본 텍스트의 앞 500자 정도를 사용 (예시)
         if filtered_sentences:
@@ -47,52 +58,64 @@ class JsonDataProcessor: # 클래스 이름을 좀 더 명확하게 변경
         return "" # 키워드 필터링 결과가 없으면 빈 문자열 반환 (저장 안 함)
 
 
+    def _item_to_document(self, item) -> Document | None:
+        if not isinstance(item, dict) or "file_name" not in item or "text" not in item:
+            logger.warning(f"JSON 항목 형식이 올바르지 않아 건너뜁니다: {item}")
+            return None
+
+        file_name = item["file_name"]
+        raw_text = item["text"]
+        if not raw_text:
+            logger.warning(f"'text' 필드가 비어있는 항목: {file_name}")
+            return None
+
+        # cleaned_text = self.clean_text(raw_text) # JSON 텍스트는 이미 어느 정도 정제되었을 수 있음 (필요시 사용)
+        # filtered_text = self.filter_by_keywords(cleaned_text) # 키워드 기반 필터링 적용
+
+        # 데모용 모의 데이터는 이미 잘 정제되었고 특정 목적을 가지므로,
+        # 키워드 필터링을 생략하고 모든 텍스트를 사용하는 것을 고려해볼 수 있습니다.
+        # 만약 키워드 필터링을 원치 않으면 다음 라인을 사용:
+        processed_text = self.clean_text(raw_text) # 간단한 클리닝만 적용
+        # 또는 키워드 필터링을 계속 사용하려면:
+        # processed_text = self.filter_by_keywords(self.clean_text(raw_text))
+
+        if not processed_text:
+            logger.info(f"내용이 없거나 필터링되어 제외된 항목: {file_name}")
+            return None
+
+        # 출처는 파일 이름만 저장 (실행 환경마다 절대 경로가 달라 문서 ID/해시가 바뀌지 않도록)
+        metadata = {"file_name": file_name, "source": os.path.basename(self.json_data_path)}
+        if self.summary_max_chars:
+            # 원본 문서 전체 기준의 추출 요약 (청크로 나눠도 모든 청크에 같은 요약이 복사됨)
+            summary = extractive_summary(processed_text, self.keywords, self.summary_max_chars)
+            if summary:
+                metadata["summary"] = summary
+
+        # Langchain Document 객체로 변환
+        return Document(page_content=processed_text, metadata=metadata)
+
+    def iter_documents(self):
+        """입력 JSON을 항목 단위로 스트리밍하며 (항목 번호, 청크 Document)를 반환합니다."""
+        for index, item in enumerate(iter_json_array(self.json_data_path)):
+            document = self._item_to_document(item)
+            if document is None:
+                continue
+            if not self.chunk_size:
+                yield index, document
+                continue
+            for chunk in split_into_chunks(document, self.chunk_size, self.chunk_overlap):
+                yield index, chunk
+
     def process_json_file(self):
         logger.info(f"'{self.json_data_path}' 파일 처리 시작...")
         try:
-            with open(self.json_data_path, "r", encoding="utf-8") as f:
-                loaded_json_data = json.load(f)
-            
-            if not isinstance(loaded_json_data, list):
-                logger.error(f"'{self.json_data_path}' 파일은 리스트 형태의 JSON이어야 합니다.")
-                return
-
-            for item in loaded_json_data:
-                if not isinstance(item, dict) or "file_name" not in item or "text" not in item:
-                    logger.warning(f"JSON 항목 형식이 올바르지 않아 건너<0xEB><0x8F><0xED><0x9E><0x88>니다: {item}")
-                    continue
-
-                file_name = item["file_name"]
-                raw_text = item["text"]
-
-                if raw_text:
-                    # cleaned_text = self.clean_text(raw_text) # JSON 텍스트는 이미 어느 정도 정제되었을 수 있음 (필요시 사용)
-                    # filtered_text = self.filter_by_keywords(cleaned_text) # 키워드 기반 필터링 적용
-                    
-                    # 데모용 모의 데이터는 이미 잘 정제되었고 특정 목적을 가지므로,
-                    # 키워드 필터링을 생략하고 모든 텍스트를 사용하는 것을 고려해볼 수 있습니다.
-                    # 만약 키워드 필터링을 원치 않으면 다음 라인을 사용:
-                    processed_text = self.clean_text(raw_text) # 간단한 클리닝만 적용
-                    # 또는 키워드 필터링을 계속 사용하려면:
-                    # processed_text = self.filter_by_keywords(self.clean_text(raw_text))
-
-                    if processed_text:
-                        # Langchain Document 객체로 변환
-                        document = Document(
-                            page_content=processed_text,
-                            metadata={"file_name": file_name, "source": self.json_data_path} # 메타데이터에 출처 추가
-                        )
-                        self.data_for_chroma.append(document)
-                        logger.info(f"문서 처리 완료 (ChromaDB 추가 예정): {file_name}")
-                    else:
-                        logger.info(f"내용이 없거나 필터링되어 제외된 항목: {file_name}")
-                else:
-                    logger.warning(f"'text' 필드가 비어있는 항목: {file_name}")
-
+            for _, document in self.iter_documents():
+                self.data_for_chroma.append(document)
+                logger.debug(f"문서 처리 완료 (ChromaDB 추가 예정): {document.metadata['file_name']} #{document.metadata.get('chunk_index', 0)}")
         except FileNotFoundError:
             logger.error(f"🚫 JSON 데이터 파일 '{self.json_data_path}'를 찾을 수 없습니다.")
-        except json.JSONDecodeError:
-            logger.error(f"🚫 JSON 데이터 파일 '{self.json_data_path}' 파싱 오류.")
+        except (json.JSONDecodeError, ValueError) as e:
+            logger.error(f"🚫 JSON 데이터 파일 '{self.json_data_path}' 파싱 오류: {e}")
         except Exception as e:
             logger.exception(f"JSON 데이터 처리 중 예기치 않은 오류 발생: {e}")
 
@@ -111,24 +134,56 @@ class JsonDataProcessor: # 클래스 이름을 좀 더 명확하게 변경
             logger.warning("ChromaDB에 저장할 데이터가 없습니다.")
             return
         
-        logger.info(f"{len(self.data_for_chroma)}개의 문서를 ChromaDB에 추가합니다...")
+        logger.info(f"{len(self.data_for_chroma)}개의 문서를 ChromaDB와 동기화합니다...")
         try:
-            self.db.add_documents(self.data_for_chroma) # ChromaDBWrapper의 add_documents 호출
-            logger.info(f"💾 Chroma DB 저장 완료. 총 {len(self.data_for_chroma)}개 문서 추가됨. 위치: {self.db.persist_directory}")
+            # 변경된 문서만 임베딩하고, 입력에서 사라진 문서는 삭제 (증분 동기화)
+            stats = self.db.sync_documents(self.data_for_chroma)
+            logger.info(
+                f"💾 Chroma DB 저장 완료. 임베딩 {stats['added'] + stats['updated']}개, "
+                f"유지 {stats['unchanged']}개, 삭제 {stats['deleted']}개. 위치: {self.db.persist_directory}"
+            )
         except Exception as e:
             logger.exception(f"ChromaDB에 문서 저장 중 오류 발생: {e}")
 
 
-    def run(self):
-        logger.info("JsonDataProcessor 실행 시작...")
-        self.process_json_file() # JSON 파일 처리
+    def ingest(self, batch_size: int = 64, workers: int = 0, resume: bool = True) -> dict:
+        """
+        입력 JSON을 스트리밍으로 읽어 배치 단위로 (프로세스 풀에서) 임베딩하고 Chroma에 증분 적재합니다.
+        resume=True이면 ChromaDB 디렉토리의 체크포인트로 중단된 적재를 이어서 진행합니다.
+        """
+        checkpoint_path = os.path.join(self.db.persist_directory, INGEST_CHECKPOINT_FILE) if resume else None
+        return ingest_documents(
+            self.db,
+            self.iter_documents(),
+            batch_size=batch_size,
+            workers=workers,
+            checkpoint_path=checkpoint_path,
+            fingerprint=file_fingerprint(self.json_data_path),
+        )
+
+    def build_lexical_index(self) -> int:
+        """적재된 전체 문서(청크)로 BM25 인덱스를 만들어 ChromaDB 디렉토리에 저장하고 문서 수를 반환합니다."""
+        data = self.db.get(include=["documents", "metadatas"])
+        documents = [
+            Document(page_content=text or "", metadata=metadata or {})
+            for text, metadata in zip(data.get("documents") or [], data.get("metadatas") or [])
+        ]
+        BM25Index.build(documents).save(os.path.join(self.db.persist_directory, BM25_INDEX_FILENAME))
+        logger.info(f"BM25 인덱스 저장 완료: 문서 {len(documents)}개")
+        return len(documents)
 
-        if self.data_for_chroma:
-            # self.save_filtered_json() # 필터링된 결과를 별도 JSON으로 저장할 필요 없다면 주석 처리
-            self.save_to_chroma() # ChromaDB에 저장
-        else:
-            logger.info("처리된 데이터가 없어 ChromaDB에 저장하지 않았습니다.")
+    def run(self, batch_size: int = 64, workers: int = 0, resume: bool = True) -> dict | None:
+        """적재를 실행하고 통계를 반환합니다. 입력 오류로 실패하면 None을 반환합니다."""
+        logger.info("JsonDataProcessor 실행 시작...")
+        stats = None
+        try:
+            stats = self.ingest(batch_size=batch_size, workers=workers, resume=resume)
+        except FileNotFoundError:
+            logger.error(f"🚫 JSON 데이터 파일 '{self.json_data_path}'를 찾을 수 없습니다.")
+        except (json.JSONDecodeError, ValueError) as e:
+            logger.error(f"🚫 JSON 데이터 파일 '{self.json_data_path}' 파싱 오류: {e}")
         logger.info("JsonDataProcessor 실행 완료.")
+        return stats
 
 
 # 실행 예시
@@ -147,28 +202,79 @@ if __name__ == "__main__":
     json_input_file_path = os.path.join(local_system_root_dir, "gen_rand_events", "filtered_data.json")
 
     # ChromaDB 저장 디렉토리 설정 (vector_db 폴더 내에 생성)
-    chroma_database_dir = os.path.join(vector_db_dir, "chroma_db_from_json") # 새 이름으로 변경 (기존 DB와 구분)
-    
-    # --- 중요: 이전 ChromaDB 디렉토리 삭제 ---
-    # 임베딩 모델이나 데이터 소스가 변경될 때는 이전 DB를 삭제하는 것이 좋습니다.
-    # 여기서는 chroma_database_dir을 사용하므로, 만약 이전에 이 이름으로 DB가 있었다면 삭제.
-    if os.path.exists(chroma_database_dir):
-        import shutil
-        logger.info(f"기존 ChromaDB 디렉토리 '{chroma_database_dir}'를 삭제합니다.")
-        try:
-            shutil.rmtree(chroma_database_dir)
-        except Exception as e:
-            logger.error(f"디렉토리 삭제 중 오류 발생 '{chroma_database_dir}': {e}. 수동으로 삭제 후 다시 시도해주세요.")
-            exit() # 심각한 오류 시 종료
-    os.makedirs(chroma_database_dir, exist_ok=True) # 삭제 후 다시 생성 (빈 디렉토리)
-    # --- 중요: 이전 ChromaDB 디렉토리 삭제 끝 ---
+    chroma_database_dir = os.path.join(vector_db_dir, "chroma_db_from_json") # --in-place 모드에서 사용하는 고정 디렉토리
+    snapshot_root_dir = os.getenv("VECTOR_DB_SNAPSHOT_DIR", os.path.join(vector_db_dir, "chroma_snapshots"))
+
+    # 기본 동작: 현재 스냅샷을 복사한 새 스냅샷에 증분 적재 → CURRENT 원자적 교체 → 오래된 스냅샷 정리.
+    # 실행 중인 서버는 적재 중에도 기존 스냅샷으로 계속 검색하며, 게시 후 감시자/관리자 엔드포인트로 새 스냅샷을 엽니다.
+    # 임베딩 모델이 변경된 경우에는 --rebuild로 빈 스냅샷에서 전체를 다시 임베딩해야 합니다.
+    parser = argparse.ArgumentParser(description="Sync filtered_data.json into the Chroma vector DB.")
+    parser.add_argument("--rebuild", action="store_true", help="기존 내용을 복사하지 않고 전체 재구축")
+    parser.add_argument("--in-place", action="store_true", help="스냅샷 대신 chroma_db_from_json 디렉토리에 직접 적재")
+    parser.add_argument("--keep", type=int, default=int(os.getenv("VECTOR_DB_SNAPSHOT_KEEP", "3")), help="보관할 최근 스냅샷 수")
+    parser.add_argument("--batch-size", type=int, default=64, help="임베딩/쓰기 배치 크기")
+    parser.add_argument("--workers", type=int, default=0, help="임베딩 프로세스 수 (0이면 현재 프로세스에서 임베딩)")
+    parser.add_argument("--no-resume", action="store_true", help="체크포인트를 무시하고 처음부터 적재")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="청크 최대 문자 수 (0이면 청크 분할 안 함)")
+    parser.add_argument(
+        "--flat-index", choices=["none", "float16", "int8"], default="none",
+        help="적재 후 memory-mapped flat index(VECTOR_STORE_BACKEND=flat용)도 생성 (none이어도 기존 flat index가 있으면 같은 dtype으로 다시 생성)",
+    )
+    parser.add_argument("--chunk-overlap", type=int, default=DEFAULT_CHUNK_OVERLAP, help="인접 청크 간 겹치는 최대 문자 수")
+    parser.add_argument(
+        "--summary-max-chars", type=int, default=0, nargs="?", const=DEFAULT_SUMMARY_MAX_CHARS,
+        help=f"문서별 추출 요약을 메타데이터에 저장 (값 생략 시 {DEFAULT_SUMMARY_MAX_CHARS}자, 0이면 요약 안 함)",
+    )
+    args = parser.parse_args()
+
+    snapshot_store = None
+    if args.in_place:
+        if args.rebuild and os.path.exists(chroma_database_dir):
+            import shutil
+            logger.info(f"기존 ChromaDB 디렉토리 '{chroma_database_dir}'를 삭제합니다.")
+            try:
+                shutil.rmtree(chroma_database_dir)
+            except Exception as e:
+                logger.error(f"디렉토리 삭제 중 오류 발생 '{chroma_database_dir}': {e}. 수동으로 삭제 후 다시 시도해주세요.")
+                exit() # 심각한 오류 시 종료
+        os.makedirs(chroma_database_dir, exist_ok=True)
+    else:
+        snapshot_store = SnapshotStore(snapshot_root_dir)
+        # 중단된 빌드(체크포인트가 남은 미게시 스냅샷)가 있으면 이어서 진행
+        resumable = None if (args.rebuild or args.no_resume) else snapshot_store.latest_unpublished(INGEST_CHECKPOINT_FILE)
+        chroma_database_dir = resumable or snapshot_store.new_snapshot(seed=not args.rebuild)
 
 
     logger.info(f"입력 JSON 파일 경로: {json_input_file_path}")
     logger.info(f"ChromaDB 저장 경로: {chroma_database_dir}")
 
+    # 시드 스냅샷(또는 --in-place 디렉토리)에서 넘어온 flat index는 새로 적재한 Chroma 데이터와 맞지 않으므로
+    # 같은 dtype으로 다시 생성하고, manifest를 읽을 수 없으면 삭제 (오래된 데이터로 검색되지 않도록)
+    flat_index_dtype = args.flat_index
+    if flat_index_dtype == "none":
+        flat_index_dtype = existing_flat_index_dtype(chroma_database_dir) or "none"
+        stale_flat_index_dir = os.path.join(chroma_database_dir, FLAT_INDEX_DIRNAME)
+        if flat_index_dtype != "none":
+            logger.info(f"기존 flat index({flat_index_dtype})를 새 데이터로 다시 생성합니다.")
+        elif os.path.isdir(stale_flat_index_dir):
+            import shutil
+            logger.info(f"읽을 수 없는 기존 flat index '{stale_flat_index_dir}'를 삭제합니다.")
+            shutil.rmtree(stale_flat_index_dir)
+
     processor = JsonDataProcessor(
         json_data_path=json_input_file_path,
-        chroma_dir=chroma_database_dir
+        chroma_dir=chroma_database_dir,
+        chunk_size=args.chunk_size,
+        chunk_overlap=args.chunk_overlap,
+        summary_max_chars=args.summary_max_chars,
     )
-    processor.run()
\ No newline at end of file
+    stats = processor.run(batch_size=args.batch_size, workers=args.workers, resume=not args.no_resume)
+
+    if stats is not None:
+        processor.build_lexical_index()
+    if stats is not None and flat_index_dtype != "none":
+        export_from_chroma(chroma_database_dir, dtype=flat_index_dtype)
+
+    if snapshot_store and stats is not None:
+        snapshot_store.publish(chroma_database_dir)
+        snapshot_store.gc(keep=args.keep)
@@ -0,0 +1,212 @@
+#-------------------------------------------------------------------------------------------------#
+# [ 파일 개요 ]
+# 수천 건 규모의 참고 문서를 위한 경량 검색 백엔드입니다. Chroma(sqlite + HNSW) 대신
+# 정규화된 임베딩을 memory-mapped .npy로 저장하고, 쿼리마다 행렬-벡터 곱 한 번으로 정확한 top-k를 계산합니다.
+# 파일은 읽기 전용 mmap으로 열기 때문에 시작이 빠르고, 여러 워커 프로세스가 같은 페이지 캐시를 공유합니다.
+
+# [ 디렉토리 구성 ]
+# - manifest.json : dtype(float16|int8), dim, count, model_name
+# - vectors.npy   : (count, dim) 정규화된 임베딩 (float16 또는 int8)
+# - scales.npy    : int8일 때 벡터별 역양자화 스케일 (float32)
+# - documents.jsonl / offsets.npy : 문서별 {"id", "page_content", "metadata"} 한 줄과 바이트 오프셋 (top-k 문서만 읽음)
+
+# [ 사용법 ] (local_system 디렉토리에서 실행, 기존 Chroma DB의 임베딩을 그대로 변환)
+#   python -m vector_db.flat_index --chroma vector_db/chroma_db_from_json [--output DIR] [--dtype float16|int8]
+#   --output 생략 시 <chroma 디렉토리>/flat_index 에 생성하며, VECTOR_STORE_BACKEND=flat이면 ChatBot이 이 디렉토리를 사용합니다.
+#-------------------------------------------------------------------------------------------------#
+
+import argparse
+import asyncio
+import json
+import logging
+import mmap
+import os
+import shutil
+import uuid
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+
+logger = logging.getLogger(__name__)
+
+FLAT_INDEX_DIRNAME = "flat_index"
+SUPPORTED_DTYPES = ("float16", "int8")
+SEARCH_BLOCK_ROWS = 8192 # 블록 단위로 float32 변환하여 쿼리당 임시 메모리 제한
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    return vectors / np.clip(np.linalg.norm(vectors, axis=-1, keepdims=True), 1e-12, None)
+
+
+def build_flat_index(
+    output_dir: str,
+    ids: Sequence[str],
+    documents: Sequence[Document],
+    embeddings: np.ndarray,
+    dtype: str = "float16",
+    model_name: Optional[str] = None,
+):
+    """
+    임베딩과 문서로 flat index를 만듭니다. 임시 디렉토리에 쓴 뒤 교체하므로 읽는 쪽은 완성된 인덱스만 봅니다.
+    embeddings는 np.memmap이어도 되며, SEARCH_BLOCK_ROWS 단위로 정규화/양자화하여 전체를 메모리에 올리지 않습니다.
+    """
+    if dtype not in SUPPORTED_DTYPES:
+        raise ValueError(f"dtype must be one of {SUPPORTED_DTYPES}")
+    if len(embeddings) != len(documents) or len(ids) != len(documents):
+        raise ValueError("ids, documents and embeddings must have the same length")
+    count = len(embeddings)
+    dim = int(np.shape(embeddings)[1]) if count else 0
+
+    tmp_dir = f"{output_dir.rstrip(os.sep)}.{uuid.uuid4().hex[:8]}.tmp"
+    os.makedirs(tmp_dir)
+    vectors_out = np.lib.format.open_memmap(
+        os.path.join(tmp_dir, "vectors.npy"), mode="w+", dtype=np.int8 if dtype == "int8" else np.float16, shape=(count, dim)
+    )
+    scales_out = (
+        np.lib.format.open_memmap(os.path.join(tmp_dir, "scales.npy"), mode="w+", dtype=np.float32, shape=(count,))
+        if dtype == "int8" else None
+    )
+    for start in range(0, count, SEARCH_BLOCK_ROWS):
+        block = _normalize(np.asarray(embeddings[start:start + SEARCH_BLOCK_ROWS], dtype=np.float32))
+        end = start + len(block)
+        if scales_out is not None:
+            scales = np.clip(np.abs(block).max(axis=1), 1e-12, None) / 127.0
+            vectors_out[start:end] = np.round(block / scales[:, None]).astype(np.int8)
+            scales_out[start:end] = scales
+        else:
+            vectors_out[start:end] = block.astype(np.float16)
+    vectors_out.flush()
+    del vectors_out
+    if scales_out is not None:
+        scales_out.flush()
+        del scales_out
+
+    offsets = []
+    with open(os.path.join(tmp_dir, "documents.jsonl"), "wb") as f:
+        for doc_id, document in zip(ids, documents):
+            offsets.append(f.tell())
+            record = {"id": doc_id, "page_content": document.page_content, "metadata": document.metadata or {}}
+            f.write(json.dumps(record, ensure_ascii=False).encode("utf-8") + b"\n")
+        offsets.append(f.tell())
+    np.save(os.path.join(tmp_dir, "offsets.npy"), np.asarray(offsets, dtype=np.uint64))
+
+    with open(os.path.join(tmp_dir, "manifest.json"), "w", encoding="utf-8") as f:
+        json.dump({
+            "dtype": dtype,
+            "dim": dim,
+            "count": count,
+            "model_name": model_name,
+        }, f, indent=2)
+
+    if os.path.exists(output_dir):
+        shutil.rmtree(output_dir)
+    os.replace(tmp_dir, output_dir)
+    logger.info(f"Flat index written to {output_dir} ({count} vectors, {dtype})")
+
+
+def existing_flat_index_dtype(chroma_dir: str) -> Optional[str]:
+    """chroma_dir 안에 이미 있는 flat index의 dtype. 없거나 manifest를 읽을 수 없으면 None."""
+    try:
+        with open(os.path.join(chroma_dir, FLAT_INDEX_DIRNAME, "manifest.json"), "r", encoding="utf-8") as f:
+            dtype = json.load(f).get("dtype")
+    except (OSError, json.JSONDecodeError):
+        return None
+    return dtype if dtype in SUPPORTED_DTYPES else None
+
+
+def export_from_chroma(chroma_dir: str, output_dir: Optional[str] = None, dtype: str = "float16") -> str:
+    """Chroma DB에 저장된 임베딩/문서/메타데이터를 다시 임베딩하지 않고 flat index로 변환합니다."""
+    import chromadb
+
+    output_dir = output_dir or os.path.join(chroma_dir, FLAT_INDEX_DIRNAME)
+    client = chromadb.PersistentClient(path=chroma_dir)
+    collections = client.list_collections()
+    if not collections:
+        raise ValueError(f"No collection found in {chroma_dir}")
+    name = collections[0] if isinstance(collections[0], str) else collections[0].name
+    data = client.get_collection(name).get(include=["embeddings", "documents", "metadatas"])
+    documents = [
+        Document(page_content=text or "", metadata=metadata or {})
+        for text, metadata in zip(data["documents"], data["metadatas"])
+    ]
+    build_flat_index(output_dir, data["ids"], documents, np.asarray(data["embeddings"]), dtype=dtype)
+    return output_dir
+
+
+class FlatIndex:
+    """
+    memory-mapped 정확 검색 인덱스. langchain VectorStore의 검색 메서드(similarity_search 등)를 제공하므로
+    ChatBot에서 Chroma 대신 그대로 사용할 수 있습니다.
+    """
+
+    def __init__(self, index_dir: str, embedding_function: Optional[Embeddings] = None):
+        self.index_dir = index_dir
+        self.embedding_function = embedding_function
+        with open(os.path.join(index_dir, "manifest.json"), "r", encoding="utf-8") as f:
+            self.manifest = json.load(f)
+        self.count = int(self.manifest["count"])
+        self.vectors = np.load(os.path.join(index_dir, "vectors.npy"), mmap_mode="r")
+        scales_path = os.path.join(index_dir, "scales.npy")
+        self.scales = np.load(scales_path, mmap_mode="r") if os.path.exists(scales_path) else None
+        self.offsets = np.load(os.path.join(index_dir, "offsets.npy"), mmap_mode="r")
+        self._documents_file = open(os.path.join(index_dir, "documents.jsonl"), "rb")
+        self._documents = (
+            mmap.mmap(self._documents_file.fileno(), 0, access=mmap.ACCESS_READ)
+            if os.path.getsize(self._documents_file.name) else b""
+        )
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _scores(self, query: np.ndarray) -> np.ndarray:
+        scores = np.empty(self.count, dtype=np.float32)
+        for start in range(0, self.count, SEARCH_BLOCK_ROWS):
+            block = np.asarray(self.vectors[start:start + SEARCH_BLOCK_ROWS], dtype=np.float32)
+            scores[start:start + len(block)] = block @ query
+        if self.scales is not None:
+            scores *= self.scales
+        return scores
+
+    def _document(self, row: int) -> Document:
+        start, end = int(self.offsets[row]), int(self.offsets[row + 1])
+        record = json.loads(self._documents[start:end])
+        return Document(page_content=record["page_content"], metadata=record.get("metadata") or {})
+
+    def similarity_search_by_vector_with_score(self, embedding: Sequence[float], k: int = 5) -> List[Tuple[Document, float]]:
+        if self.count == 0:
+            return []
+        query = _normalize(np.asarray(embedding, dtype=np.float32))
+        scores = self._scores(query)
+        k = min(k, self.count)
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return [(self._document(int(row)), float(scores[row])) for row in top]
+
+    def similarity_search_by_vector(self, embedding: Sequence[float], k: int = 5, **kwargs) -> List[Document]:
+        return [doc for doc, _ in self.similarity_search_by_vector_with_score(embedding, k)]
+
+    def similarity_search_with_score(self, query: str, k: int = 5, **kwargs) -> List[Tuple[Document, float]]:
+        return self.similarity_search_by_vector_with_score(self.embedding_function.embed_query(query), k)
+
+    def similarity_search(self, query: str, k: int = 5, **kwargs) -> List[Document]:
+        return [doc for doc, _ in self.similarity_search_with_score(query, k)]
+
+    async def asimilarity_search(self, query: str, k: int = 5, **kwargs) -> List[Document]:
+        return await asyncio.to_thread(self.similarity_search, query, k)
+
+    def close(self):
+        if isinstance(self._documents, mmap.mmap):
+            self._documents.close()
+        self._documents_file.close()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    parser = argparse.ArgumentParser(description="Export a Chroma DB into a memory-mapped flat index.")
+    parser.add_argument("--chroma", required=True, help="변환할 Chroma persist 디렉토리")
+    parser.add_argument("--output", help="출력 디렉토리 (기본값: <chroma>/flat_index)")
+    parser.add_argument("--dtype", choices=SUPPORTED_DTYPES, default="float16")
+    args = parser.parse_args()
+    export_from_chroma(args.chroma, args.output, args.dtype)
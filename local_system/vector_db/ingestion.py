@@ -0,0 +1,243 @@
+#-------------------------------------------------------------------------------------------------#
+# [ 파일 개요 ]
+# 대용량 JSON 입력을 벡터 DB에 적재하는 스트리밍 ingestion 파이프라인입니다.
+
+# [ 주요 로직 흐름 ]
+# 1. iter_json_array: 최상위 리스트 JSON을 파일 전체를 메모리에 올리지 않고 항목 단위로 읽음.
+# 2. ingest_documents: (항목 번호, Document) 스트림을 batch_size 단위로 묶어 처리.
+#    - ChromaDBWrapper.prepare_documents로 ID/content_hash 계산 → DB에 같은 해시가 있으면 임베딩 생략 (증분 동기화).
+#    - 변경된 문서만 프로세스 풀(workers > 0)에서 임베딩. 진행 중인 배치 수는 workers * 2로 제한.
+#    - 결과는 제출 순서대로 Chroma에 upsert (배치 단위 청크 쓰기) 후 체크포인트 갱신.
+#    - 완료 후 입력에 없는 기존 문서 정리(prune), 체크포인트 삭제, docs/sec 보고.
+# 3. 체크포인트: {입력 파일 fingerprint, 완료된 항목 수}. 중단 후 다시 실행하면 완료된 항목은 임베딩/조회 없이 건너뜀.
+#    (upsert는 같은 ID에 대해 멱등이므로 마지막 항목이 일부만 기록된 상태에서 재개해도 안전합니다.)
+#-------------------------------------------------------------------------------------------------#
+
+import json
+import logging
+import multiprocessing
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Iterable, Iterator, Optional, Tuple
+
+from langchain_core.documents import Document
+
+from .chromadb_wrapper import ChromaDBWrapper
+from .embedders import create_embeddings
+
+logger = logging.getLogger(__name__)
+
+_worker_embeddings = None
+
+
+def iter_json_array(path: str, chunk_size: int = 1 << 16) -> Iterator:
+    """최상위가 리스트인 JSON 파일의 항목(객체)을 하나씩 읽어 반환합니다."""
+    decoder = json.JSONDecoder()
+    with open(path, "r", encoding="utf-8") as f:
+        buffer = ""
+        while not buffer:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+            buffer = chunk.lstrip() # 앞쪽 공백이 chunk_size보다 길 수 있음
+        if not buffer.startswith("["):
+            raise ValueError(f"'{path}' 파일은 리스트 형태의 JSON이어야 합니다.")
+        buffer = buffer[1:]
+        eof = False
+        while True:
+            buffer = buffer.lstrip()
+            if buffer.startswith(","):
+                buffer = buffer[1:].lstrip()
+            if buffer.startswith("]"):
+                return
+            try:
+                item, end = decoder.raw_decode(buffer)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                chunk = f.read(chunk_size)
+                eof = not chunk
+                buffer += chunk
+                continue
+            yield item
+            buffer = buffer[end:]
+
+
+def file_fingerprint(path: str) -> dict:
+    stat = os.stat(path)
+    return {"path": os.path.basename(path), "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def load_checkpoint(path: Optional[str], fingerprint: dict) -> int:
+    """입력 fingerprint가 같은 체크포인트가 있으면 완료된 항목 수를 반환합니다."""
+    if not path or not os.path.exists(path):
+        return 0
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            checkpoint = json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        logger.warning(f"체크포인트를 읽을 수 없어 처음부터 진행합니다: {e}")
+        return 0
+    if checkpoint.get("fingerprint") != fingerprint:
+        logger.info("입력 파일이 변경되어 체크포인트를 무시합니다.")
+        return 0
+    return int(checkpoint.get("items_done", 0))
+
+
+def save_checkpoint(path: Optional[str], fingerprint: dict, items_done: int):
+    if not path:
+        return
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump({"fingerprint": fingerprint, "items_done": items_done}, f)
+    os.replace(tmp_path, path)
+
+
+def _init_embedding_worker(model_name: str, backend: Optional[str], threads: int):
+    global _worker_embeddings
+    os.environ.setdefault("TOKENIZERS_PARALLELISM", "false")
+    try:
+        import torch
+        torch.set_num_threads(threads)
+    except ImportError:
+        pass
+    _worker_embeddings = create_embeddings(model_name=model_name, backend=backend)
+
+
+def _embed_texts(texts: list) -> list:
+    return _worker_embeddings.embed_documents(texts)
+
+
+class _ImmediateResult:
+    """workers=0일 때 현재 프로세스에서 계산한 결과를 Future처럼 다루기 위한 래퍼."""
+
+    def __init__(self, value):
+        self._value = value
+
+    def result(self):
+        return self._value
+
+
+def ingest_documents(
+    db: ChromaDBWrapper,
+    documents: Iterable[Tuple[int, Document]],
+    batch_size: int = 64,
+    workers: int = 0,
+    checkpoint_path: Optional[str] = None,
+    fingerprint: Optional[dict] = None,
+    prune: bool = True,
+) -> dict:
+    """
+    (항목 번호, Document) 스트림을 배치 단위로 임베딩하여 Chroma에 증분 적재합니다.
+    Args:
+        db: 대상 ChromaDBWrapper.
+        documents: 입력 항목 번호 오름차순의 (항목 번호, Document) 이터러블.
+        batch_size: 임베딩/쓰기 배치 크기.
+        workers: 임베딩 프로세스 수 (0이면 현재 프로세스에서 임베딩).
+        checkpoint_path / fingerprint: 재개용 체크포인트 파일과 입력 fingerprint (둘 다 있어야 사용).
+        prune: 완료 후 입력에 없는 같은 source의 기존 문서 삭제 여부.
+    Returns:
+        건수(added, updated, unchanged, resumed, deleted, embedded)와 elapsed_s, docs_per_s.
+    """
+    stats = {"added": 0, "updated": 0, "unchanged": 0, "resumed": 0, "deleted": 0, "embedded": 0}
+    if not fingerprint:
+        checkpoint_path = None
+    start_item = load_checkpoint(checkpoint_path, fingerprint)
+    if start_item:
+        logger.info(f"체크포인트에서 재개합니다: 항목 {start_item}개 완료됨")
+
+    pool = None
+    if workers > 0:
+        threads = max(1, (os.cpu_count() or 1) // workers)
+        pool = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_embedding_worker,
+            initargs=(db.model_name, db.backend, threads),
+        )
+
+    seen_ids, sources, file_names = set(), set(), set()
+    pending = deque()
+    started = time.perf_counter()
+    documents_seen = 0
+
+    def drain_one():
+        future, ids, docs, items_done = pending.popleft()
+        if docs:
+            vectors = future.result()
+            db.upsert_embedded(ids, docs, vectors)
+            stats["embedded"] += len(docs)
+        save_checkpoint(checkpoint_path, fingerprint, items_done)
+        elapsed = time.perf_counter() - started
+        logger.info(
+            f"진행: 문서 {documents_seen}개 확인, {stats['embedded']}개 임베딩 "
+            f"({stats['embedded'] / elapsed if elapsed else 0:.1f} docs/s)"
+        )
+
+    try:
+        iterator = iter(documents)
+        while True:
+            batch = list(islice(iterator, batch_size))
+            if not batch:
+                break
+            documents_seen += len(batch)
+            last_item = batch[-1][0]
+            prepared = db.prepare_documents([doc for _, doc in batch])
+            seen_ids.update(prepared)
+            for doc in prepared.values():
+                sources.add(doc.metadata.get("source"))
+                file_names.add(doc.metadata.get("file_name"))
+
+            # 체크포인트 이전 항목은 이미 기록되어 있으므로 조회/임베딩 생략
+            resumed = {db.document_id(doc) for item, doc in batch if item < start_item}
+            stats["resumed"] += len(resumed)
+            candidate_ids = [doc_id for doc_id in prepared if doc_id not in resumed]
+
+            existing = db.existing_metadatas(candidate_ids) if candidate_ids else {}
+            ids, docs = [], []
+            for doc_id in candidate_ids:
+                doc = prepared[doc_id]
+                if doc_id not in existing:
+                    stats["added"] += 1
+                elif existing[doc_id].get("content_hash") != doc.metadata["content_hash"]:
+                    stats["updated"] += 1
+                else:
+                    stats["unchanged"] += 1
+                    continue
+                ids.append(doc_id)
+                docs.append(doc)
+
+            texts = [doc.page_content for doc in docs]
+            if not docs:
+                future = None
+            elif pool:
+                future = pool.submit(_embed_texts, texts)
+            else:
+                future = _ImmediateResult(db.embeddings.embed_documents(texts))
+            # 마지막 항목은 다음 배치에 이어질 수 있으므로 그 이전 항목까지만 완료로 기록
+            pending.append((future, ids, docs, max(start_item, last_item)))
+            while len(pending) > max(1, workers * 2):
+                drain_one()
+
+        while pending:
+            drain_one()
+    finally:
+        if pool:
+            pool.shutdown(cancel_futures=True)
+
+    if prune and seen_ids:
+        stats["deleted"] = db.delete_stale(seen_ids, sources, file_names)
+    if checkpoint_path and os.path.exists(checkpoint_path):
+        os.remove(checkpoint_path)
+
+    stats["elapsed_s"] = time.perf_counter() - started
+    stats["docs_per_s"] = stats["embedded"] / stats["elapsed_s"] if stats["elapsed_s"] else 0.0
+    logger.info(
+        f"✅ ingestion 완료: 추가 {stats['added']}, 변경 {stats['updated']}, 유지 {stats['unchanged']}, "
+        f"재개로 건너뜀 {stats['resumed']}, 삭제 {stats['deleted']}, "
+        f"{stats['elapsed_s']:.1f}초 ({stats['docs_per_s']:.1f} docs/s)"
+    )
+    return stats
@@ -0,0 +1,383 @@
+#-------------------------------------------------------------------------------------------------#
+# [ 스크립트 개요 ]
+# 참고 문서 코퍼스가 커질 때(1k → 1M) 검색 백엔드별 적재 처리량, 인덱스 크기, 메모리, 검색 지연, recall이
+# 어떻게 변하는지 측정하는 벤치마크 하네스입니다. 결과는 JSON으로 저장하여 회귀를 비교할 수 있습니다.
+
+# [ 코퍼스 생성 ]
+# 1. filtered_data.json을 적재 파이프라인과 같은 방식으로 청크로 나눔 (기본 코퍼스, 수백 건).
+# 2. 기본 청크 임베딩: --embedding model이면 실제 임베딩 모델(create_embeddings), synthetic이면 결정적 난수 벡터.
+# 3. 목표 크기까지 복제: i번째 문서 = 기본 청크[i % B] 텍스트 + "(사본 n)", 벡터 = 기본 벡터 + 가우시안 노이즈(--doc-noise).
+#    벡터는 작업 디렉토리의 .npy memmap에 블록 단위로 기록하므로 1M 건도 메모리에 모두 올리지 않습니다.
+# 4. --chroma DIR을 주면 위 대신 기존 Chroma persist 디렉토리의 문서/임베딩을 그대로 코퍼스로 사용 (--sizes 무시).
+#    운영 중인 벡터 DB에서 Chroma HNSW와 FlatIndex(float16/int8)를 같은 조건으로 비교할 때 사용합니다.
+
+# [ 측정 항목 (크기 × 백엔드) ]
+# - ingest_s / ingest_docs_per_s: 미리 계산한 벡터로 인덱스를 만드는 시간 (임베딩 시간 제외, model 모드의 임베딩 처리량은 별도 기록)
+# - index_bytes: 인덱스 디렉토리의 디스크 크기
+# - open_ms, p50/p95/p99_ms, queries_per_s, rss_delta_mb: 별도 프로세스(spawn)에서 인덱스를 열고 쿼리 실행
+#   (백엔드끼리 RSS가 섞이지 않도록 분리, open_ms는 첫 쿼리까지 포함 - Chroma는 HNSW 세그먼트를 첫 쿼리에서 로드)
+# - recall_at_k: 저장된 float32 벡터 전체에 대한 정확한 코사인 top-k 대비 (bm25는 어휘 검색이므로 측정 안 함)
+# 백엔드: chroma (현재 운영 경로, HNSW), flat-float16, flat-int8 (flat_index.py), bm25 (bm25_index.py)
+
+# [ 사용법 ] (local_system 디렉토리에서 실행)
+#   python -m vector_db.retrieval_benchmark [--sizes 1000 10000 100000] [--backends chroma flat-float16 flat-int8 bm25]
+#          [--embedding synthetic|model] [--queries 200] [--k 5] [--output results.json] [--workdir DIR]
+#   python -m vector_db.retrieval_benchmark --chroma vector_db/chroma_db_from_json [--backends chroma flat-float16 flat-int8]
+#   1M 건은 --sizes 1000000으로 명시 (float32 벡터만 약 3GB 디스크 사용).
+#-------------------------------------------------------------------------------------------------#
+
+import argparse
+import json
+import logging
+import multiprocessing
+import os
+import platform
+import re
+import resource
+import shutil
+import subprocess
+import tempfile
+import time
+from datetime import datetime
+from typing import Dict, List
+
+import numpy as np
+from langchain_core.documents import Document
+
+from .chunking import DEFAULT_CHUNK_OVERLAP, DEFAULT_CHUNK_SIZE, split_into_chunks
+from .ingestion import iter_json_array
+
+logger = logging.getLogger(__name__)
+
+VECTOR_DB_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_CORPUS = os.path.join(os.path.dirname(VECTOR_DB_DIR), "gen_rand_events", "filtered_data.json")
+DEFAULT_RESULTS_DIR = os.path.join(VECTOR_DB_DIR, "benchmark_results")
+DEFAULT_CHROMA = os.path.join(VECTOR_DB_DIR, "chroma_db_from_json")
+ALL_BACKENDS = ("chroma", "flat-float16", "flat-int8", "bm25")
+BLOCK_ROWS = 8192
+
+
+def load_base_chunks(corpus_path: str) -> List[str]:
+    texts = []
+    for item in iter_json_array(corpus_path):
+        text = re.sub(r"\s+", " ", item.get("text") or "").strip()
+        if text:
+            texts.extend(c.page_content for c in split_into_chunks(Document(page_content=text), DEFAULT_CHUNK_SIZE, DEFAULT_CHUNK_OVERLAP))
+    return texts
+
+
+def embed_base(texts: List[str], mode: str, dim: int) -> (np.ndarray, Dict):
+    if mode == "model":
+        from .embedders import create_embeddings
+
+        embeddings = create_embeddings()
+        started = time.perf_counter()
+        vectors = np.asarray(embeddings.embed_documents(texts), dtype=np.float32)
+        elapsed = time.perf_counter() - started
+        return vectors, {"embed_docs_per_s": len(texts) / elapsed}
+    rng = np.random.default_rng(42)
+    vectors = rng.normal(size=(len(texts), dim)).astype(np.float32)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True), {}
+
+
+class SyntheticCorpus:
+    """기본 청크를 복제한 size건의 코퍼스. 문서는 필요할 때 생성하고, 벡터는 memmap 파일에 기록합니다."""
+
+    def __init__(self, base_texts: List[str], base_vectors: np.ndarray, size: int, noise: float, workdir: str):
+        self.base_texts = base_texts
+        self.size = size
+        self.vectors_path = os.path.join(workdir, "vectors_f32.npy")
+        self.vectors = np.lib.format.open_memmap(
+            self.vectors_path, mode="w+", dtype=np.float32, shape=(size, base_vectors.shape[1])
+        )
+        rng = np.random.default_rng(size)
+        base_count = len(base_texts)
+        for start in range(0, size, BLOCK_ROWS):
+            rows = np.arange(start, min(size, start + BLOCK_ROWS))
+            block = base_vectors[rows % base_count].copy()
+            copies = rows >= base_count
+            block[copies] += rng.normal(scale=noise, size=(int(copies.sum()), block.shape[1])).astype(np.float32)
+            self.vectors[start:start + len(rows)] = block / np.linalg.norm(block, axis=1, keepdims=True)
+        self.vectors.flush()
+
+    def __len__(self) -> int:
+        return self.size
+
+    def text(self, row: int) -> str:
+        base = self.base_texts[row % len(self.base_texts)]
+        copy = row // len(self.base_texts)
+        return base if copy == 0 else f"{base} (사본 {copy})"
+
+    def __getitem__(self, row: int) -> Document:
+        return Document(
+            page_content=self.text(row),
+            metadata={"file_name": f"synthetic_{row % len(self.base_texts)}", "row": row},
+        )
+
+    def __iter__(self):
+        return (self[row] for row in range(self.size))
+
+
+class ChromaCorpus:
+    """기존 Chroma persist 디렉토리의 문서와 임베딩을 그대로 사용하는 코퍼스 (--chroma)."""
+
+    def __init__(self, chroma_dir: str):
+        import chromadb
+
+        client = chromadb.PersistentClient(path=chroma_dir)
+        collections = client.list_collections()
+        if not collections:
+            raise ValueError(f"'{chroma_dir}'에 컬렉션이 없습니다.")
+        name = collections[0] if isinstance(collections[0], str) else collections[0].name
+        data = client.get_collection(name).get(include=["embeddings", "documents", "metadatas"])
+        self.texts = [text or "" for text in data["documents"]]
+        self.metadatas = [metadata or {} for metadata in data["metadatas"]]
+        vectors = np.asarray(data["embeddings"], dtype=np.float32)
+        self.vectors = vectors / np.clip(np.linalg.norm(vectors, axis=1, keepdims=True), 1e-12, None)
+        self.size = len(self.texts)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def text(self, row: int) -> str:
+        return self.texts[row]
+
+    def __getitem__(self, row: int) -> Document:
+        return Document(page_content=self.texts[row], metadata={**self.metadatas[row], "row": row})
+
+    def __iter__(self):
+        return (self[row] for row in range(self.size))
+
+
+def exact_top_k(vectors: np.ndarray, queries: np.ndarray, k: int) -> np.ndarray:
+    """float32 전체 벡터에 대한 정확한 top-k 행 번호 (블록 단위로 계산)."""
+    best_scores = np.full((len(queries), k), -np.inf, dtype=np.float32)
+    best_rows = np.zeros((len(queries), k), dtype=np.int64)
+    for start in range(0, len(vectors), BLOCK_ROWS):
+        block = np.asarray(vectors[start:start + BLOCK_ROWS])
+        scores = np.concatenate([best_scores, queries @ block.T], axis=1)
+        rows = np.concatenate([best_rows, np.broadcast_to(np.arange(start, start + len(block)), (len(queries), len(block)))], axis=1)
+        top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        best_scores = np.take_along_axis(scores, top, axis=1)
+        best_rows = np.take_along_axis(rows, top, axis=1)
+    return best_rows
+
+
+def directory_size(path: str) -> int:
+    total = 0
+    for root, _, files in os.walk(path):
+        total += sum(os.path.getsize(os.path.join(root, name)) for name in files)
+    return total
+
+
+def build_index(backend: str, corpus, location: str) -> float:
+    """백엔드별 인덱스를 만들고 소요 시간(초)을 반환합니다."""
+    started = time.perf_counter()
+    if backend == "chroma":
+        import chromadb
+
+        client = chromadb.PersistentClient(path=location)
+        collection = client.get_or_create_collection("benchmark")
+        batch_size = min(client.get_max_batch_size(), 5000)
+        for start in range(0, len(corpus), batch_size):
+            rows = range(start, min(len(corpus), start + batch_size))
+            collection.add(
+                ids=[str(row) for row in rows],
+                embeddings=np.asarray(corpus.vectors[start:rows.stop]),
+                documents=[corpus.text(row) for row in rows],
+                metadatas=[corpus[row].metadata for row in rows],
+            )
+    elif backend.startswith("flat-"):
+        from .flat_index import build_flat_index
+
+        build_flat_index(
+            location, [str(row) for row in range(len(corpus))], corpus, corpus.vectors, dtype=backend.split("-", 1)[1]
+        )
+    elif backend == "bm25":
+        from .bm25_index import BM25_INDEX_FILENAME, BM25Index
+
+        os.makedirs(location, exist_ok=True)
+        BM25Index.build(list(corpus)).save(os.path.join(location, BM25_INDEX_FILENAME))
+    else:
+        raise ValueError(f"Unknown backend: {backend}")
+    return time.perf_counter() - started
+
+
+def _rss_kb() -> int:
+    """현재 프로세스 RSS(KB). /proc이 없는 환경에서는 최대 RSS로 대신합니다."""
+    try:
+        with open("/proc/self/status", encoding="ascii") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def _run_queries(backend: str, location: str, query_vectors: np.ndarray, query_texts: List[str], k: int, queue):
+    baseline_rss = _rss_kb()
+    started = time.perf_counter()
+    if backend == "chroma":
+        import chromadb
+
+        collection = chromadb.PersistentClient(path=location).get_collection("benchmark")
+
+        def search(i):
+            result = collection.query(query_embeddings=[query_vectors[i].tolist()], n_results=k, include=[])
+            return [int(doc_id) for doc_id in result["ids"][0]]
+    elif backend.startswith("flat-"):
+        from .flat_index import FlatIndex
+
+        index = FlatIndex(location)
+
+        def search(i):
+            return [doc.metadata["row"] for doc in index.similarity_search_by_vector(query_vectors[i], k)]
+    else:
+        from .bm25_index import BM25Index
+
+        index = BM25Index.load_from_directory(location)
+
+        def search(i):
+            return [doc.metadata["row"] for doc in index.search(query_texts[i], k)]
+
+    results = [search(0)]
+    open_ms = (time.perf_counter() - started) * 1000
+    latencies = []
+    for i in range(1, len(query_vectors)):
+        t0 = time.perf_counter()
+        results.append(search(i))
+        latencies.append((time.perf_counter() - t0) * 1000)
+    latencies = np.asarray(latencies or [0.0])
+
+    queue.put({
+        "open_ms": open_ms,
+        "p50_ms": float(np.percentile(latencies, 50)),
+        "p95_ms": float(np.percentile(latencies, 95)),
+        "p99_ms": float(np.percentile(latencies, 99)),
+        "queries_per_s": 1000.0 / max(float(latencies.mean()), 1e-9),
+        "rss_delta_mb": (_rss_kb() - baseline_rss) / 1024,
+        "results": results,
+    })
+
+
+def environment_info() -> Dict:
+    info = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "numpy": np.__version__,
+    }
+    try:
+        import chromadb
+        info["chromadb"] = chromadb.__version__
+    except ImportError:
+        pass
+    try:
+        info["git_commit"] = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=VECTOR_DB_DIR, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        pass
+    return info
+
+
+def main():
+    logging.basicConfig(level=logging.INFO)
+    parser = argparse.ArgumentParser(description="Retrieval benchmark over scaled synthetic corpora.")
+    parser.add_argument("--corpus", default=DEFAULT_CORPUS)
+    parser.add_argument("--chroma", nargs="?", const=DEFAULT_CHROMA, help=f"기존 Chroma 디렉토리를 코퍼스로 사용 (값 생략 시 {DEFAULT_CHROMA})")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--backends", nargs="+", choices=ALL_BACKENDS, default=list(ALL_BACKENDS))
+    parser.add_argument("--embedding", choices=["synthetic", "model"], default="synthetic", help="기본 청크 임베딩 방식")
+    parser.add_argument("--dim", type=int, default=768, help="synthetic 임베딩 차원")
+    parser.add_argument("--doc-noise", type=float, default=0.15, help="복제 문서 벡터 노이즈 표준편차")
+    parser.add_argument("--query-noise", type=float, default=0.05, help="쿼리 벡터 노이즈 표준편차")
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--k", type=int, default=5)
+    parser.add_argument("--workdir", help="인덱스를 만들 작업 디렉토리 (기본값: 임시 디렉토리, 종료 시 삭제)")
+    parser.add_argument("--output", help=f"결과 JSON 경로 (기본값: {DEFAULT_RESULTS_DIR}/retrieval-<시각>.json)")
+    args = parser.parse_args()
+
+    if args.chroma:
+        source = ChromaCorpus(args.chroma)
+        base_corpus = {"chroma": os.path.abspath(args.chroma), "documents": len(source), "dim": int(source.vectors.shape[1])}
+        sizes = [len(source)]
+    else:
+        base_texts = load_base_chunks(args.corpus)
+        base_vectors, embed_stats = embed_base(base_texts, args.embedding, args.dim)
+        base_corpus = {"chunks": len(base_texts), "dim": int(base_vectors.shape[1]), **embed_stats}
+        sizes = args.sizes
+    logger.info(f"Base corpus: {base_corpus}")
+
+    tmp_dir = None if args.workdir else tempfile.TemporaryDirectory()
+    workdir = args.workdir or tmp_dir.name
+    ctx = multiprocessing.get_context("spawn")
+    rng = np.random.default_rng(0)
+    results = []
+
+    for size in sizes:
+        size_dir = os.path.join(workdir, f"n{size}")
+        shutil.rmtree(size_dir, ignore_errors=True)
+        os.makedirs(size_dir)
+        if args.chroma:
+            corpus = source
+        else:
+            corpus = SyntheticCorpus(base_texts, base_vectors, size, args.doc_noise, size_dir)
+
+        picks = rng.integers(0, size, size=args.queries)
+        query_vectors = corpus.vectors[picks] + rng.normal(scale=args.query_noise, size=(args.queries, corpus.vectors.shape[1])).astype(np.float32)
+        query_vectors /= np.linalg.norm(query_vectors, axis=1, keepdims=True)
+        query_texts = [corpus.text(int(row))[:80] for row in picks]
+        truth = exact_top_k(corpus.vectors, query_vectors, args.k)
+
+        for backend in args.backends:
+            location = os.path.join(size_dir, backend)
+            logger.info(f"[n={size}] building {backend}")
+            ingest_s = build_index(backend, corpus, location)
+
+            queue = ctx.Queue()
+            process = ctx.Process(target=_run_queries, args=(backend, location, query_vectors, query_texts, args.k, queue))
+            process.start()
+            measured = queue.get()
+            process.join()
+
+            found = measured.pop("results")
+            recall = None
+            if backend != "bm25":
+                recall = float(np.mean([len(set(truth[i]) & set(rows)) / args.k for i, rows in enumerate(found)]))
+            record = {
+                "size": size,
+                "backend": backend,
+                "ingest_s": ingest_s,
+                "ingest_docs_per_s": size / ingest_s if ingest_s else None,
+                "index_bytes": directory_size(location),
+                **measured,
+                "recall_at_k": recall,
+            }
+            results.append(record)
+            logger.info(
+                f"[n={size}] {backend}: ingest {record['ingest_docs_per_s']:.0f} docs/s, "
+                f"{record['index_bytes'] / 1e6:.1f} MB, p50 {record['p50_ms']:.2f} / p99 {record['p99_ms']:.2f} ms, "
+                f"RSS +{record['rss_delta_mb']:.0f} MB, recall@{args.k} {recall if recall is not None else '-'}"
+            )
+            shutil.rmtree(location, ignore_errors=True)
+        shutil.rmtree(size_dir, ignore_errors=True)
+
+    output = args.output or os.path.join(DEFAULT_RESULTS_DIR, f"retrieval-{datetime.now().strftime('%Y%m%dT%H%M%S')}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump({
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "environment": environment_info(),
+            "config": {k: v for k, v in vars(args).items() if k not in ("output", "workdir")},
+            "base_corpus": base_corpus,
+            "results": results,
+        }, f, ensure_ascii=False, indent=2)
+    logger.info(f"Results written to {output}")
+    if tmp_dir:
+        tmp_dir.cleanup()
+
+
+if __name__ == "__main__":
+    main()
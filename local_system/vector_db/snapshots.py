@@ -0,0 +1,128 @@
+#-------------------------------------------------------------------------------------------------#
+# [ 파일 개요 ]
+# 벡터 DB를 버전별 스냅샷 디렉토리로 관리하여, 서비스 중단 없이 재구축/교체할 수 있도록 하는 SnapshotStore입니다.
+
+# [ 디렉토리 구조 ]
+# <root>/
+#   snapshot-20250101T120000-ab12cd/   (Chroma persist 디렉토리, 한 번 게시되면 수정하지 않음)
+#   snapshot-20250102T090000-ef34aa/
+#   CURRENT                            (현재 게시된 스냅샷 디렉토리 이름, 한 줄)
+
+# [ 주요 로직 흐름 ]
+# 1. new_snapshot(): 새 스냅샷 디렉토리 생성. seed=True이면 현재 스냅샷을 복사해 증분 적재의 시작점으로 사용.
+# 2. 적재가 끝나면 publish(): CURRENT를 임시 파일에 쓴 뒤 os.replace로 교체 (원자적 전환).
+#    실행 중인 서버는 CURRENT 변경을 감지(감시자) 하거나 관리자 엔드포인트 호출 시 새 스냅샷을 다시 엽니다.
+# 3. gc(keep): 현재 스냅샷과 최근 keep개를 제외한 오래된 스냅샷 삭제.
+#    (직전 스냅샷은 아직 요청을 처리 중인 프로세스가 열고 있을 수 있으므로 keep은 2 이상 권장)
+#-------------------------------------------------------------------------------------------------#
+
+import logging
+import os
+import shutil
+import uuid
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+CURRENT_POINTER = "CURRENT"
+SNAPSHOT_PREFIX = "snapshot-"
+
+
+class SnapshotStore:
+    def __init__(self, root: str):
+        self.root = root
+
+    @property
+    def pointer_path(self) -> str:
+        return os.path.join(self.root, CURRENT_POINTER)
+
+    def list_snapshots(self) -> List[str]:
+        """스냅샷 디렉토리 경로를 생성 순서(이름 순)로 반환합니다."""
+        if not os.path.isdir(self.root):
+            return []
+        names = sorted(
+            name for name in os.listdir(self.root)
+            if name.startswith(SNAPSHOT_PREFIX) and os.path.isdir(os.path.join(self.root, name))
+        )
+        return [os.path.join(self.root, name) for name in names]
+
+    def current(self) -> Optional[str]:
+        """현재 게시된 스냅샷 경로. 게시된 스냅샷이 없거나 디렉토리가 사라졌으면 None."""
+        try:
+            with open(self.pointer_path, "r", encoding="utf-8") as f:
+                name = f.read().strip()
+        except OSError:
+            return None
+        path = os.path.join(self.root, name)
+        return path if name and os.path.isdir(path) else None
+
+    def resolve(self, fallback: str) -> str:
+        """현재 스냅샷 경로, 없으면 fallback(스냅샷 도입 전의 고정 디렉토리)."""
+        return self.current() or fallback
+
+    def pointer_fingerprint(self) -> Optional[Tuple[int, str]]:
+        """CURRENT 파일의 (수정 시각, 내용). 새 스냅샷이 게시되면 값이 바뀝니다."""
+        try:
+            stat = os.stat(self.pointer_path)
+            with open(self.pointer_path, "r", encoding="utf-8") as f:
+                return stat.st_mtime_ns, f.read().strip()
+        except OSError:
+            return None
+
+    def new_snapshot(self, seed: bool = True) -> str:
+        """새 스냅샷 디렉토리를 만들고 경로를 반환합니다. seed=True이면 현재 스냅샷 내용을 복사합니다."""
+        os.makedirs(self.root, exist_ok=True)
+        name = f"{SNAPSHOT_PREFIX}{datetime.now().strftime('%Y%m%dT%H%M%S')}-{uuid.uuid4().hex[:6]}"
+        path = os.path.join(self.root, name)
+        current = self.current() if seed else None
+        if current:
+            logger.info(f"Seeding new snapshot {name} from {os.path.basename(current)}")
+            shutil.copytree(current, path)
+        else:
+            os.makedirs(path)
+        return path
+
+    def latest_unpublished(self, marker: str) -> Optional[str]:
+        """현재 스냅샷보다 나중에 만들어졌고 marker 파일(예: 적재 체크포인트)이 남아 있는 스냅샷 (중단된 빌드 재개용)."""
+        current = self.current()
+        for path in reversed(self.list_snapshots()):
+            if current and os.path.basename(path) <= os.path.basename(current):
+                return None
+            if os.path.exists(os.path.join(path, marker)):
+                return path
+        return None
+
+    def publish(self, path: str):
+        """path를 현재 스냅샷으로 원자적으로 전환합니다."""
+        name = os.path.basename(os.path.normpath(path))
+        if os.path.dirname(os.path.abspath(path)) != os.path.abspath(self.root):
+            raise ValueError(f"Snapshot {path} is not inside {self.root}")
+        tmp_path = f"{self.pointer_path}.{uuid.uuid4().hex}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(name + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.pointer_path)
+        logger.info(f"Published vector store snapshot: {name}")
+
+    def gc(self, keep: int = 3) -> List[str]:
+        """
+        현재 스냅샷과 그 이전 스냅샷 중 최근 keep개(현재 포함)를 제외하고 삭제한 뒤 삭제한 경로를 반환합니다.
+        현재 스냅샷보다 나중에 만들어진 스냅샷(적재 중이거나 중단된 빌드)은 삭제하지 않습니다.
+        """
+        current = self.current()
+        if current is None:
+            return []
+        snapshots = self.list_snapshots()
+        history = [path for path in snapshots if os.path.basename(path) <= os.path.basename(current)]
+        retained = set(history[-keep:]) if keep > 0 else set()
+        removed = []
+        for path in history:
+            if path in retained or path == current:
+                continue
+            shutil.rmtree(path, ignore_errors=True)
+            removed.append(path)
+        if removed:
+            logger.info(f"Removed {len(removed)} old vector store snapshot(s)")
+        return removed
@@ -0,0 +1,79 @@
+#-------------------------------------------------------------------------------------------------#
+# [ 파일 개요 ]
+# 적재 시 원본 문서마다 프롬프트용 짧은 추출 요약(원문 문장 일부)을 미리 만드는 유틸리티입니다.
+# 요약은 청크 메타데이터("summary")에 저장되어, RAG 컨텍스트에 기본으로 원문 대신 들어갑니다 (요청 시점 비용 없음).
+
+# [ 요약 방식 (extractive_summary) ]
+# 1. 문장 분리: chunking.sentence_spans (청크 분할과 같은 문장 경계).
+# 2. 후보 문장: keyword_sentences (안전/보안/위험/준수/조치 등 키워드 포함 문장, filter_by_keywords와 같은 기준).
+#    키워드 문장이 없으면 전체 문장이 후보.
+# 3. 문장 점수: 문서 전체에서 자주 나오는 토큰(bm25_index.tokenize: 한글 bigram, 설비 코드)을 많이 포함할수록 높음(중심성)
+#    + 키워드 수 + 설비 코드/수치 포함 여부 + 첫 문장 가산점.
+# 4. 점수 순으로 max_chars까지 고른 뒤 원문 순서대로 이어 붙임. 원문이 max_chars 이하이면 요약하지 않음(None).
+#-------------------------------------------------------------------------------------------------#
+
+from collections import Counter
+from typing import List, Optional, Sequence
+
+from .bm25_index import tokenize
+from .chunking import sentence_spans
+
+SUMMARY_KEYWORDS = ("안전", "보안", "위험", "준수", "조치")
+DEFAULT_SUMMARY_MAX_CHARS = 300
+
+KEYWORD_WEIGHT = 0.3
+CODE_WEIGHT = 0.3
+LEAD_WEIGHT = 0.2
+
+
+def keyword_sentences(text: str, keywords: Sequence[str] = SUMMARY_KEYWORDS) -> List[str]:
+    """키워드를 하나 이상 포함한 문장 목록."""
+    sentences = [text[start:end] for start, end in sentence_spans(text)]
+    return [sentence for sentence in sentences if any(keyword in sentence for keyword in keywords)]
+
+
+def _has_code(tokens: List[str]) -> bool:
+    return any(token[0].isascii() and any(ch.isdigit() for ch in token) for token in tokens)
+
+
+def extractive_summary(
+    text: str, keywords: Sequence[str] = SUMMARY_KEYWORDS, max_chars: int = DEFAULT_SUMMARY_MAX_CHARS
+) -> Optional[str]:
+    """text에서 중요한 문장을 골라 max_chars 이하의 요약을 만듭니다. 요약할 필요가 없으면 None."""
+    if len(text) <= max_chars:
+        return None
+    spans = sentence_spans(text)
+    sentences = [text[start:end] for start, end in spans]
+    candidates = [i for i, sentence in enumerate(sentences) if any(keyword in sentence for keyword in keywords)]
+    if not candidates:
+        candidates = list(range(len(sentences)))
+
+    sentence_tokens = [tokenize(sentence) for sentence in sentences]
+    frequency = Counter(token for tokens in sentence_tokens for token in tokens)
+    top_frequency = max(frequency.values(), default=1)
+
+    def score(i: int) -> float:
+        tokens = sentence_tokens[i]
+        if not tokens:
+            return 0.0
+        centrality = sum(frequency[token] for token in set(tokens)) / (top_frequency * len(set(tokens)))
+        keyword_hits = sum(keyword in sentences[i] for keyword in keywords)
+        return (
+            centrality
+            + KEYWORD_WEIGHT * keyword_hits
+            + CODE_WEIGHT * _has_code(tokens)
+            + LEAD_WEIGHT * (i == 0)
+        )
+
+    selected, used = [], 0
+    for i in sorted(candidates, key=score, reverse=True):
+        length = len(sentences[i]) + (1 if selected else 0)
+        if used + length > max_chars:
+            continue
+        selected.append(i)
+        used += length
+    if not selected:
+        # 가장 높은 점수의 문장도 max_chars보다 길면 앞부분만 사용
+        best = max(candidates, key=score)
+        return sentences[best][:max_chars].rstrip()
+    return " ".join(sentences[i] for i in sorted(selected))
@@ -0,0 +1,66 @@
+#-------------------------------------------------------------------------------------------------#
+# [ 파일 개요 ]
+# 검색 백엔드 팩토리입니다. ChatBot과 임베딩 사이드카는 open_vector_store()로 같은 백엔드를 엽니다.
+# - chroma (기본값): langchain Chroma (sqlite + HNSW)
+# - flat: <persist_directory>/flat_index 의 memory-mapped FlatIndex (flat_index.py로 생성)
+# 환경 변수: VECTOR_STORE_BACKEND (chroma|flat)
+# 스냅샷 교체로 더 이상 쓰지 않는 저장소는 close_vector_store()로 닫음 (FlatIndex의 mmap/파일 핸들 해제).
+# store_marker_path()는 백엔드별로 재구축 시 다시 쓰이는 파일 경로 (검색 결과 캐시의 변경 감지용).
+#-------------------------------------------------------------------------------------------------#
+
+import logging
+import os
+import threading
+from typing import Any, Optional
+
+from langchain_core.embeddings import Embeddings
+
+from .flat_index import FLAT_INDEX_DIRNAME, FlatIndex
+
+logger = logging.getLogger(__name__)
+
+# 교체 직전에 시작된 검색이 이전 저장소로 끝날 수 있도록 닫기 전에 기다리는 시간
+RETIRED_STORE_CLOSE_DELAY_SECONDS = 60.0
+
+
+def open_vector_store(persist_directory: str, embedding_function: Embeddings, backend: Optional[str] = None) -> Any:
+    backend = (backend or os.getenv("VECTOR_STORE_BACKEND", "chroma")).lower()
+    if backend == "flat":
+        return FlatIndex(os.path.join(persist_directory, FLAT_INDEX_DIRNAME), embedding_function)
+
+    from langchain_chroma import Chroma
+    return Chroma(persist_directory=persist_directory, embedding_function=embedding_function)
+
+
+def store_marker_path(persist_directory: str, backend: Optional[str] = None) -> str:
+    """저장소를 다시 만들면 수정 시각/크기가 바뀌는 파일 (chroma: chroma.sqlite3, flat: flat_index/manifest.json)."""
+    backend = (backend or os.getenv("VECTOR_STORE_BACKEND", "chroma")).lower()
+    if backend == "flat":
+        return os.path.join(persist_directory, FLAT_INDEX_DIRNAME, "manifest.json")
+    return os.path.join(persist_directory, "chroma.sqlite3")
+
+
+def count_documents(store: Any) -> int:
+    if isinstance(store, FlatIndex):
+        return len(store)
+    return store._collection.count()
+
+
+def close_vector_store(store: Any, delay: float = RETIRED_STORE_CLOSE_DELAY_SECONDS):
+    """교체된 저장소에 close()가 있으면 delay초 뒤(0 이하면 즉시) 백그라운드에서 닫습니다."""
+    close = getattr(store, "close", None)
+    if not callable(close):
+        return
+
+    def _close():
+        try:
+            close()
+        except Exception as e:
+            logger.warning(f"Failed to close retired vector store: {e}")
+
+    if delay <= 0:
+        _close()
+        return
+    timer = threading.Timer(delay, _close)
+    timer.daemon = True
+    timer.start()